@@ -0,0 +1,98 @@
+"""Bounded aggregation of repeated resources in finding details.
+
+Checks that report "every X that violates Y" would otherwise copy the whole
+workspace inventory into a single finding. The helpers here keep finding details
+bounded: a total count, a deterministic top-N sample, and an order-independent
+content hash of the full set, with an optional JSONL sidecar holding everything.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import json
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from databricks_auditor.config import AuditorConfig
+
+logger = logging.getLogger(__name__)
+
+_HASH_MODULUS = 2**256
+
+
+def _canonical(item: Any) -> str:
+    """Serialize an item deterministically (sorted keys, compact separators)."""
+    return json.dumps(item, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def summarize_resources(
+    field: str,
+    items: Iterable[Any],
+    *,
+    check_name: str,
+    config: AuditorConfig,
+) -> dict[str, Any]:
+    """Reduce an iterable of resources to bounded finding details.
+
+    Items are consumed in a single streaming pass. The returned dict contains:
+
+    - ``field``: up to ``config.details_sample_size`` items, ordered by their
+      canonical JSON so the sample is stable across API orderings
+    - ``{field}_total``: number of items seen
+    - ``{field}_sha256``: order-independent hash of the full set (sum of per-item
+      SHA-256 digests modulo 2**256), so two reports can be compared cheaply
+    - ``{field}_truncated``: present and ``True`` when the sample is partial
+    - ``{field}_sidecar``: path of the JSONL file with every item, when
+      ``config.details_spill_dir`` is set and there is at least one item
+    """
+    total = 0
+    digest_sum = 0
+    sidecar_path = None
+    sidecar = None
+
+    def _walk():
+        nonlocal total, digest_sum, sidecar_path, sidecar
+        for item in items:
+            encoded = _canonical(item)
+            total += 1
+            digest = hashlib.sha256(encoded.encode("utf-8")).digest()
+            digest_sum = (digest_sum + int.from_bytes(digest, "big")) % _HASH_MODULUS
+            if config.details_spill_dir:
+                # Opened on the first item so empty sets leave no sidecar behind.
+                if sidecar is None:
+                    spill_dir = Path(config.details_spill_dir)
+                    spill_dir.mkdir(parents=True, exist_ok=True)
+                    sidecar_path = spill_dir / f"{check_name}.{field}.jsonl"
+                    sidecar = open(sidecar_path, "w", encoding="utf-8")
+                sidecar.write(encoded + "\n")
+            yield encoded, item
+
+    try:
+        sample = [
+            item
+            for _, item in heapq.nsmallest(
+                max(config.details_sample_size, 0), _walk(), key=lambda pair: pair[0]
+            )
+        ]
+        # nsmallest(0, ...) short-circuits without iterating; drain for counts/hash.
+        if config.details_sample_size <= 0:
+            for _ in _walk():
+                pass
+    finally:
+        if sidecar is not None:
+            sidecar.close()
+
+    details: dict[str, Any] = {
+        field: sample,
+        f"{field}_total": total,
+        f"{field}_sha256": f"{digest_sum:064x}",
+    }
+    if total > len(sample):
+        details[f"{field}_truncated"] = True
+    if sidecar_path is not None:
+        details[f"{field}_sidecar"] = str(sidecar_path)
+        logger.info(f"Wrote {total} {field} for {check_name} to {sidecar_path}")
+    return details
@@ -2,6 +2,7 @@
 
 from databricks_auditor.checks.cluster_policies import check_cluster_policies
 from databricks_auditor.checks.clusters import check_clusters
+from databricks_auditor.checks.delta_tables import check_delta_table_health
 from databricks_auditor.checks.secrets import check_secret_scopes
 from databricks_auditor.checks.tags_cost_controls import check_tags_cost_controls
 from databricks_auditor.checks.workspace_settings import check_workspace_settings
@@ -9,6 +10,7 @@ from databricks_auditor.checks.workspace_settings import check_workspace_setting
 __all__ = [
     "check_cluster_policies",
     "check_clusters",
+    "check_delta_table_health",
     "check_secret_scopes",
     "check_tags_cost_controls",
     "check_workspace_settings",
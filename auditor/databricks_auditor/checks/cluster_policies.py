@@ -3,6 +3,7 @@
 import json
 import logging
 
+from databricks_auditor.aggregation import summarize_resources
 from databricks_auditor.client import DatabricksClient
 from databricks_auditor.report import Finding, Severity
 
@@ -30,7 +31,12 @@ def check_cluster_policies(client: DatabricksClient) -> list[Finding]:
                     check_name="cluster_policy_exists",
                     severity=Severity.FAIL,
                     message="Guardrails cluster policy 'guardrails-default' not found",
-                    details={"available_policies": [p.get("name") for p in policies]},
+                    details=summarize_resources(
+                        "available_policies",
+                        (p.get("name") for p in policies),
+                        check_name="cluster_policy_exists",
+                        config=client.config,
+                    ),
                 )
             )
             return findings
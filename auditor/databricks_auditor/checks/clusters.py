@@ -2,6 +2,7 @@
 
 import logging
 
+from databricks_auditor.aggregation import summarize_resources
 from databricks_auditor.client import DatabricksClient
 from databricks_auditor.report import Finding, Severity
 
@@ -29,20 +30,18 @@ def check_clusters(client: DatabricksClient) -> list[Finding]:
 
         # Check 5: No all-purpose clusters running
         # Note: In dry-run mode, we can only warn based on fixture data
-        all_purpose_clusters = []
-        for cluster in clusters:
-            cluster_source = cluster.get("cluster_source")
-            # All-purpose clusters typically have cluster_source "UI" or null
-            # Job clusters have cluster_source "JOB"
-            if cluster_source != "JOB":
-                all_purpose_clusters.append(
-                    {
-                        "cluster_id": cluster.get("cluster_id"),
-                        "cluster_name": cluster.get("cluster_name"),
-                        "state": cluster.get("state"),
-                        "cluster_source": cluster_source,
-                    }
-                )
+        # All-purpose clusters typically have cluster_source "UI" or null
+        # Job clusters have cluster_source "JOB"
+        all_purpose_clusters = (
+            {
+                "cluster_id": cluster.get("cluster_id"),
+                "cluster_name": cluster.get("cluster_name"),
+                "state": cluster.get("state"),
+                "cluster_source": cluster.get("cluster_source"),
+            }
+            for cluster in clusters
+            if cluster.get("cluster_source") != "JOB"
+        )
 
         if client.config.is_dry_run() and clusters:
             findings.append(
@@ -53,13 +52,21 @@ def check_clusters(client: DatabricksClient) -> list[Finding]:
                     details={"cluster_count": len(clusters)},
                 )
             )
-        elif all_purpose_clusters:
+            return findings
+
+        details = summarize_resources(
+            "clusters",
+            all_purpose_clusters,
+            check_name="no_all_purpose_clusters",
+            config=client.config,
+        )
+        if details["clusters_total"]:
             findings.append(
                 Finding(
                     check_name="no_all_purpose_clusters",
                     severity=Severity.FAIL,
-                    message=f"Found {len(all_purpose_clusters)} all-purpose cluster(s)",
-                    details={"clusters": all_purpose_clusters},
+                    message=f"Found {details['clusters_total']} all-purpose cluster(s)",
+                    details=details,
                 )
             )
         else:
@@ -0,0 +1,100 @@
+"""Delta table health checks (file counts and small files)."""
+
+import logging
+
+from databricks_auditor.client import DatabricksClient
+from databricks_auditor.delta_log import DeltaLogError, read_snapshot, table_stats
+from databricks_auditor.report import Finding, Severity
+
+logger = logging.getLogger(__name__)
+
+
+def check_delta_table_health(client: DatabricksClient) -> list[Finding]:
+    """Flag Delta tables with too many files or too many small files."""
+    findings: list[Finding] = []
+    config = client.config
+
+    try:
+        table_paths = client.list_delta_tables()
+
+        if not table_paths:
+            findings.append(
+                Finding(
+                    check_name="delta_table_health",
+                    severity=Severity.OK,
+                    message="No Delta tables configured (set AUDITOR_DELTA_TABLES)",
+                    details={"table_count": 0},
+                )
+            )
+            return findings
+
+        for table_path in table_paths:
+            try:
+                stats = table_stats(read_snapshot(table_path), config.delta_small_file_bytes)
+            except (DeltaLogError, OSError, ValueError) as e:
+                logger.error(f"Error reading Delta log of {table_path}: {e}")
+                findings.append(
+                    Finding(
+                        check_name="delta_table_health",
+                        severity=Severity.FAIL,
+                        message=f"Failed to read Delta log of {table_path}: {str(e)}",
+                        details={"table_path": table_path, "error": str(e)},
+                    )
+                )
+                continue
+
+            details = {
+                **stats,
+                "max_files": config.delta_max_files,
+                "max_small_files": config.delta_max_small_files,
+            }
+            if stats["num_files"] > config.delta_max_files:
+                findings.append(
+                    Finding(
+                        check_name="delta_table_health",
+                        severity=Severity.FAIL,
+                        message=(
+                            f"{table_path} has {stats['num_files']} files "
+                            f"(max {config.delta_max_files})"
+                        ),
+                        details=details,
+                    )
+                )
+            elif stats["small_files"] > config.delta_max_small_files:
+                findings.append(
+                    Finding(
+                        check_name="delta_table_health",
+                        severity=Severity.WARN,
+                        message=(
+                            f"{table_path} has {stats['small_files']} files under "
+                            f"{config.delta_small_file_bytes} bytes "
+                            f"(max {config.delta_max_small_files}); run OPTIMIZE"
+                        ),
+                        details=details,
+                    )
+                )
+            else:
+                findings.append(
+                    Finding(
+                        check_name="delta_table_health",
+                        severity=Severity.OK,
+                        message=(
+                            f"{table_path} has {stats['num_files']} files "
+                            f"at version {stats['version']}"
+                        ),
+                        details=details,
+                    )
+                )
+
+    except Exception as e:
+        logger.error(f"Error checking Delta tables: {e}")
+        findings.append(
+            Finding(
+                check_name="delta_tables_check",
+                severity=Severity.FAIL,
+                message=f"Failed to check Delta tables: {str(e)}",
+                details={"error": str(e)},
+            )
+        )
+
+    return findings
@@ -2,6 +2,7 @@
 
 import logging
 
+from databricks_auditor.aggregation import summarize_resources
 from databricks_auditor.client import DatabricksClient
 from databricks_auditor.report import Finding, Severity
 
@@ -29,7 +30,12 @@ def check_secret_scopes(client: DatabricksClient) -> list[Finding]:
                     check_name="platform_secret_scope_exists",
                     severity=Severity.FAIL,
                     message="Platform secret scope 'platform' not found",
-                    details={"available_scopes": [s.get("name") for s in scopes]},
+                    details=summarize_resources(
+                        "available_scopes",
+                        (s.get("name") for s in scopes),
+                        check_name="platform_secret_scope_exists",
+                        config=client.config,
+                    ),
                 )
             )
         else:
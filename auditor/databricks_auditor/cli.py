@@ -8,12 +8,13 @@ from pathlib import Path
 from databricks_auditor.checks import (
     check_cluster_policies,
     check_clusters,
+    check_delta_table_health,
     check_secret_scopes,
     check_tags_cost_controls,
     check_workspace_settings,
 )
 from databricks_auditor.client import DatabricksClient
-from databricks_auditor.config import AuditorConfig
+from databricks_auditor.config import AuditorConfig, ConfigError
 from databricks_auditor.report import AuditReport, Finding, save
 
 logging.basicConfig(
@@ -36,6 +37,7 @@ def run_audit(config: AuditorConfig) -> list[Finding]:
         check_clusters,
         check_secret_scopes,
         check_workspace_settings,
+        check_delta_table_health,
     ]
 
     for check_func in check_functions:
@@ -82,6 +84,17 @@ def main():
         default="html,md,json",
         help="Report formats (comma-separated: html,md,json)",
     )
+    audit_parser.add_argument(
+        "--details-sample-size",
+        type=int,
+        default=None,
+        help="Max resources listed inline per finding (default: 25)",
+    )
+    audit_parser.add_argument(
+        "--spill-details",
+        action="store_true",
+        help="Write full resource lists to JSONL sidecars under <out>/details",
+    )
 
     args = parser.parse_args()
 
@@ -90,7 +103,15 @@ def main():
         sys.exit(1)
 
     # Load configuration
-    config = AuditorConfig.from_env()
+    try:
+        config = AuditorConfig.from_env()
+    except ConfigError as e:
+        print(f"Configuration error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.details_sample_size is not None:
+        config.details_sample_size = args.details_sample_size
+    if args.spill_details:
+        config.details_spill_dir = str(Path(args.out) / "details")
 
     # Run audit
     findings = run_audit(config)
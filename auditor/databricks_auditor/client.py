@@ -92,3 +92,15 @@ class DatabricksClient:
         except Exception as e:
             logger.warning(f"Failed to fetch workspace config: {e}")
             return {}
+
+    def list_delta_tables(self) -> list[str]:
+        """Delta table paths to health-check.
+
+        Tables are read from the filesystem, so configured paths are used in both
+        modes; dry-run without configured paths uses the fixture table.
+        """
+        if self.config.is_dry_run() and not self.config.delta_table_paths:
+            logger.info("DRY-RUN: Using fixture for Delta tables")
+            return [str(self.fixtures_dir / "sample_delta_table")]
+
+        return list(self.config.delta_table_paths)
@@ -5,6 +5,24 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+class ConfigError(ValueError):
+    """An environment variable holds an invalid configuration value."""
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    """Read an integer environment variable, raising ``ConfigError`` on bad values."""
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ConfigError(f"{name} must be an integer, got {raw!r}") from None
+    if value < minimum:
+        raise ConfigError(f"{name} must be >= {minimum}, got {value}")
+    return value
+
+
 @dataclass
 class AuditorConfig:
     """Configuration for Databricks auditor."""
@@ -13,10 +31,24 @@ class AuditorConfig:
     databricks_token: Optional[str]
     dry_run: bool
     timeout_seconds: int = 30
+    # Max resources listed inline in a finding's details; the rest are counted/hashed
+    details_sample_size: int = 25
+    # Optional directory for JSONL sidecars holding the full resource lists
+    details_spill_dir: Optional[str] = None
+    # Delta tables checked for file health (local or /dbfs paths)
+    delta_table_paths: tuple[str, ...] = ()
+    # A table with more live files than this fails the health check
+    delta_max_files: int = 10_000
+    # Files below this size are small; more than delta_max_small_files of them warn
+    delta_small_file_bytes: int = 32 * 1024 * 1024
+    delta_max_small_files: int = 1_000
 
     @classmethod
     def from_env(cls) -> "AuditorConfig":
-        """Create config from environment variables."""
+        """Create config from environment variables.
+
+        Raises ``ConfigError`` when a numeric setting is not a valid integer.
+        """
         host = os.getenv("DATABRICKS_HOST")
         token = os.getenv("DATABRICKS_TOKEN")
 
@@ -27,6 +59,16 @@ class AuditorConfig:
             databricks_host=host,
             databricks_token=token,
             dry_run=dry_run,
+            details_sample_size=_env_int("AUDITOR_DETAILS_SAMPLE_SIZE", 25),
+            details_spill_dir=os.getenv("AUDITOR_DETAILS_SPILL_DIR") or None,
+            delta_table_paths=tuple(
+                path.strip()
+                for path in os.getenv("AUDITOR_DELTA_TABLES", "").split(",")
+                if path.strip()
+            ),
+            delta_max_files=_env_int("AUDITOR_DELTA_MAX_FILES", 10000),
+            delta_small_file_bytes=_env_int("AUDITOR_DELTA_SMALL_FILE_BYTES", 32 * 1024 * 1024),
+            delta_max_small_files=_env_int("AUDITOR_DELTA_MAX_SMALL_FILES", 1000),
         )
 
     def is_dry_run(self) -> bool:
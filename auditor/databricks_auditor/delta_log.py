@@ -0,0 +1,264 @@
+"""Read Delta table snapshots from ``_delta_log`` without Spark.
+
+The snapshot is rebuilt the way Delta readers do it: start from the newest
+complete checkpoint (named in ``_last_checkpoint`` or found in the log listing)
+and replay only the JSON commits after it, so a log with thousands of commits
+costs one checkpoint read plus a few small files. Only the ``add``, ``remove``
+and ``metaData`` actions are used; data files are never opened.
+
+Checkpoints are Parquet and need ``pyarrow``. Without it the log is replayed
+from version 0, which only works while every commit is still in the log.
+Classic single-file and multi-part checkpoints are supported; V2 (UUID-named)
+checkpoints are skipped in favour of an older checkpoint or a full replay.
+
+Tables are read from the local filesystem. ``dbfs:/`` paths are mapped to the
+``/dbfs`` FUSE mount available on Databricks clusters.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+# Optional pyarrow support (checkpoint files are Parquet)
+try:
+    import pyarrow.parquet as pq  # type: ignore
+
+    _HAS_PYARROW = True
+except Exception:  # pragma: no cover
+    pq = None  # type: ignore
+    _HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+# Files below this size count as small (Databricks targets 128 MB - 1 GB files).
+DEFAULT_SMALL_FILE_BYTES = 32 * 1024 * 1024
+
+_COMMIT_RE = re.compile(r"^(\d{20})\.json$")
+_CHECKPOINT_RE = re.compile(r"^(\d{20})\.checkpoint(?:\.(\d{10})\.(\d{10}))?\.parquet$")
+
+
+class DeltaLogError(Exception):
+    """The transaction log is missing, incomplete or unreadable."""
+
+
+@dataclass
+class DeltaFile:
+    """One live data file of a snapshot."""
+
+    size: int
+    partition_values: dict[str, str | None] = field(default_factory=dict)
+
+
+@dataclass
+class DeltaSnapshot:
+    """Live files and metadata of a Delta table at its latest version."""
+
+    table_path: str
+    version: int
+    checkpoint_version: int | None
+    commits_read: int
+    partition_columns: list[str]
+    files: dict[str, DeltaFile]
+
+
+def local_table_path(table_path: str) -> Path:
+    """Map ``dbfs:/`` and ``file:`` URIs to a local path."""
+    if table_path.startswith("dbfs:/"):
+        return Path("/dbfs") / table_path[len("dbfs:/") :].lstrip("/")
+    if table_path.startswith("file:"):
+        return Path(table_path[len("file:") :])
+    return Path(table_path)
+
+
+def _checkpoints(names: list[str]) -> dict[int, list[str]]:
+    """Return the complete checkpoints in ``names`` as ``version -> part file names``."""
+    parts: dict[tuple[int, int], list[str]] = {}
+    for name in names:
+        match = _CHECKPOINT_RE.match(name)
+        if match:
+            version = int(match.group(1))
+            total = int(match.group(3) or 1)
+            parts.setdefault((version, total), []).append(name)
+    return {
+        version: sorted(files)
+        for (version, total), files in parts.items()
+        if len(files) == total
+    }
+
+
+def _latest_checkpoint(log_dir: Path, names: list[str]) -> tuple[int, list[str]] | None:
+    """Return ``(version, part files)`` of the checkpoint to start from, if any."""
+    checkpoints = _checkpoints(names)
+    if not checkpoints:
+        return None
+    hint = log_dir / "_last_checkpoint"
+    if hint.exists():
+        try:
+            version = int(json.loads(hint.read_text())["version"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring unreadable {hint}")
+        else:
+            if version in checkpoints:
+                return version, checkpoints[version]
+    version = max(checkpoints)
+    return version, checkpoints[version]
+
+
+def _file_key(path: str) -> str:
+    # Actions store URL-encoded paths; removes must match adds after decoding.
+    return unquote(path)
+
+
+def _read_checkpoint(
+    log_dir: Path, part_names: list[str], files: dict[str, DeltaFile]
+) -> list[str]:
+    """Load the live files of a checkpoint into ``files``; return the partition columns."""
+    partition_columns: list[str] = []
+    for name in part_names:
+        parquet = pq.ParquetFile(log_dir / name)
+        columns = [c for c in ("add", "metaData") if c in parquet.schema_arrow.names]
+        table = parquet.read(columns=columns)
+        if "add" in columns:
+            adds = table.column("add").combine_chunks()
+            paths = adds.field("path").to_pylist()
+            sizes = adds.field("size").to_pylist()
+            values = adds.field("partitionValues").to_pylist()
+            for path, size, partition_values in zip(paths, sizes, values):
+                if path is not None:
+                    files[_file_key(path)] = DeltaFile(int(size), dict(partition_values or []))
+        if "metaData" in columns:
+            for metadata in table.column("metaData").to_pylist():
+                if metadata is not None:
+                    partition_columns = list(metadata.get("partitionColumns") or [])
+    return partition_columns
+
+
+def _replay_commit(
+    path: Path, files: dict[str, DeltaFile], partition_columns: list[str]
+) -> list[str]:
+    """Apply one JSON commit to ``files``; return the (possibly new) partition columns."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            action = json.loads(line)
+            if "add" in action:
+                add = action["add"]
+                files[_file_key(add["path"])] = DeltaFile(
+                    int(add.get("size") or 0), dict(add.get("partitionValues") or {})
+                )
+            elif "remove" in action:
+                files.pop(_file_key(action["remove"]["path"]), None)
+            elif "metaData" in action:
+                partition_columns = list(action["metaData"].get("partitionColumns") or [])
+    return partition_columns
+
+
+def read_snapshot(table_path: str) -> DeltaSnapshot:
+    """Return the latest snapshot of the Delta table at ``table_path``.
+
+    Raises ``DeltaLogError`` when the path has no transaction log or commits
+    needed to rebuild the snapshot are missing.
+    """
+    log_dir = local_table_path(table_path) / "_delta_log"
+    if not log_dir.is_dir():
+        raise DeltaLogError(f"No Delta transaction log at {log_dir}")
+
+    names = [entry.name for entry in log_dir.iterdir()]
+    commits = {
+        int(match.group(1)): match.group(0)
+        for match in (_COMMIT_RE.match(name) for name in names)
+        if match
+    }
+    checkpoint = _latest_checkpoint(log_dir, names)
+    if checkpoint is not None and not _HAS_PYARROW:
+        if 0 not in commits:
+            raise DeltaLogError(
+                f"{table_path}: reading checkpoint {checkpoint[0]} requires pyarrow"
+            )
+        logger.warning(f"pyarrow not installed; replaying {table_path} from version 0")
+        checkpoint = None
+    if checkpoint is None and not commits:
+        raise DeltaLogError(f"No commits in {log_dir}")
+
+    files: dict[str, DeltaFile] = {}
+    partition_columns: list[str] = []
+    start = 0
+    checkpoint_version = None
+    if checkpoint is not None:
+        checkpoint_version, part_names = checkpoint
+        partition_columns = _read_checkpoint(log_dir, part_names, files)
+        start = checkpoint_version + 1
+
+    version = max([v for v in commits if v >= start] or [start - 1])
+    missing = [v for v in range(start, version + 1) if v not in commits]
+    if missing:
+        raise DeltaLogError(f"{table_path}: commits missing from the log: {missing[:10]}")
+    for commit_version in range(start, version + 1):
+        partition_columns = _replay_commit(
+            log_dir / commits[commit_version], files, partition_columns
+        )
+
+    return DeltaSnapshot(
+        table_path=table_path,
+        version=version,
+        checkpoint_version=checkpoint_version,
+        commits_read=version + 1 - start,
+        partition_columns=partition_columns,
+        files=files,
+    )
+
+
+def _percentile(values: list[int], fraction: float) -> int:
+    """Nearest-rank percentile of sorted ``values`` (0 when empty)."""
+    if not values:
+        return 0
+    index = max(0, min(len(values) - 1, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def table_stats(
+    snapshot: DeltaSnapshot, small_file_bytes: int = DEFAULT_SMALL_FILE_BYTES
+) -> dict[str, Any]:
+    """Summarize a snapshot: versions, file count and sizes, small files and partitions."""
+    sizes = sorted(f.size for f in snapshot.files.values())
+    total_bytes = sum(sizes)
+    small_files = sum(1 for size in sizes if size < small_file_bytes)
+
+    files_per_partition: dict[tuple[Any, ...], int] = {}
+    for data_file in snapshot.files.values():
+        key = tuple(data_file.partition_values.get(c) for c in snapshot.partition_columns)
+        files_per_partition[key] = files_per_partition.get(key, 0) + 1
+    partition_files = sorted(files_per_partition.values())
+
+    return {
+        "table_path": snapshot.table_path,
+        "version": snapshot.version,
+        "checkpoint_version": snapshot.checkpoint_version,
+        "commits_since_checkpoint": snapshot.commits_read,
+        "num_files": len(sizes),
+        "total_bytes": total_bytes,
+        "small_file_bytes": small_file_bytes,
+        "small_files": small_files,
+        "small_file_ratio": round(small_files / len(sizes), 4) if sizes else 0.0,
+        "file_size_bytes": {
+            "min": sizes[0] if sizes else 0,
+            "p50": _percentile(sizes, 0.5),
+            "p90": _percentile(sizes, 0.9),
+            "max": sizes[-1] if sizes else 0,
+            "mean": total_bytes // len(sizes) if sizes else 0,
+        },
+        "partition_columns": snapshot.partition_columns,
+        "partitions": len(partition_files),
+        "files_per_partition": {
+            "min": partition_files[0] if partition_files else 0,
+            "p50": _percentile(partition_files, 0.5),
+            "max": partition_files[-1] if partition_files else 0,
+        },
+    }
@@ -8,9 +8,11 @@ Design:
 from __future__ import annotations
 
 import json
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from html import escape
 from pathlib import Path
 from typing import Any
 
@@ -192,9 +194,112 @@ def to_markdown(report: AuditReport) -> str:
     return "\n".join(lines)
 
 
+# Findings shown per page inside an expanded check group of the HTML report.
+HTML_PAGE_SIZE = 50
+
+_SEVERITY_ORDER = [Severity.FAIL, Severity.WARN, Severity.OK]
+_SEVERITY_COLORS = {"FAIL": "#dc3545", "WARN": "#ffc107", "OK": "#28a745"}
+
+# Client-side renderer for the HTML report. Findings are embedded once as compact
+# JSON and only the current page of an expanded group is turned into DOM nodes,
+# so the page stays responsive no matter how many findings the audit produced.
+_HTML_SCRIPT = """
+(function () {
+  var data = JSON.parse(document.getElementById('audit-data').textContent);
+  var pageSize = data.page_size;
+
+  function el(tag, cls, text) {
+    var node = document.createElement(tag);
+    if (cls) { node.className = cls; }
+    if (text !== undefined) { node.textContent = text; }
+    return node;
+  }
+
+  function renderFinding(group, item) {
+    var node = el('div', 'finding finding-' + group.severity.toLowerCase());
+    node.appendChild(el('p', null, item[0]));
+    if (item[1]) {
+      var details = el('details', 'finding-details');
+      details.appendChild(el('summary', null, 'Details'));
+      details.addEventListener('toggle', function () {
+        if (details.open && !details.querySelector('pre')) {
+          details.appendChild(el('pre', null, JSON.stringify(item[1], null, 2)));
+        }
+      });
+      node.appendChild(details);
+    }
+    return node;
+  }
+
+  function renderPage(body, group, page) {
+    var pages = Math.max(1, Math.ceil(group.findings.length / pageSize));
+    var start = page * pageSize;
+    body.textContent = '';
+    group.findings.slice(start, start + pageSize).forEach(function (item) {
+      body.appendChild(renderFinding(group, item));
+    });
+    if (pages > 1) {
+      var pager = el('div', 'pager');
+      var prev = el('button', null, 'Previous');
+      var next = el('button', null, 'Next');
+      prev.disabled = page === 0;
+      next.disabled = page >= pages - 1;
+      prev.onclick = function () { renderPage(body, group, page - 1); };
+      next.onclick = function () { renderPage(body, group, page + 1); };
+      pager.appendChild(prev);
+      pager.appendChild(el('span', null, ' Page ' + (page + 1) + ' of ' + pages + ' '));
+      pager.appendChild(next);
+      body.appendChild(pager);
+    }
+  }
+
+  document.querySelectorAll('details.group').forEach(function (node) {
+    var group = data.groups[Number(node.getAttribute('data-group'))];
+    var body = node.querySelector('.group-body');
+    node.addEventListener('toggle', function () {
+      if (node.open && !body.hasChildNodes()) { renderPage(body, group, 0); }
+    });
+  });
+})();
+"""
+
+
+def _group_findings(findings: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Group findings by severity (FAIL, WARN, OK) and then by check name.
+
+    Each finding is reduced to a ``[message, details]`` pair; check name and
+    severity are stored once per group instead of once per finding.
+    """
+    by_key: dict[tuple[str, str], list[list[Any]]] = {}
+    for f in findings:
+        key = (Severity(f["severity"]).value, f["check_name"])
+        by_key.setdefault(key, []).append([f["message"], f.get("details") or None])
+
+    return [
+        {"severity": sev, "check": check, "findings": items}
+        for severity in _SEVERITY_ORDER
+        for (sev, check), items in by_key.items()
+        if sev == severity.value
+    ]
+
+
+def _json_for_script(obj: Any) -> str:
+    """Serialize compactly and escape markup so the payload can live in a <script> tag."""
+    raw = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return raw.replace("&", "\\u0026").replace("<", "\\u003c").replace(">", "\\u003e")
+
+
 def to_html(report: AuditReport) -> str:
+    """Render a self-contained HTML report.
+
+    Only the summary and one collapsed entry per (severity, check) group are
+    rendered as markup. Findings are embedded a single time as compact JSON and
+    paged into the DOM on demand, keeping the file size proportional to the raw
+    finding data and the page usable with 100k+ findings.
+    """
     data = _report_to_dict(report)
-    severity_colors = {"FAIL": "#dc3545", "WARN": "#ffc107", "OK": "#28a745"}
+    groups = _group_findings(data["findings"])
+    payload = {"page_size": HTML_PAGE_SIZE, "groups": groups}
 
     html_parts = [
         "<!DOCTYPE html>",
@@ -213,50 +318,71 @@ def to_html(report: AuditReport) -> str:
         ".summary-card h3 { margin: 0; font-size: 32px; }",
         ".summary-card p { margin: 5px 0 0 0; color: #666; }",
         ".findings { margin-top: 30px; }",
+        ".group { margin: 10px 0; border: 1px solid #dee2e6; border-radius: 3px; }",
+        ".group > summary { padding: 10px 15px; cursor: pointer; font-weight: bold; }",
+        ".group-body { padding: 0 15px 10px 15px; }",
+        ".count { color: #666; font-weight: normal; }",
         ".finding { padding: 15px; margin: 10px 0; border-left: 4px solid; "
         "border-radius: 3px; background: #f8f9fa; }",
         ".finding-ok { border-color: #28a745; }",
         ".finding-warn { border-color: #ffc107; }",
         ".finding-fail { border-color: #dc3545; }",
+        ".finding-details summary { cursor: pointer; color: #666; }",
         ".severity { display: inline-block; padding: 2px 8px; border-radius: 3px; "
         "color: white; font-size: 12px; font-weight: bold; }",
+        ".pager { margin-top: 10px; }",
         "pre { background: #f4f4f4; padding: 10px; border-radius: 3px; overflow-x: auto; }",
         "</style>",
         "</head>",
         "<body>",
         "<h1>Databricks Compliance Audit Report</h1>",
         "<div class='header'>",
-        f"<p><strong>Timestamp:</strong> {data['timestamp']}</p>",
-        f"<p><strong>Environment:</strong> {data['environment']}</p>",
+        f"<p><strong>Timestamp:</strong> {escape(data['timestamp'])}</p>",
+        f"<p><strong>Environment:</strong> {escape(data['environment'])}</p>",
         f"<p><strong>Mode:</strong> {_mode_label(data['dry_run'])}</p>",
         "</div>",
         "<h2>Summary</h2>",
         "<div class='summary'>",
-        f"<div class='summary-card' style='background: {severity_colors['OK']}20;'>"
+        f"<div class='summary-card' style='background: {_SEVERITY_COLORS['OK']}20;'>"
         f"<h3>{data['summary']['ok']}</h3><p>OK</p></div>",
-        f"<div class='summary-card' style='background: {severity_colors['WARN']}20;'>"
+        f"<div class='summary-card' style='background: {_SEVERITY_COLORS['WARN']}20;'>"
         f"<h3>{data['summary']['warn']}</h3><p>WARN</p></div>",
-        f"<div class='summary-card' style='background: {severity_colors['FAIL']}20;'>"
+        f"<div class='summary-card' style='background: {_SEVERITY_COLORS['FAIL']}20;'>"
         f"<h3>{data['summary']['fail']}</h3><p>FAIL</p></div>",
         "</div>",
         "<h2>Findings</h2>",
+        "<noscript><p>Enable JavaScript to browse individual findings.</p></noscript>",
         "<div class='findings'>",
     ]
 
-    for f in data["findings"]:
-        sev = f["severity"]
-        html_parts.append(f"<div class='finding finding-{sev.lower()}'>")
+    current_severity = None
+    for index, group in enumerate(groups):
+        sev = group["severity"]
+        if sev != current_severity:
+            html_parts.append(f"<h3>{sev}</h3>")
+            current_severity = sev
+        count = len(group["findings"])
         html_parts.append(
-            f"<h4>{f['check_name']} "
-            f"<span class='severity' style='background: {severity_colors[sev]};'>"
-            f"{sev}</span></h4>"
+            f"<details class='group' data-group='{index}'><summary>"
+            f"{escape(group['check'])} "
+            f"<span class='severity' style='background: {_SEVERITY_COLORS[sev]};'>{sev}</span> "
+            f"<span class='count'>{count} finding{'' if count == 1 else 's'}</span>"
+            "</summary><div class='group-body'></div></details>"
         )
-        html_parts.append(f"<p>{f['message']}</p>")
-        if f.get("details"):
-            html_parts.append(f"<pre>{_json_pretty(f['details'])}</pre>")
-        html_parts.append("</div>")
 
-    html_parts.extend(["</div>", "</body>", "</html>"])
+    html_parts.extend(
+        [
+            "</div>",
+            "<script type='application/json' id='audit-data'>",
+            _json_for_script(payload),
+            "</script>",
+            "<script>",
+            _HTML_SCRIPT.strip(),
+            "</script>",
+            "</body>",
+            "</html>",
+        ]
+    )
     return "\n".join(html_parts)
 
 
@@ -270,24 +396,99 @@ def to_json(report: AuditReport) -> str:
         return json.dumps(data, indent=2)
 
 
-def save(report: AuditReport, output_dir: Path, formats: list[str]) -> None:
-    output_dir.mkdir(parents=True, exist_ok=True)
+# Below this many findings, rendering is faster than starting worker processes.
+PARALLEL_RENDER_MIN_FINDINGS = 5_000
 
-    for fmt in formats:
-        if fmt == "json":
-            (output_dir / "audit_report.json").write_text(
-                to_json(report), encoding="utf-8"
-            )
-            print(f"Report saved: {output_dir / 'audit_report.json'}")
-        elif fmt == "md":
-            (output_dir / "audit_report.md").write_text(
-                to_markdown(report), encoding="utf-8"
-            )
-            print(f"Report saved: {output_dir / 'audit_report.md'}")
-        elif fmt == "html":
-            (output_dir / "audit_report.html").write_text(
-                to_html(report), encoding="utf-8"
+_REPORT_FILES = {
+    "json": "audit_report.json",
+    "md": "audit_report.md",
+    "html": "audit_report.html",
+}
+
+
+def _report_from_json(payload: str) -> AuditReport:
+    """Rebuild a report from the output of ``to_json``."""
+    if _HAS_PYDANTIC:
+        return AuditReport.model_validate_json(payload)  # type: ignore[attr-defined]
+
+    data = json.loads(payload)
+    return AuditReport(
+        timestamp=data["timestamp"],
+        environment=data["environment"],
+        dry_run=data["dry_run"],
+        findings=[
+            Finding(
+                check_name=f["check_name"],
+                severity=Severity(f["severity"]),
+                message=f["message"],
+                details=f.get("details") or {},
             )
-            print(f"Report saved: {output_dir / 'audit_report.html'}")
-        else:
+            for f in data["findings"]
+        ],
+        summary=data["summary"],
+    )
+
+
+def _render(report: AuditReport, fmt: str) -> str:
+    if fmt == "json":
+        return to_json(report)
+    if fmt == "md":
+        return to_markdown(report)
+    return to_html(report)
+
+
+def _render_to_file(payload: str, fmt: str, path: str) -> None:
+    """Worker entry point: render one format from the serialized report."""
+    Path(path).write_text(_render(_report_from_json(payload), fmt), encoding="utf-8")
+
+
+def save(
+    report: AuditReport,
+    output_dir: Path,
+    formats: list[str],
+    parallel: bool | None = None,
+) -> None:
+    """Write the report in each requested format to ``output_dir``.
+
+    With ``parallel=None`` (default), formats are rendered in worker processes when
+    more than one is requested and the report has at least
+    ``PARALLEL_RENDER_MIN_FINDINGS`` findings; otherwise they are rendered serially.
+    Workers receive the report once as its JSON serialization, which doubles as the
+    ``json`` output, so file names and contents match serial rendering.
+    """
+    for fmt in formats:
+        if fmt not in _REPORT_FILES:
             raise ValueError(f"Unknown format: {fmt}")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    unique_formats = list(dict.fromkeys(formats))
+
+    if parallel is None:
+        parallel = (
+            len(unique_formats) > 1
+            and len(report.findings) >= PARALLEL_RENDER_MIN_FINDINGS
+        )
+
+    if not parallel:
+        for fmt in formats:
+            path = output_dir / _REPORT_FILES[fmt]
+            path.write_text(_render(report, fmt), encoding="utf-8")
+            print(f"Report saved: {path}")
+        return
+
+    payload = to_json(report)
+    worker_formats = [fmt for fmt in unique_formats if fmt != "json"]
+    with ProcessPoolExecutor(max_workers=len(worker_formats) or 1) as pool:
+        futures = {
+            fmt: pool.submit(
+                _render_to_file, payload, fmt, str(output_dir / _REPORT_FILES[fmt])
+            )
+            for fmt in worker_formats
+        }
+        if "json" in unique_formats:
+            (output_dir / _REPORT_FILES["json"]).write_text(payload, encoding="utf-8")
+        for future in futures.values():
+            future.result()
+
+    for fmt in unique_formats:
+        print(f"Report saved: {output_dir / _REPORT_FILES[fmt]}")
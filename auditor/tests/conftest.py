@@ -0,0 +1,76 @@
+"""Shared fixtures for workload tests that need a local Spark session."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def spark():
+    """Local-mode SparkSession; tests using it are skipped without PySpark/Java.
+
+    Delta Lake is configured when ``delta-spark`` and its jars are available; use
+    the ``delta_spark`` fixture for tests that read or write Delta tables.
+    """
+    pytest.importorskip("pyspark")
+    from pyspark.sql import SparkSession
+
+    builder = (
+        SparkSession.builder.master("local[2]")
+        .appName("workload-tests")
+        .config("spark.ui.enabled", "false")
+        .config("spark.sql.shuffle.partitions", "2")
+        # Without AQE every action maps to exactly one Spark job, which keeps
+        # job-count assertions stable.
+        .config("spark.sql.adaptive.enabled", "false")
+    )
+
+    session = None
+    try:
+        from delta import configure_spark_with_delta_pip
+
+        session = configure_spark_with_delta_pip(
+            builder.config(
+                "spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension"
+            ).config(
+                "spark.sql.catalog.spark_catalog",
+                "org.apache.spark.sql.delta.catalog.DeltaCatalog",
+            )
+        ).getOrCreate()
+        session.conf.set("workload.tests.delta", "true")
+    except Exception:
+        session = None
+
+    if session is None:
+        try:
+            session = builder.getOrCreate()
+        except Exception as exc:  # pragma: no cover - depends on local Java
+            pytest.skip(f"Local Spark unavailable: {exc}")
+
+    yield session
+    session.stop()
+
+
+@pytest.fixture(scope="session")
+def delta_spark(spark):
+    """The shared session, skipping tests when Delta Lake is not configured."""
+    if spark.conf.get("workload.tests.delta", "false") != "true":
+        pytest.skip("Delta Lake is not available in this Spark session")
+    return spark
+
+
+@pytest.fixture
+def count_spark_jobs(spark):
+    """Return a helper running ``action`` and reporting ``(result, spark_job_count)``."""
+
+    def _count(action):
+        group = f"job-count-{id(action)}"
+        sc = spark.sparkContext
+        sc.setJobGroup(group, "job count")
+        try:
+            result = action()
+        finally:
+            sc.setLocalProperty("spark.jobGroup.id", None)
+        return result, len(sc.statusTracker().getJobIdsForGroup(group))
+
+    return _count
@@ -0,0 +1,103 @@
+"""Tests for bounded finding aggregation."""
+
+import json
+
+import pytest
+
+from databricks_auditor.aggregation import summarize_resources
+from databricks_auditor.checks import check_clusters
+from databricks_auditor.client import DatabricksClient
+from databricks_auditor.config import AuditorConfig, ConfigError
+
+
+def get_config(**overrides):
+    """Get a dry-run config with optional overrides."""
+    return AuditorConfig(
+        databricks_host=None, databricks_token=None, dry_run=True, **overrides
+    )
+
+
+def test_summarize_resources_bounds_sample():
+    """Test sample is capped while total reflects the full set."""
+    items = [{"cluster_id": f"c-{i:04d}"} for i in range(1000)]
+    details = summarize_resources(
+        "clusters", iter(items), check_name="test", config=get_config(details_sample_size=5)
+    )
+
+    assert details["clusters_total"] == 1000
+    assert details["clusters"] == items[:5]
+    assert details["clusters_truncated"] is True
+    assert len(details["clusters_sha256"]) == 64
+
+
+def test_summarize_resources_hash_is_order_independent():
+    """Test content hash identifies the set regardless of API ordering."""
+    config = get_config(details_sample_size=2)
+    forward = summarize_resources("names", ["a", "b", "c"], check_name="t", config=config)
+    backward = summarize_resources("names", ["c", "b", "a"], check_name="t", config=config)
+    changed = summarize_resources("names", ["a", "b", "d"], check_name="t", config=config)
+
+    assert forward == backward
+    assert forward["names_sha256"] != changed["names_sha256"]
+    assert "names_truncated" not in summarize_resources(
+        "names", ["a"], check_name="t", config=config
+    )
+
+
+def test_summarize_resources_spills_full_set(tmp_path):
+    """Test the full set is written to a JSONL sidecar when configured."""
+    config = get_config(details_sample_size=1, details_spill_dir=str(tmp_path))
+    details = summarize_resources(
+        "scopes", ["x", "y", "z"], check_name="secret_check", config=config
+    )
+
+    sidecar = tmp_path / "secret_check.scopes.jsonl"
+    assert details["scopes_sidecar"] == str(sidecar)
+    assert [json.loads(line) for line in sidecar.read_text().splitlines()] == ["x", "y", "z"]
+
+
+def test_summarize_resources_skips_sidecar_for_empty_set(tmp_path):
+    """Test no sidecar file is created when there is nothing to spill."""
+    config = get_config(details_spill_dir=str(tmp_path / "details"))
+    details = summarize_resources("scopes", [], check_name="secret_check", config=config)
+
+    assert details["scopes_total"] == 0
+    assert "scopes_sidecar" not in details
+    assert not (tmp_path / "details").exists()
+
+
+def test_config_rejects_invalid_sample_size(monkeypatch):
+    """Test a non-integer sample size is reported as a config error."""
+    monkeypatch.setenv("AUDITOR_DETAILS_SAMPLE_SIZE", "ten")
+    with pytest.raises(ConfigError, match="AUDITOR_DETAILS_SAMPLE_SIZE"):
+        AuditorConfig.from_env()
+
+    monkeypatch.setenv("AUDITOR_DETAILS_SAMPLE_SIZE", "-1")
+    with pytest.raises(ConfigError, match=">= 0"):
+        AuditorConfig.from_env()
+
+    monkeypatch.setenv("AUDITOR_DETAILS_SAMPLE_SIZE", "7")
+    assert AuditorConfig.from_env().details_sample_size == 7
+
+
+def test_check_clusters_details_are_bounded(monkeypatch):
+    """Test all-purpose cluster findings report counts instead of the full list."""
+    config = AuditorConfig(
+        databricks_host="https://example.databricks.com",
+        databricks_token="dapi-test",
+        dry_run=False,
+        details_sample_size=10,
+    )
+    client = DatabricksClient(config)
+    clusters = [
+        {"cluster_id": f"c-{i}", "cluster_name": f"adhoc-{i}", "cluster_source": "UI"}
+        for i in range(500)
+    ]
+    monkeypatch.setattr(client, "list_clusters", lambda: {"clusters": clusters})
+
+    findings = check_clusters(client)
+
+    assert len(findings) == 1
+    assert findings[0].message == "Found 500 all-purpose cluster(s)"
+    assert findings[0].details["clusters_total"] == 500
+    assert len(findings[0].details["clusters"]) == 10
@@ -3,6 +3,7 @@
 from databricks_auditor.checks import (
     check_cluster_policies,
     check_clusters,
+    check_delta_table_health,
     check_secret_scopes,
     check_tags_cost_controls,
     check_workspace_settings,
@@ -85,6 +86,17 @@ def test_check_workspace_settings():
     assert len(findings) > 0
 
 
+def test_check_delta_table_health():
+    """Test Delta table health on the fixture table."""
+    client = get_dry_run_client()
+    findings = check_delta_table_health(client)
+
+    assert len(findings) == 1
+    assert findings[0].check_name == "delta_table_health"
+    assert findings[0].severity == Severity.OK
+    assert findings[0].details["num_files"] == 4
+
+
 def test_all_checks_complete():
     """Test that all checks can run without errors."""
     client = get_dry_run_client()
@@ -95,6 +107,7 @@ def test_all_checks_complete():
     all_findings.extend(check_clusters(client))
     all_findings.extend(check_secret_scopes(client))
     all_findings.extend(check_workspace_settings(client))
+    all_findings.extend(check_delta_table_health(client))
 
     # Should have multiple findings
     assert len(all_findings) >= 5
@@ -65,6 +65,17 @@ def test_main_audit_command(tmp_path):
         assert report_file.exists()
 
 
+def test_main_reports_config_errors(monkeypatch, capsys):
+    """Test invalid numeric settings exit with a message instead of a traceback."""
+    monkeypatch.setenv("AUDITOR_DETAILS_SAMPLE_SIZE", "lots")
+    with patch.object(sys, "argv", ["databricks_auditor", "audit"]):
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+
+    assert exc_info.value.code == 1
+    assert "AUDITOR_DETAILS_SAMPLE_SIZE" in capsys.readouterr().err
+
+
 def test_config_redaction():
     """Test that config properly redacts sensitive data."""
     config = AuditorConfig(
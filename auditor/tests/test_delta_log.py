@@ -0,0 +1,205 @@
+"""Tests for the Spark-free Delta log reader and the table health check."""
+
+import json
+
+import pytest
+
+from databricks_auditor.checks import check_delta_table_health
+from databricks_auditor.client import DatabricksClient
+from databricks_auditor.config import AuditorConfig, ConfigError
+from databricks_auditor.delta_log import (
+    DeltaLogError,
+    local_table_path,
+    read_snapshot,
+    table_stats,
+)
+from databricks_auditor.report import Severity
+
+
+def get_client(**overrides):
+    """Get a dry-run client with optional config overrides."""
+    config = AuditorConfig(
+        databricks_host=None, databricks_token=None, dry_run=True, **overrides
+    )
+    return DatabricksClient(config)
+
+
+def _add(path, size, date="2024-10-01"):
+    return {"add": {"path": path, "partitionValues": {"event_date": date}, "size": size}}
+
+
+def _remove(path):
+    return {"remove": {"path": path, "dataChange": True}}
+
+
+def _metadata():
+    return {"metaData": {"id": "t", "partitionColumns": ["event_date"]}}
+
+
+def write_commit(table, version, actions):
+    """Write ``actions`` as commit ``version`` of the table at ``table``."""
+    log_dir = table / "_delta_log"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    lines = "".join(json.dumps(action) + "\n" for action in actions)
+    (log_dir / f"{version:020d}.json").write_text(lines)
+
+
+def write_checkpoint(table, version, paths, size=10):
+    """Write a single-file checkpoint holding ``paths`` and ``_last_checkpoint``."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    add_type = pa.struct(
+        [
+            ("path", pa.string()),
+            ("partitionValues", pa.map_(pa.string(), pa.string())),
+            ("size", pa.int64()),
+        ]
+    )
+    metadata_type = pa.struct([("id", pa.string()), ("partitionColumns", pa.list_(pa.string()))])
+    adds = [
+        {"path": p, "partitionValues": [("event_date", "2024-10-01")], "size": size} for p in paths
+    ]
+    checkpoint = pa.table(
+        {
+            "add": pa.array([None] + adds, type=add_type),
+            "metaData": pa.array(
+                [{"id": "t", "partitionColumns": ["event_date"]}] + [None] * len(adds),
+                type=metadata_type,
+            ),
+        }
+    )
+    log_dir = table / "_delta_log"
+    pq.write_table(checkpoint, str(log_dir / f"{version:020d}.checkpoint.parquet"))
+    (log_dir / "_last_checkpoint").write_text(json.dumps({"version": version, "size": 1}))
+
+
+def test_replays_adds_and_removes(tmp_path):
+    """Test removed files drop out of the snapshot, including URL-encoded paths."""
+    table = tmp_path / "events"
+    write_commit(table, 0, [_metadata(), _add("a.parquet", 100), _add("b%20c.parquet", 200)])
+    write_commit(table, 1, [_remove("b c.parquet"), _add("d.parquet", 300, "2024-10-02")])
+
+    snapshot = read_snapshot(str(table))
+
+    assert snapshot.version == 1
+    assert snapshot.checkpoint_version is None
+    assert snapshot.commits_read == 2
+    assert snapshot.partition_columns == ["event_date"]
+    assert sorted(snapshot.files) == ["a.parquet", "d.parquet"]
+
+
+def test_starts_from_latest_checkpoint(tmp_path):
+    """Test commits before the checkpoint are never read."""
+    table = tmp_path / "events"
+    # Unreadable commits before the checkpoint prove they are skipped.
+    for version in range(0, 1001):
+        (table / "_delta_log").mkdir(parents=True, exist_ok=True)
+        (table / "_delta_log" / f"{version:020d}.json").write_text("not json")
+    write_checkpoint(table, 1000, [f"f{i}.parquet" for i in range(50)])
+    write_commit(table, 1001, [_remove("f0.parquet"), _add("g.parquet", 10**9)])
+
+    snapshot = read_snapshot(str(table))
+    stats = table_stats(snapshot, small_file_bytes=1000)
+
+    assert snapshot.checkpoint_version == 1000
+    assert snapshot.commits_read == 1
+    assert stats["version"] == 1001
+    assert stats["num_files"] == 50
+    assert stats["small_files"] == 49
+    assert stats["file_size_bytes"]["max"] == 10**9
+    assert stats["partitions"] == 1
+
+
+def test_missing_log_and_commits_raise(tmp_path):
+    """Test tables without a log or with gaps in it are rejected."""
+    with pytest.raises(DeltaLogError, match="No Delta transaction log"):
+        read_snapshot(str(tmp_path / "missing"))
+
+    table = tmp_path / "gappy"
+    write_commit(table, 0, [_metadata(), _add("a.parquet", 1)])
+    write_commit(table, 2, [_add("b.parquet", 1)])
+    with pytest.raises(DeltaLogError, match=r"missing from the log: \[1\]"):
+        read_snapshot(str(table))
+
+
+def test_local_table_path_maps_dbfs_uris():
+    """Test dbfs:/ paths map to the /dbfs FUSE mount."""
+    gold = local_table_path("dbfs:/tmp/guardrails_demo/gold")
+    assert str(gold) == "/dbfs/tmp/guardrails_demo/gold"
+    assert str(local_table_path("file:/data/gold")) == "/data/gold"
+
+
+def test_table_stats_of_fixture():
+    """Test the dry-run fixture table is summarized from its commits."""
+    client = get_client()
+    stats = table_stats(read_snapshot(client.list_delta_tables()[0]))
+
+    assert stats["version"] == 3
+    assert stats["num_files"] == 4
+    assert stats["partitions"] == 3
+    assert stats["files_per_partition"]["max"] == 2
+
+
+def test_check_delta_table_health_thresholds(tmp_path):
+    """Test file-count failures, small-file warnings and unreadable tables."""
+    table = tmp_path / "events"
+    write_commit(table, 0, [_metadata()] + [_add(f"f{i}.parquet", 10) for i in range(20)])
+    paths = (str(table), str(tmp_path / "missing"))
+
+    findings = check_delta_table_health(get_client(delta_table_paths=paths))
+    assert [f.severity for f in findings] == [Severity.OK, Severity.FAIL]
+    assert "Failed to read Delta log" in findings[1].message
+
+    findings = check_delta_table_health(
+        get_client(delta_table_paths=paths[:1], delta_max_small_files=10)
+    )
+    assert findings[0].severity == Severity.WARN
+    assert findings[0].details["small_files"] == 20
+
+    findings = check_delta_table_health(
+        get_client(delta_table_paths=paths[:1], delta_max_files=10)
+    )
+    assert findings[0].severity == Severity.FAIL
+    assert findings[0].details["num_files"] == 20
+
+
+def test_config_rejects_invalid_delta_thresholds(monkeypatch):
+    """Test non-integer Delta thresholds raise a ConfigError naming the variable."""
+    monkeypatch.setenv("AUDITOR_DELTA_MAX_FILES", "10k")
+    with pytest.raises(ConfigError, match="AUDITOR_DELTA_MAX_FILES"):
+        AuditorConfig.from_env()
+
+    monkeypatch.setenv("AUDITOR_DELTA_MAX_FILES", "500")
+    assert AuditorConfig.from_env().delta_max_files == 500
+
+
+def test_check_delta_table_health_without_tables():
+    """Test real mode with no configured tables reports OK."""
+    config = AuditorConfig(
+        databricks_host="https://example.databricks.com",
+        databricks_token="dapi123",
+        dry_run=False,
+    )
+    findings = check_delta_table_health(DatabricksClient(config))
+
+    assert findings[0].severity == Severity.OK
+    assert findings[0].details == {"table_count": 0}
+
+
+def test_matches_delta_lake_file_count(delta_spark, tmp_path):
+    """Test the snapshot agrees with Delta Lake after checkpoints and OPTIMIZE."""
+    pytest.importorskip("pyarrow")
+    spark = delta_spark
+    path = str(tmp_path / "events")
+    for batch in range(12):
+        spark.range(batch * 10, batch * 10 + 10).selectExpr(
+            "id", "CAST(id % 3 AS STRING) AS part"
+        ).write.format("delta").mode("append").partitionBy("part").save(path)
+    spark.sql(f"OPTIMIZE delta.`{path}` WHERE part = '0'")
+
+    detail = spark.sql(f"DESCRIBE DETAIL delta.`{path}`").collect()[0]
+    stats = table_stats(read_snapshot(path))
+
+    assert stats["checkpoint_version"] == 10
+    assert stats["num_files"] == detail["numFiles"]
+    assert stats["total_bytes"] == detail["sizeInBytes"]
@@ -1,5 +1,8 @@
 """Tests for report generation."""
 
+import json
+
+import pytest
 
 from databricks_auditor.report import (
     AuditReport,
@@ -150,3 +153,85 @@ def test_save_reports(tmp_path):
     assert (tmp_path / "audit_report.json").exists()
     assert (tmp_path / "audit_report.md").exists()
     assert (tmp_path / "audit_report.html").exists()
+
+
+def test_html_groups_findings_and_embeds_details_once():
+    """Test HTML report groups by severity/check and collapses details."""
+    findings = [
+        Finding(
+            check_name="no_all_purpose_clusters",
+            severity=Severity.FAIL,
+            message=f"Cluster {i} is all-purpose",
+            details={"cluster_id": f"cluster-{i}"},
+        )
+        for i in range(3)
+    ]
+    findings.append(
+        Finding(check_name="policy", severity=Severity.OK, message="Policy </script> ok")
+    )
+    report = AuditReport.create(findings, dry_run=True)
+
+    html_output = to_html(report)
+
+    assert html_output.count("<details class='group'") == 2
+    assert html_output.index(">FAIL</h3>") < html_output.index(">OK</h3>")
+    assert html_output.count("cluster-1") == 1
+    assert "<pre>" not in html_output
+    assert "Policy </script>" not in html_output
+
+
+def test_html_output_size_is_bounded():
+    """Test HTML output grows with raw finding data, not per-finding markup."""
+    findings = [
+        Finding(
+            check_name="no_all_purpose_clusters",
+            severity=Severity.FAIL,
+            message=f"Cluster c-{i} is all-purpose",
+            details={"cluster_id": f"c-{i}", "state": "RUNNING"},
+        )
+        for i in range(100_000)
+    ]
+    report = AuditReport.create(findings, dry_run=True)
+
+    html_output = to_html(report)
+
+    raw_size = len(
+        json.dumps(
+            [[f.message, f.details] for f in findings], separators=(",", ":")
+        )
+    )
+    assert len(html_output) < raw_size + 20_000
+    assert html_output.count("<details class='group'") == 1
+
+
+def test_save_parallel_matches_serial(tmp_path):
+    """Test parallel rendering writes the same files as serial rendering."""
+    findings = [
+        Finding(
+            check_name=f"check{i % 3}",
+            severity=[Severity.OK, Severity.WARN, Severity.FAIL][i % 3],
+            message=f"Finding {i}",
+            details={"index": i, "label": "≤15"},
+        )
+        for i in range(20)
+    ]
+    report = AuditReport.create(findings, dry_run=False)
+
+    save(report, tmp_path / "serial", ["json", "md", "html"], parallel=False)
+    save(report, tmp_path / "parallel", ["json", "md", "html"], parallel=True)
+
+    for name in ["audit_report.json", "audit_report.md", "audit_report.html"]:
+        serial = (tmp_path / "serial" / name).read_text(encoding="utf-8")
+        parallel = (tmp_path / "parallel" / name).read_text(encoding="utf-8")
+        assert serial == parallel
+
+
+def test_save_rejects_unknown_format(tmp_path):
+    """Test unknown formats fail before any file is written."""
+    finding = Finding(check_name="test", severity=Severity.OK, message="Test")
+    report = AuditReport.create([finding], dry_run=True)
+
+    with pytest.raises(ValueError):
+        save(report, tmp_path, ["json", "pdf"])
+
+    assert not (tmp_path / "audit_report.json").exists()
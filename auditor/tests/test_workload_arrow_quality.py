@@ -0,0 +1,148 @@
+"""Tests for the Spark-free Parquet quality checker."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.arrow_quality import check_parquet, main  # noqa: E402
+from workload.rules import NonNull, Range, Unique, evaluate_rules  # noqa: E402
+
+
+def _write_events(path, ids, amounts):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(pa.table({"id": ids, "amount": amounts}), str(path))
+
+
+@pytest.fixture
+def export_dir(tmp_path):
+    # Two partitions; id 7 appears in both and one amount is null.
+    root = tmp_path / "bronze"
+    _write_events(
+        root / "event_date=2024-10-01" / "part-0.parquet", [1, 2, 3, 7], [1.0, 2.0, None, 4.0]
+    )
+    _write_events(
+        root / "event_date=2024-10-02" / "part-0.parquet", [4, 5, 6, 7, None], [5.0] * 5
+    )
+    return root
+
+
+def test_check_parquet_counts_nulls_and_duplicates(export_dir):
+    rules = [NonNull("amount"), NonNull("id"), Unique("id")]
+
+    records = check_parquet([str(export_dir)], rules, "r1", "bronze", batch_size=2)
+    by_metric = {record["metric"]: record for record in records}
+
+    assert by_metric["row_count"]["value"] == 9
+    assert by_metric["amount_non_null"]["status"] == "FAIL"
+    assert by_metric["amount_non_null"]["details"]["null_rate"] == round(1 / 9, 4)
+    assert by_metric["id_non_null"]["value"] == 1
+    assert by_metric["id_unique"]["value"] == 7
+    assert by_metric["id_unique"]["status"] == "FAIL"
+    assert by_metric["id_unique"]["details"]["null_rows"] == 1
+
+
+def test_nulls_do_not_fail_uniqueness(tmp_path):
+    path = tmp_path / "users.parquet"
+    pq.write_table(pa.table({"user_id": ["u1", None, "u2", None]}), str(path))
+
+    (_, unique) = check_parquet([str(path)], [Unique("user_id")], "r1", "silver")
+
+    assert (unique["status"], unique["value"]) == ("OK", 2)
+    assert unique["details"]["total_rows"] == 2
+
+
+def test_spilled_runs_count_the_same_distinct_values(export_dir, tmp_path):
+    rules = [Unique("id")]
+    in_memory = check_parquet([str(export_dir)], rules, "r1", "bronze", batch_size=2)
+
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    spilled = check_parquet(
+        [str(export_dir)],
+        rules,
+        "r1",
+        "bronze",
+        batch_size=2,
+        max_values_in_memory=1,
+        spill_dir=str(spill_dir),
+    )
+
+    assert spilled == in_memory
+    assert list(spill_dir.iterdir()) == []
+
+
+def test_strings_spill_and_merge(tmp_path):
+    path = tmp_path / "users.parquet"
+    pq.write_table(pa.table({"user_id": [f"u{i % 37}" for i in range(500)]}), str(path))
+
+    records = check_parquet(
+        [str(path)], [Unique("user_id")], "r1", "silver", batch_size=16, max_values_in_memory=10
+    )
+
+    assert records[1]["value"] == 37
+
+
+def test_many_runs_merge_across_chunk_boundaries(tmp_path):
+    path = tmp_path / "events.parquet"
+    # Overlapping ranges per batch so runs interleave and chunks end at different values.
+    ids = [(i * 7919) % 1000 for i in range(3000)]
+    pq.write_table(pa.table({"id": ids}), str(path))
+
+    records = check_parquet(
+        [str(path)], [Unique("id")], "r1", "bronze", batch_size=64, max_values_in_memory=100
+    )
+
+    assert records[1]["value"] == 1000
+
+
+def test_nan_is_one_distinct_value_when_spilling(tmp_path):
+    path = tmp_path / "amounts.parquet"
+    pq.write_table(pa.table({"amount": [float("nan"), 1.0, 2.0, 3.0] * 3}), str(path))
+
+    spilled = check_parquet(
+        [str(path)], [Unique("amount")], "r1", "silver", batch_size=4, max_values_in_memory=1
+    )
+    in_memory = check_parquet([str(path)], [Unique("amount")], "r1", "silver")
+
+    assert spilled[1]["value"] == 4
+    assert spilled == in_memory
+
+
+def test_approximate_unique_rules_are_counted_exactly(export_dir):
+    exact = check_parquet([str(export_dir)], [Unique("id")], "r1", "bronze")
+    approximate = check_parquet(
+        [str(export_dir)], [Unique("id", relative_error=0.05)], "r1", "bronze"
+    )
+
+    assert approximate == exact
+
+
+def test_records_match_spark_rules(spark, export_dir):
+    rules = [NonNull("amount"), NonNull("id"), Unique("id")]
+    df = spark.read.parquet(str(export_dir))
+
+    assert check_parquet([str(export_dir)], rules, "r1", "bronze") == evaluate_rules(
+        df, rules, "r1", "bronze"
+    )
+
+
+def test_unsupported_rules_and_columns_are_rejected(export_dir):
+    with pytest.raises(ValueError, match="Range"):
+        check_parquet([str(export_dir)], [Range("amount", min_value=0)], "r1", "bronze")
+    with pytest.raises(ValueError, match="user_id"):
+        check_parquet([str(export_dir)], [NonNull("user_id")], "r1", "bronze")
+
+
+def test_main_exits_nonzero_on_failure(export_dir, capsys):
+    assert main([str(export_dir), "--layer", "bronze", "--non-null", "id"]) == 1
+    assert '"id_non_null"' in capsys.readouterr().out
+    assert main([str(export_dir), "--layer", "silver", "--unique", "amount"]) == 1
@@ -0,0 +1,76 @@
+"""Tests for the concurrent date-range backfill."""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.backfill import date_slices, run_backfill  # noqa: E402
+from workload.metrics import metrics_table_path  # noqa: E402
+from workload.pipeline import ingest_bronze  # noqa: E402
+from workload.synthetic import SyntheticConfig  # noqa: E402
+
+
+def test_date_slices_cover_range_inclusively():
+    slices = date_slices(dt.date(2024, 10, 1), dt.date(2024, 10, 5), slice_days=2)
+
+    assert slices == [
+        (dt.date(2024, 10, 1), dt.date(2024, 10, 2)),
+        (dt.date(2024, 10, 3), dt.date(2024, 10, 4)),
+        (dt.date(2024, 10, 5), dt.date(2024, 10, 5)),
+    ]
+    assert date_slices(dt.date(2024, 10, 1), dt.date(2024, 10, 1)) == [
+        (dt.date(2024, 10, 1), dt.date(2024, 10, 1))
+    ]
+
+
+def test_date_slices_reject_bad_input():
+    with pytest.raises(ValueError):
+        date_slices(dt.date(2024, 10, 2), dt.date(2024, 10, 1))
+    with pytest.raises(ValueError):
+        date_slices(dt.date(2024, 10, 1), dt.date(2024, 10, 2), slice_days=0)
+
+
+def test_backfill_rebuilds_range_and_resumes(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    config = SyntheticConfig(rows=3000, days=4, end_date=dt.date(2024, 10, 5))
+    ingest_bronze(delta_spark, base_path, "seed", synthetic=config)
+
+    summary = run_backfill(
+        delta_spark, base_path, dt.date(2024, 10, 1), dt.date(2024, 10, 4), parallelism=2
+    )
+
+    assert summary["completed"] == 4
+    gold_dates = {
+        row["event_date"]
+        for row in delta_spark.read.format("delta").load(f"{base_path}/gold").collect()
+    }
+    assert gold_dates == {dt.date(2024, 10, d) for d in range(1, 5)}
+    silver_rows = delta_spark.read.format("delta").load(f"{base_path}/silver").count()
+    assert silver_rows == 3000
+    # Each slice's rows_written comes from its own commit, not a concurrent slice's.
+    silver = delta_spark.read.format("delta").load(f"{base_path}/silver")
+    written = {
+        row["run_id"]: row["value"]
+        for row in delta_spark.read.format("delta")
+        .load(metrics_table_path(base_path))
+        .filter("layer = 'silver' AND metric = 'rows_written'")
+        .collect()
+    }
+    for day in range(1, 5):
+        run_id = f"backfill_20241001_20241004_1d_202410{day:02d}"
+        assert float(written[run_id]) == silver.filter(
+            f"event_date = DATE'2024-10-{day:02d}'"
+        ).count()
+
+    again = run_backfill(
+        delta_spark, base_path, dt.date(2024, 10, 1), dt.date(2024, 10, 4), parallelism=2
+    )
+    assert again["skipped"] == 4
+    assert again["completed"] == 0
@@ -0,0 +1,73 @@
+"""Tests for the workload benchmark helpers (skipped without PySpark)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.benchmarks.common import scan_stats  # noqa: E402
+from workload.benchmarks.layout_skipping import run_benchmark  # noqa: E402
+from workload.benchmarks.metrics_lookup import (  # noqa: E402
+    run_benchmark as run_lookup_benchmark,
+)
+from workload.benchmarks.pipeline_throughput import (  # noqa: E402
+    compare_to_baseline,
+    run_size,
+)
+
+
+def test_scan_stats_reports_partition_pruning(spark, tmp_path):
+    path = str(tmp_path / "events")
+    spark.range(1000).selectExpr("id", "id % 10 AS day").write.partitionBy("day").parquet(path)
+    events = spark.read.parquet(path)
+
+    full = scan_stats(events.groupBy("day").count())
+    pruned = scan_stats(events.filter("day = 3").groupBy("day").count())
+
+    assert full["files_read"] >= 10
+    assert 0 < pruned["files_read"] < full["files_read"]
+    assert 0 < pruned["bytes_read"] < full["bytes_read"]
+
+
+def test_layout_benchmark_default_layout_skips_silver_data(delta_spark, tmp_path):
+    results = run_benchmark(delta_spark, str(tmp_path), rows=3000, days=30, window_days=7)
+
+    silver = {r["layout"]: r for r in results if r["table"] == "silver"}
+    assert silver["no_layout"]["bytes_skipped_pct"] < silver["default_layout"]["bytes_skipped_pct"]
+
+
+def test_compare_to_baseline_flags_only_slow_stages():
+    baseline = [
+        {"rows": 1000, "stage": "bronze", "rows_per_sec": 1000.0},
+        {"rows": 1000, "stage": "gold", "rows_per_sec": 500.0},
+    ]
+    results = [
+        {"rows": 1000, "stage": "bronze", "rows_per_sec": 850.0},
+        {"rows": 1000, "stage": "gold", "rows_per_sec": 300.0},
+        {"rows": 5000, "stage": "gold", "rows_per_sec": 10.0},
+    ]
+
+    regressions = compare_to_baseline(results, baseline, tolerance=0.2)
+
+    assert [(r["rows"], r["stage"]) for r in regressions] == [(1000, "gold")]
+    assert regressions[0]["change"] == -0.4
+
+
+def test_pipeline_throughput_reports_each_stage(delta_spark, tmp_path):
+    results = run_size(delta_spark, str(tmp_path), rows=2000)
+
+    assert [r["stage"] for r in results] == ["bronze", "silver", "gold"]
+    assert results[0]["input_rows"] == 2000
+    assert results[1]["input_rows"] == results[0]["output_rows"]
+    assert all(r["rows_per_sec"] > 0 for r in results)
+
+
+def test_metrics_lookup_benchmark_reads_fewer_files_after_compaction(delta_spark, tmp_path):
+    (result,) = run_lookup_benchmark(delta_spark, str(tmp_path), runs=[20], lookups=2)
+
+    assert result["files"] >= 10
+    assert result["compacted_files"] < result["files"]
+    assert result["compacted_files_read_median"] <= result["files_read_median"]
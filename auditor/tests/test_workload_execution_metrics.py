@@ -0,0 +1,143 @@
+"""Tests for per-stage Spark execution metrics."""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload import execution_metrics  # noqa: E402
+from workload.execution_metrics import (  # noqa: E402
+    _rest_stage_attempts,
+    compare_runs,
+    summarize_stage_attempts,
+    track_stage,
+)
+
+
+class _ListSink:
+    def __init__(self):
+        self.records = []
+
+    def add(self, records):
+        self.records.extend(records)
+
+
+def test_summarize_stage_attempts_skips_skipped_stages():
+    attempts = [
+        {"stageId": 0, "status": "COMPLETE", "numCompleteTasks": 4, "shuffleWriteBytes": 100},
+        {"stageId": 1, "status": "COMPLETE", "numCompleteTasks": 2, "shuffleReadBytes": 100,
+         "diskBytesSpilled": 7},
+        {"stageId": 1, "status": "FAILED", "numFailedTasks": 1},
+        {"stageId": 2, "status": "SKIPPED", "numCompleteTasks": 9},
+    ]
+
+    totals = summarize_stage_attempts(attempts)
+
+    assert totals["stages"] == 2
+    assert totals["tasks"] == 6
+    assert totals["failed_tasks"] == 1
+    assert totals["shuffle_read_bytes"] == totals["shuffle_write_bytes"] == 100
+    assert totals["disk_spilled_bytes"] == 7
+
+
+def test_compare_runs_reports_change_per_layer():
+    def record(run_id, layer, wall, day):
+        return {
+            "run_id": run_id,
+            "layer": layer,
+            "value": wall,
+            "details": {"tasks": 4, "shuffle_read_bytes": 2_000_000},
+            "recorded_at": dt.datetime(2024, 10, day),
+        }
+
+    records = [
+        record("run1", "gold", 10.0, 1),
+        record("run2", "gold", 15.0, 2),
+        record("run3", "gold", 12.0, 3),
+        record("run3", "bronze", 4.0, 3),
+    ]
+
+    report = compare_runs(records, runs=2).splitlines()
+
+    assert report[0].startswith("layer")
+    assert len(report) == 4
+    assert "run1" not in "\n".join(report)
+    gold_run3 = next(line for line in report if line.startswith("gold") and "run3" in line)
+    assert "-20%" in gold_run3
+    assert "2.0" in gold_run3
+
+
+def test_track_stage_records_execution_metrics(spark):
+    sink = _ListSink()
+
+    with track_stage(spark, "run1", "silver", sink):
+        spark.range(1000).selectExpr("id % 3 AS k").groupBy("k").count().collect()
+
+    (record,) = sink.records
+    assert record["metric"] == "stage_execution"
+    assert record["layer"] == "silver"
+    assert record["status"] == "OK"
+    assert record["value"] >= 0
+    assert record["details"]["jobs"] >= 1
+    assert record["details"]["tasks"] >= 1
+    assert spark.sparkContext.getLocalProperty("spark.jobGroup.id") is None
+
+
+def test_track_stage_marks_failed_stage(spark):
+    sink = _ListSink()
+
+    with pytest.raises(RuntimeError):
+        with track_stage(spark, "run1", "gold", sink):
+            raise RuntimeError("boom")
+
+    assert sink.records[0]["status"] == "FAIL"
+    assert sink.records[0]["details"]["jobs"] == 0
+
+
+def test_rest_stage_lookup_skips_task_details(monkeypatch):
+    urls = []
+
+    class _Response:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def read(self):
+            return b'[{"stageId": 3, "status": "COMPLETE"}]'
+
+    def fake_urlopen(url, timeout):
+        urls.append(url)
+        return _Response()
+
+    context = SimpleNamespace(uiWebUrl="http://driver:4040", applicationId="app-1")
+    monkeypatch.setattr(execution_metrics.urllib.request, "urlopen", fake_urlopen)
+
+    assert _rest_stage_attempts(context, [3]) == [{"stageId": 3, "status": "COMPLETE"}]
+    assert urls == ["http://driver:4040/api/v1/applications/app-1/stages/3?details=false"]
+
+
+def test_retried_stage_counts_only_its_own_jobs(spark):
+    sink = _ListSink()
+
+    with pytest.raises(RuntimeError):
+        with track_stage(spark, "run1", "bronze", sink):
+            spark.range(10).collect()
+            spark.range(10).collect()
+            raise RuntimeError("boom")
+    with track_stage(spark, "run1", "bronze", sink):
+        spark.range(10).collect()
+
+    failed, retried = sink.records
+    assert failed["details"]["jobs"] == 2
+    assert retried["details"]["jobs"] == 1
+    assert failed["details"]["job_group"] != retried["details"]["job_group"]
+    assert retried["details"]["job_group"].startswith("run1:bronze:")
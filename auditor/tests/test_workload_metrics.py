@@ -0,0 +1,196 @@
+"""Tests for the buffered metrics sink."""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.metrics import MetricsSink, to_metrics_row  # noqa: E402
+from workload.pipeline import run_pipeline  # noqa: E402
+from workload.quality import build_metric_record  # noqa: E402
+
+
+def test_to_metrics_row_serializes_details_as_json():
+    recorded_at = dt.datetime(2024, 10, 1, 12, 0)
+    record = build_metric_record(
+        "run1", "bronze", "id_unique", "FAIL", 4, {"distinct": 4, "ratio": 0.8, "col": "id"}
+    )
+
+    row = to_metrics_row(record, recorded_at)
+
+    assert row[:5] == ("run1", "bronze", "id_unique", "FAIL", 4.0)
+    assert json.loads(row[5]) == {"col": "id", "distinct": 4, "ratio": 0.8}
+    assert row[6] == recorded_at
+    assert to_metrics_row(build_metric_record("r", "gold", "x", "OK"), recorded_at)[4] is None
+
+
+def test_sink_flush_without_records_is_noop():
+    sink = MetricsSink(spark=None, base_path="/unused")
+
+    assert sink.flush() == 0
+
+
+def test_sink_submit_runs_inline_without_executor():
+    sink = MetricsSink(spark=None, base_path="/unused")
+
+    sink.submit(lambda: [build_metric_record("run1", "gold", "x", "OK", 1)])
+
+    assert sink.pending == 1
+    assert sink.join() == []
+
+
+def test_sink_join_keeps_records_of_successful_computations():
+    def fail():
+        raise ValueError("bad rule")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sink = MetricsSink(spark=None, base_path="/unused", executor=executor)
+        sink.submit(lambda: [build_metric_record("run1", "bronze", "x", "OK", 1)])
+        sink.submit(fail)
+        sink.submit(lambda: [build_metric_record("run1", "silver", "y", "OK", 2)])
+        assert sink.pending == 0
+
+        errors = sink.join()
+
+    assert [str(error) for error in errors] == ["bad rule"]
+    assert sink.pending == 2
+    assert sink.join() == []
+
+
+def test_sink_after_pending_waits_for_earlier_computations():
+    def fail():
+        raise ValueError("bad rule")
+
+    done = []
+    inline = MetricsSink(spark=None, base_path="/unused")
+    inline.after_pending(lambda: done.append("inline"))
+    assert done == ["inline"]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        sink = MetricsSink(spark=None, base_path="/unused", executor=executor)
+        sink.submit(lambda: [build_metric_record("run1", "bronze", "x", "OK", 1)])
+        sink.after_pending(lambda: done.append("bronze"))
+        sink.submit(fail)
+        sink.after_pending(lambda: done.append("silver"))
+        assert done == ["inline"]
+
+        errors = sink.join()
+
+    # Silver's callback also waited for the failed computation, so it was dropped.
+    assert len(errors) == 1
+    assert done == ["inline", "bronze"]
+
+
+def test_sink_dataframe_keeps_mixed_details(spark):
+    sink = MetricsSink(spark, "/unused")
+    sink.add(
+        [
+            build_metric_record("run1", "silver", "amount_non_null", "OK", 0, {"null_rate": 0.0}),
+            build_metric_record("run1", "gold", "row_count", "OK", 2, {"table_version": 3}),
+        ]
+    )
+
+    rows = sink.to_dataframe().collect()
+
+    assert sink.pending == 2
+    assert json.loads(rows[0]["details"]) == {"null_rate": 0.0}
+    assert json.loads(rows[1]["details"]) == {"table_version": 3}
+    assert rows[1]["value"] == 2.0
+
+
+def test_sink_migrates_metrics_table_with_inferred_schema(delta_spark, tmp_path):
+    from workload.metrics_reader import metrics_for_run
+
+    base_path = str(tmp_path)
+    # Older versions appended the records with an inferred schema (details as a map).
+    old = build_metric_record("run0", "bronze", "id_non_null", "OK", 0, {"null_rows": 0})
+    delta_spark.createDataFrame([old]).write.format("delta").mode("append").save(
+        f"{base_path}/metrics"
+    )
+
+    sink = MetricsSink(delta_spark, base_path)
+    sink.add([build_metric_record("run1", "gold", "row_count", "OK", 2, {"table_version": 3})])
+    assert sink.flush() == 1
+
+    assert metrics_for_run(delta_spark, base_path, "run0")[0]["details"] == {"null_rows": 0}
+    assert metrics_for_run(delta_spark, base_path, "run1")[0]["value"] == 2.0
+
+
+def test_run_pipeline_writes_metrics_in_one_commit(delta_spark, tmp_path):
+    results = run_pipeline(delta_spark, str(tmp_path), "run1")
+
+    history = delta_spark.sql(f"DESCRIBE HISTORY delta.`{results['metrics_path']}`").collect()
+    layers = {
+        row["layer"]
+        for row in delta_spark.read.format("delta").load(results["metrics_path"]).collect()
+    }
+    assert len(history) == 1
+    assert layers == {"bronze", "silver", "gold"}
+
+
+def test_run_pipeline_flushes_metrics_when_a_stage_fails(delta_spark, tmp_path, monkeypatch):
+    import workload.pipeline as pipeline
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("gold failed")
+
+    monkeypatch.setattr(pipeline, "aggregate_gold", fail)
+    with pytest.raises(RuntimeError):
+        run_pipeline(delta_spark, str(tmp_path), "run1")
+
+    metrics = delta_spark.read.format("delta").load(str(tmp_path / "metrics")).collect()
+    quality_layers = {row["layer"] for row in metrics if row["metric"] != "stage_execution"}
+    assert quality_layers == {"bronze", "silver"}
+    gold_stage = [row for row in metrics if row["layer"] == "gold"]
+    assert [(row["metric"], row["status"]) for row in gold_stage] == [("stage_execution", "FAIL")]
+
+
+def test_async_metrics_match_serial_run(delta_spark, tmp_path):
+    def metric_names(base_path):
+        rows = delta_spark.read.format("delta").load(f"{base_path}/metrics").collect()
+        return sorted(
+            (row["layer"], row["metric"], row["value"])
+            for row in rows
+            if row["metric"] != "stage_execution"
+        )
+
+    run_pipeline(delta_spark, str(tmp_path / "serial"), "run1")
+    run_pipeline(delta_spark, str(tmp_path / "async"), "run1", async_metrics=True)
+
+    assert metric_names(tmp_path / "async") == metric_names(tmp_path / "serial")
+
+
+def test_async_metric_errors_fail_the_run(delta_spark, tmp_path):
+    from workload.rules import NonNull
+
+    rules = {"silver": (NonNull("no_such_column"),)}
+    with pytest.raises(RuntimeError, match="quality metric"):
+        run_pipeline(delta_spark, str(tmp_path), "run1", rules=rules, async_metrics=True)
+
+    metrics = delta_spark.read.format("delta").load(str(tmp_path / "metrics")).collect()
+    assert {row["layer"] for row in metrics if row["metric"] == "id_unique"} == {"bronze"}
+    assert "gold" in {row["layer"] for row in metrics}
+
+
+def test_async_metric_errors_leave_no_stage_marker(delta_spark, tmp_path):
+    from workload.rules import NonNull
+    from workload.state import read_stage_markers
+
+    rules = {"silver": (NonNull("no_such_column"),)}
+    with pytest.raises(RuntimeError, match="quality metric"):
+        run_pipeline(delta_spark, str(tmp_path), "run1", rules=rules, async_metrics=True)
+
+    assert set(read_stage_markers(delta_spark, str(tmp_path), "run1")) == {"bronze"}
+
+
+def test_async_metrics_rejects_fused_runs(spark, tmp_path):
+    with pytest.raises(ValueError, match="async_metrics"):
+        run_pipeline(spark, str(tmp_path), "run1", fused=True, async_metrics=True)
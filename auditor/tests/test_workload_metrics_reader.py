@@ -0,0 +1,70 @@
+"""Tests for metrics table lookups and compaction (skipped without Delta Lake)."""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.metrics import MetricsSink  # noqa: E402
+from workload.metrics_reader import (  # noqa: E402
+    compact_metrics,
+    latest_metrics,
+    metrics_for_run,
+)
+from workload.quality import build_metric_record  # noqa: E402
+
+
+def _write_runs(spark, base_path, run_ids):
+    for run_id in run_ids:
+        sink = MetricsSink(spark, base_path)
+        sink.add(
+            [
+                build_metric_record(run_id, "silver", "row_count", "OK", 5, {"run": run_id}),
+                build_metric_record(run_id, "gold", "row_count", "OK", 2),
+            ]
+        )
+        sink.flush()
+
+
+def test_metrics_for_run_filters_and_parses_details(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    _write_runs(delta_spark, base_path, ["run1", "run2"])
+
+    records = metrics_for_run(delta_spark, base_path, "run2")
+    silver = metrics_for_run(delta_spark, base_path, "run2", layer="silver")
+
+    assert [(r["layer"], r["metric"]) for r in records] == [
+        ("gold", "row_count"),
+        ("silver", "row_count"),
+    ]
+    assert silver[0]["details"] == {"run": "run2"}
+    assert metrics_for_run(delta_spark, base_path, "missing") == []
+
+
+def test_latest_metrics_returns_most_recent_run(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    _write_runs(delta_spark, base_path, ["run1", "run2"])
+
+    latest = latest_metrics(delta_spark, base_path, "silver", metric="row_count")
+
+    assert [(r["run_id"], r["value"]) for r in latest] == [("run2", 5.0)]
+    assert isinstance(latest[0]["recorded_at"], dt.datetime)
+    assert latest_metrics(delta_spark, base_path, "bronze") == []
+
+
+def test_compact_metrics_respects_min_files(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    assert compact_metrics(delta_spark, base_path)["optimized"] is False
+
+    _write_runs(delta_spark, base_path, [f"run{i}" for i in range(4)])
+    skipped = compact_metrics(delta_spark, base_path, min_files=10)
+    compacted = compact_metrics(delta_spark, base_path, min_files=2)
+
+    assert skipped == {"files_before": 4, "files_after": 4, "optimized": False}
+    assert compacted["optimized"] is True
+    assert compacted["files_after"] < compacted["files_before"]
+    assert len(metrics_for_run(delta_spark, base_path, "run3")) == 2
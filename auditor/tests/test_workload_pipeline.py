@@ -0,0 +1,272 @@
+"""Local-mode Spark tests for workload pipeline steps (skipped without PySpark)."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.pipeline import (  # noqa: E402
+    _clean_bronze,
+    aggregate_gold,
+    build_bronze_df,
+    build_gold_df,
+    commit_row_count_metrics,
+    compute_quality_metrics,
+    ingest_bronze,
+    parse_event_time,
+    quarantine_path,
+    run_pipeline,
+    split_malformed,
+    transform_silver,
+    write_quarantine,
+)
+from workload.state import stage_is_complete  # noqa: E402
+
+
+def test_compute_quality_metrics_single_spark_job(spark, count_spark_jobs):
+    df = spark.createDataFrame(
+        [(1, "u1", 10.0), (2, None, None), (2, "u2", 5.0)],
+        "id int, user_id string, amount double",
+    )
+
+    metrics, jobs = count_spark_jobs(
+        lambda: compute_quality_metrics(
+            df,
+            "run1",
+            "bronze",
+            non_null_columns=["id", "user_id", "amount"],
+            unique_columns=["id", "user_id"],
+        )
+    )
+
+    assert jobs == 1
+    by_name = {m["metric"]: m for m in metrics}
+    assert by_name["row_count"]["value"] == 3
+    assert by_name["id_non_null"]["status"] == "OK"
+    assert by_name["user_id_non_null"]["value"] == 1
+    assert by_name["amount_non_null"]["details"]["null_rows"] == 1
+    assert by_name["id_unique"]["status"] == "FAIL"
+    assert by_name["id_unique"]["value"] == 2
+
+
+def test_commit_row_count_metrics_read_delta_commit(delta_spark, tmp_path):
+    path = str(tmp_path / "table")
+    delta_spark.range(25).write.format("delta").mode("overwrite").save(path)
+    delta_spark.range(5).write.format("delta").mode("append").save(path)
+
+    row_count, rows_written = commit_row_count_metrics(delta_spark, path, "run1", "gold")
+
+    # row_count is the table at the commit; rows_written is only what it appended.
+    assert row_count["metric"] == "row_count"
+    assert row_count["value"] == 30
+    assert row_count["details"]["table_version"] == 1
+    assert rows_written["metric"] == "rows_written"
+    assert rows_written["value"] == 5
+    assert rows_written["details"]["operation"] == "WRITE"
+    assert rows_written["details"]["num_files"] >= 1
+    assert rows_written["details"]["num_output_bytes"] > 0
+
+
+def test_incremental_silver_merges_only_new_bronze_rows(delta_spark, tmp_path):
+    from pyspark.sql import functions as F  # noqa: N812
+
+    base_path = str(tmp_path)
+    bronze_path = ingest_bronze(delta_spark, base_path, "run1")
+    silver_path = transform_silver(delta_spark, bronze_path, base_path, "run1", mode="incremental")
+    assert delta_spark.read.format("delta").load(silver_path).count() == 5
+
+    new_rows = (
+        parse_event_time(
+            delta_spark.createDataFrame(
+                [
+                    (6, "u4", "purchase", 3.0, "2024-10-02T08:00:00Z"),
+                    (1, "u1", "purchase", 99.0, "2024-10-02T08:05:00Z"),
+                ],
+                "id int, user_id string, event_type string, amount double, ts string",
+            )
+        )
+        .withColumn("ingested_at", F.current_timestamp())
+        .withColumn("run_id", F.lit("run2"))
+    )
+    new_rows.write.format("delta").mode("append").save(bronze_path)
+
+    transform_silver(delta_spark, bronze_path, base_path, "run2", mode="incremental")
+
+    silver = delta_spark.read.format("delta").load(silver_path)
+    assert silver.count() == 6
+    assert silver.filter("id = 1").first()["amount"] == 42.5
+    assert silver.filter("id = 6").first()["run_id"] == "run2"
+
+
+def test_incremental_gold_replaces_only_touched_dates(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    silver_path = str(tmp_path / "silver")
+    columns = "id int, user_id string, event_type string, amount double, run_id string"
+    first = delta_spark.createDataFrame(
+        [(1, "u1", "purchase", 10.0, "run1"), (2, "u2", "purchase", 20.0, "run1")], columns
+    ).selectExpr("*", "DATE_ADD(DATE'2024-10-01', id - 1) AS event_date")
+    first.write.format("delta").save(silver_path)
+    gold_path = aggregate_gold(delta_spark, silver_path, base_path, "run1")
+
+    second = delta_spark.createDataFrame(
+        [(3, "u3", "purchase", 5.0, "run2")], columns
+    ).selectExpr("*", "DATE'2024-10-02' AS event_date")
+    second.write.format("delta").mode("append").save(silver_path)
+    aggregate_gold(delta_spark, silver_path, base_path, "run2", mode="incremental")
+
+    gold = {
+        str(row["event_date"]): row
+        for row in delta_spark.read.format("delta").load(gold_path).collect()
+    }
+    assert gold["2024-10-01"]["run_id"] == "run1"
+    assert gold["2024-10-02"]["run_id"] == "run2"
+    assert gold["2024-10-02"]["event_count"] == 2
+
+
+def test_stage_builders_chain_without_writes(spark):
+    gold_df = build_gold_df(_clean_bronze(build_bronze_df(spark, "run1")), "run1")
+
+    rows = {row["event_type"]: row for row in gold_df.collect()}
+    assert rows["purchase"]["event_count"] == 4
+    assert rows["purchase"]["unique_users"] == 3
+    assert rows["refund"]["total_amount"] == -5.0
+    assert {row["run_id"] for row in rows.values()} == {"run1"}
+
+
+def test_fused_pipeline_matches_staged_gold(delta_spark, tmp_path):
+    staged = run_pipeline(delta_spark, str(tmp_path / "staged"), "run1")
+    fused = run_pipeline(
+        delta_spark, str(tmp_path / "fused"), "run1", fused=True, persist_layers=("gold",)
+    )
+
+    assert "bronze_path" not in fused and "silver_path" not in fused
+    assert not (tmp_path / "fused" / "bronze").exists()
+
+    def gold_rows(path):
+        return sorted(tuple(row) for row in delta_spark.read.format("delta").load(path).collect())
+
+    assert gold_rows(fused["gold_path"]) == gold_rows(staged["gold_path"])
+
+    metrics = delta_spark.read.format("delta").load(fused["metrics_path"]).collect()
+    row_counts = {row["layer"]: row["value"] for row in metrics if row["metric"] == "row_count"}
+    assert row_counts == {"bronze": 5, "silver": 5, "gold": 2}
+
+
+def test_stage_is_complete_requires_unchanged_data_since_marker():
+    marker = {"table_version": 4}
+
+    assert stage_is_complete(marker, 4)
+    assert stage_is_complete(marker, 6, ["OPTIMIZE", "SET TBLPROPERTIES"])
+    assert not stage_is_complete(marker, 6, ["OPTIMIZE", "WRITE"])
+    # Later commits that history no longer lists cannot be vouched for.
+    assert not stage_is_complete(marker, 6, ["OPTIMIZE"])
+    assert not stage_is_complete(marker, 5)
+    assert not stage_is_complete(marker, 2)
+    assert not stage_is_complete(marker, None)
+    assert not stage_is_complete(None, 4)
+
+
+def test_rerun_skips_completed_stages_unless_forced(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    run_pipeline(delta_spark, base_path, "run1")
+    bronze_version = delta_spark.sql(f"DESCRIBE HISTORY delta.`{base_path}/bronze`").count()
+
+    run_pipeline(delta_spark, base_path, "run1")
+    run_pipeline(delta_spark, base_path, "run1", force_stages=["silver"])
+
+    metrics = delta_spark.read.format("delta").load(f"{base_path}/metrics").collect()
+    skipped = sorted(row["layer"] for row in metrics if row["metric"] == "stage_skipped")
+    assert skipped == ["bronze", "bronze", "gold", "silver"]
+    assert delta_spark.sql(f"DESCRIBE HISTORY delta.`{base_path}/bronze`").count() == bronze_version
+
+
+def test_rerun_repeats_stage_whose_table_was_written_since(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    run_pipeline(delta_spark, base_path, "run1")
+    delta_spark.sql(f"OPTIMIZE delta.`{base_path}/bronze`")
+    silver = delta_spark.read.format("delta").load(f"{base_path}/silver")
+    silver.limit(1).write.format("delta").mode("append").save(f"{base_path}/silver")
+
+    run_pipeline(delta_spark, base_path, "run1")
+
+    metrics = delta_spark.read.format("delta").load(f"{base_path}/metrics").collect()
+    # OPTIMIZE leaves bronze's marker valid; the append to silver does not.
+    assert [row["layer"] for row in metrics if row["metric"] == "stage_skipped"] == ["bronze"]
+    assert delta_spark.read.format("delta").load(f"{base_path}/silver").count() == 5
+
+
+def _raw_events(spark):
+    return spark.createDataFrame(
+        [
+            (1, "u1", "purchase", 1.0, "2024-10-01T12:00:00Z"),
+            (2, "u2", "purchase", 2.0, "yesterday"),
+            (3, "u3", "refund", -1.0, None),
+        ],
+        "id int, user_id string, event_type string, amount double, ts string",
+    )
+
+
+def test_replayed_quarantine_batch_reports_no_rows(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    _, malformed = split_malformed(parse_event_time(_raw_events(delta_spark)))
+    write_quarantine(delta_spark, malformed.limit(1), base_path, "run1", txn=("app", 0))
+    write_quarantine(delta_spark, malformed, base_path, "run1", txn=("app", 1))
+
+    # Delta skips the already committed version 1; the stats of batch 1 are not reused.
+    replay = write_quarantine(delta_spark, malformed, base_path, "run1", txn=("app", 1))
+
+    assert (replay["status"], replay["value"]) == ("OK", 0)
+    assert delta_spark.read.format("delta").load(quarantine_path(base_path)).count() == 3
+
+
+def test_bronze_event_time_is_typed_at_ingest(spark):
+    dtypes = dict(build_bronze_df(spark, "run1").dtypes)
+
+    assert dtypes["event_ts"] == "timestamp"
+    assert dtypes["event_date"] == "date"
+    # Silver reuses the typed columns instead of parsing ts again.
+    silver = _clean_bronze(build_bronze_df(spark, "run1"))
+    assert {str(row["event_date"]) for row in silver.collect()} == {"2024-10-01"}
+
+
+def test_clean_bronze_keeps_earliest_ingested_row(spark):
+    import datetime as dt
+
+    rows = [
+        (1, 9.0, "2024-10-01T12:00:00Z", dt.datetime(2024, 10, 2)),
+        (1, 1.0, "2024-10-01T12:00:00Z", dt.datetime(2024, 10, 1)),
+        (2, 5.0, "2024-10-01T12:00:00Z", dt.datetime(2024, 10, 1)),
+        (2, 3.0, "2024-10-01T12:00:00Z", dt.datetime(2024, 10, 1)),
+    ]
+    bronze = spark.createDataFrame(rows, "id int, amount double, ts string, ingested_at timestamp")
+
+    for df in (bronze, bronze.orderBy("amount", ascending=False).repartition(3)):
+        winners = {row["id"]: row["amount"] for row in _clean_bronze(df).collect()}
+        # Earliest ingested_at wins; ties fall back to the other columns.
+        assert winners == {1: 1.0, 2: 3.0}
+
+
+def test_split_malformed_separates_unparseable_ts(spark):
+    valid, malformed = split_malformed(parse_event_time(_raw_events(spark)))
+
+    assert [row["id"] for row in valid.collect()] == [1]
+    reasons = {row["id"]: row["quarantine_reason"] for row in malformed.collect()}
+    assert reasons == {2: "unparseable_ts", 3: "missing_ts"}
+
+
+def test_write_quarantine_appends_and_reports(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    _, malformed = split_malformed(parse_event_time(_raw_events(delta_spark)))
+
+    record = write_quarantine(delta_spark, malformed, base_path, "run1")
+    again = write_quarantine(delta_spark, malformed.limit(0), base_path, "run2")
+
+    assert (record["metric"], record["status"], record["value"]) == ("quarantined_rows", "FAIL", 2)
+    assert (again["status"], again["value"]) == ("OK", 0)
+    assert delta_spark.read.format("delta").load(quarantine_path(base_path)).count() == 2
+    # No malformed rows, no commit.
+    history = delta_spark.sql(f"DESCRIBE HISTORY delta.`{quarantine_path(base_path)}`")
+    assert history.count() == 1
@@ -10,8 +10,10 @@ sys.path.insert(0, str(ROOT))
 
 from workload.quality import (  # noqa: E402
     build_metric_record,
+    evaluate_freshness,
     evaluate_non_null,
     evaluate_uniqueness,
+    evaluate_violations,
     rate,
 )
 
@@ -31,6 +33,26 @@ def test_evaluate_non_null_and_uniqueness():
     assert "distinct_rate" in unique["details"]
 
 
+def test_evaluate_uniqueness_with_relative_error():
+    within = evaluate_uniqueness("id", total_rows=1000, distinct_rows=985, relative_error=0.01)
+    assert within["status"] == "OK"
+    assert within["details"]["relative_error"] == 0.01
+
+    beyond = evaluate_uniqueness("id", total_rows=1000, distinct_rows=950, relative_error=0.01)
+    assert beyond["status"] == "FAIL"
+
+
+def test_evaluate_violations_and_freshness():
+    violations = evaluate_violations("amount_range", 10, 2, {"min_value": 0})
+    assert violations["status"] == "FAIL"
+    assert violations["details"]["violation_rate"] == 0.2
+    assert violations["details"]["min_value"] == 0
+
+    assert evaluate_freshness("event_ts", 60, 3600)["status"] == "OK"
+    assert evaluate_freshness("event_ts", 7200, 3600)["status"] == "FAIL"
+    assert evaluate_freshness("event_ts", None, 3600)["status"] == "FAIL"
+
+
 def test_build_metric_record_shapes_output():
     metric = build_metric_record(
         run_id="run123",
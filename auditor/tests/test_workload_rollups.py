@@ -0,0 +1,97 @@
+"""Tests for the weekly/monthly gold rollups and the unsorted gold plan."""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.pipeline import build_gold_df  # noqa: E402
+from workload.rollups import (  # noqa: E402
+    affected_periods,
+    build_rollup_df,
+    period_end,
+    period_start,
+    refresh_rollups,
+    rollup_path,
+)
+
+
+def test_period_bounds():
+    # 2024-10-02 is a Wednesday.
+    assert period_start(dt.date(2024, 10, 2), "weekly") == dt.date(2024, 9, 30)
+    assert period_start(dt.date(2024, 10, 2), "monthly") == dt.date(2024, 10, 1)
+    assert period_end(dt.date(2024, 9, 30), "weekly") == dt.date(2024, 10, 7)
+    assert period_end(dt.date(2024, 12, 1), "monthly") == dt.date(2025, 1, 1)
+    assert period_end(dt.date(2024, 2, 1), "monthly") == dt.date(2024, 3, 1)
+    with pytest.raises(ValueError):
+        period_start(dt.date(2024, 10, 2), "daily")
+
+
+def test_affected_periods_are_distinct_and_sorted():
+    dates = [dt.date(2024, 10, 8), dt.date(2024, 9, 30), dt.date(2024, 10, 2)]
+
+    assert affected_periods(dates, "weekly") == [dt.date(2024, 9, 30), dt.date(2024, 10, 7)]
+    assert affected_periods(dates, "monthly") == [dt.date(2024, 9, 1), dt.date(2024, 10, 1)]
+    assert affected_periods([], "weekly") == []
+
+
+def _silver(spark):
+    # 14 days from Monday 2024-09-30; purchases on even days, refunds on odd ones.
+    return spark.range(1400).selectExpr(
+        "DATE_ADD(DATE'2024-09-30', CAST(id % 14 AS INT)) AS event_date",
+        "IF(id % 2 = 0, 'purchase', 'refund') AS event_type",
+        "1.0 AS amount",
+        "CONCAT('u', CAST(id % 100 AS STRING)) AS user_id",
+    )
+
+
+def test_gold_plan_has_no_global_sort(spark):
+    plan = build_gold_df(_silver(spark), "r")._jdf.queryExecution().executedPlan().toString()
+
+    assert "rangepartitioning" not in plan.lower()
+    assert "Sort [" not in plan
+
+
+def test_build_rollup_df_sums_and_merges_sketches(spark):
+    gold = build_gold_df(_silver(spark), "r")
+    weekly = {
+        (r["period_start"], r["event_type"]): r
+        for r in build_rollup_df(gold, "weekly", "r").collect()
+    }
+
+    assert set(weekly) == {
+        (week, event_type)
+        for week in (dt.date(2024, 9, 30), dt.date(2024, 10, 7))
+        for event_type in ("purchase", "refund")
+    }
+    row = weekly[(dt.date(2024, 9, 30), "purchase")]
+    assert row["event_count"] == 400
+    assert row["total_amount"] == 400.0
+    # Users recur across days; the merged sketch counts each of the 50 once.
+    assert abs(row["unique_users"] - 50) <= 3
+    assert row["run_id"] == "r"
+
+
+def test_refresh_rollups_replaces_only_touched_periods(delta_spark, tmp_path):
+    base = str(tmp_path)
+    gold_path = f"{base}/gold"
+    build_gold_df(_silver(delta_spark), "r1").write.format("delta").save(gold_path)
+
+    metrics = refresh_rollups(delta_spark, gold_path, base, "r1")
+    assert {m["layer"] for m in metrics} == {"gold_weekly", "gold_monthly"}
+
+    metrics = refresh_rollups(
+        delta_spark, gold_path, base, "r2", event_dates=[dt.date(2024, 10, 8)], rollups=("weekly",)
+    )
+    weekly = delta_spark.read.format("delta").load(rollup_path(base, "weekly"))
+    runs = {r["period_start"]: r["run_id"] for r in weekly.collect()}
+
+    assert {m["metric"]: m["value"] for m in metrics} == {"row_count": 4, "rows_written": 2}
+    assert runs == {dt.date(2024, 9, 30): "r1", dt.date(2024, 10, 7): "r2"}
+    assert weekly.filter("event_type = 'purchase'").agg({"event_count": "sum"}).first()[0] == 700
@@ -0,0 +1,117 @@
+"""Tests for the declarative quality rule engine."""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.rules import (  # noqa: E402
+    AllowedValues,
+    Freshness,
+    NonNull,
+    Range,
+    Regex,
+    Rule,
+    Unique,
+    evaluate_rules,
+    with_relative_error,
+)
+
+
+def test_rules_validate_their_parameters():
+    with pytest.raises(ValueError):
+        Range("amount")
+    with pytest.raises(ValueError):
+        AllowedValues("event_type")
+    with pytest.raises(ValueError):
+        Regex("user_id", "")
+
+
+def test_rule_subclasses_must_implement_the_interface():
+    @dataclass(frozen=True)
+    class Incomplete(Rule):
+        @property
+        def metric_name(self) -> str:
+            return f"{self.column}_incomplete"
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete("id")
+
+
+def test_duplicate_rules_are_rejected():
+    with pytest.raises(ValueError, match="id_non_null"):
+        evaluate_rules(None, [NonNull("id"), NonNull("id")], "run1", "bronze")
+
+
+def test_all_rules_evaluate_in_one_spark_job(spark, count_spark_jobs):
+    df = spark.createDataFrame(
+        [
+            (1, "u1", "purchase", 10.0),
+            (2, "u2", "refund", -5.0),
+            (2, "bad", "view", 5000.0),
+            (3, None, "purchase", None),
+        ],
+        "id int, user_id string, event_type string, amount double",
+    ).selectExpr("*", "current_timestamp() - INTERVAL 1 HOUR AS event_ts")
+    rules = [
+        NonNull("user_id"),
+        Unique("id"),
+        Unique("user_id"),
+        Range("amount", min_value=-100, max_value=1000),
+        AllowedValues("event_type", ("purchase", "refund")),
+        Regex("user_id", r"u\d+"),
+        Freshness("event_ts", max_age_seconds=2 * 3600),
+        Range("id", min_value=1),
+    ]
+
+    metrics, jobs = count_spark_jobs(lambda: evaluate_rules(df, rules, "run1", "bronze"))
+
+    assert jobs == 1
+    by_name = {m["metric"]: m for m in metrics}
+    assert by_name["row_count"]["value"] == 4
+    assert by_name["user_id_non_null"]["value"] == 1
+    assert by_name["id_unique"]["status"] == "FAIL"
+    # Nulls are not duplicates: three distinct values over three non-null rows.
+    assert by_name["user_id_unique"]["status"] == "OK"
+    assert by_name["user_id_unique"]["details"]["null_rows"] == 1
+    assert by_name["amount_range"]["value"] == 1
+    assert by_name["event_type_allowed_values"]["value"] == 1
+    assert by_name["user_id_pattern"]["value"] == 1
+    assert by_name["event_ts_freshness"]["status"] == "OK"
+    assert by_name["id_range"]["status"] == "OK"
+    assert {m["layer"] for m in metrics} == {"bronze"}
+
+
+def test_stale_data_fails_freshness(spark):
+    df = spark.createDataFrame([("2024-10-01 12:00:00",)], "ts string").selectExpr(
+        "CAST(ts AS TIMESTAMP) AS event_ts"
+    )
+
+    (metric,) = evaluate_rules(
+        df,
+        [Freshness("event_ts", max_age_seconds=3600)],
+        "run1",
+        "silver",
+        include_row_count=False,
+    )
+
+    assert metric["status"] == "FAIL"
+    assert metric["value"] > 3600
+
+
+def test_approximate_unique_rule(spark):
+    df = spark.range(20000).selectExpr("id % 10000 AS id", "id AS event_id")
+    rules = with_relative_error([NonNull("id"), Unique("id"), Unique("event_id")], 0.02)
+
+    assert rules[0] == NonNull("id")
+    by_name = {m["metric"]: m for m in evaluate_rules(df, rules, "run1", "bronze")}
+
+    assert by_name["id_unique"]["status"] == "FAIL"
+    assert by_name["event_id_unique"]["status"] == "OK"
+    assert by_name["event_id_unique"]["details"]["relative_error"] == 0.02
@@ -0,0 +1,72 @@
+"""Tests for HLL sketch sizing and approximate gold distinct counts."""
+
+from __future__ import annotations
+
+import datetime as dt
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.pipeline import build_gold_df  # noqa: E402
+from workload.sketches import hll_lg_k, unique_users_between  # noqa: E402
+
+
+def test_hll_lg_k_matches_error_bound():
+    assert hll_lg_k(0.02) == 12
+    assert hll_lg_k(0.5) == 4
+    assert hll_lg_k(0.005) == 16
+    with pytest.raises(ValueError):
+        hll_lg_k(0)
+    with pytest.raises(ValueError):
+        hll_lg_k(0.0001)
+
+
+def _silver(spark):
+    # 3 days x 4000 users; user ids overlap between consecutive days.
+    return spark.range(12000).selectExpr(
+        "DATE_ADD(DATE'2024-10-01', CAST(id % 3 AS INT)) AS event_date",
+        "'purchase' AS event_type",
+        "1.0 AS amount",
+        "CONCAT('u', CAST(id / 2 AS BIGINT)) AS user_id",
+    )
+
+
+def test_approximate_gold_estimates_within_error(spark):
+    silver = _silver(spark)
+    exact = {r["event_date"]: r["unique_users"] for r in build_gold_df(silver, "r").collect()}
+    approx = {
+        r["event_date"]: r["unique_users"]
+        for r in build_gold_df(silver, "r", distinct_error=0.02).collect()
+    }
+
+    assert exact.keys() == approx.keys()
+    for day, count in exact.items():
+        assert abs(approx[day] - count) <= 3 * 0.02 * count
+
+
+def test_gold_sketches_merge_across_dates(spark):
+    from pyspark.sql import functions as F  # noqa: N812
+
+    gold = build_gold_df(_silver(spark), "r")
+    merged = gold.agg(
+        F.hll_sketch_estimate(F.hll_union_agg("user_sketch", True)).alias("users")
+    ).first()["users"]
+
+    assert abs(merged - 6000) <= 3 * 0.02 * 6000
+    assert merged < sum(r["unique_users"] for r in gold.collect())
+
+
+def test_unique_users_between_reads_gold_sketches(delta_spark, tmp_path):
+    path = str(tmp_path / "gold")
+    build_gold_df(_silver(delta_spark), "r").write.format("delta").save(path)
+
+    one_day = unique_users_between(delta_spark, path, dt.date(2024, 10, 1), dt.date(2024, 10, 1))
+    all_days = unique_users_between(delta_spark, path, dt.date(2024, 10, 1), dt.date(2024, 10, 3))
+
+    assert abs(one_day - 4000) <= 3 * 0.02 * 4000
+    assert abs(all_days - 6000) <= 3 * 0.02 * 6000
+    assert unique_users_between(delta_spark, path, dt.date(2025, 1, 1), dt.date(2025, 1, 2)) == 0
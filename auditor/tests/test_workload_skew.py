@@ -0,0 +1,89 @@
+"""Tests for skew-aware gold aggregation strategies."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.pipeline import build_gold_df  # noqa: E402
+from workload.skew import (  # noqa: E402
+    DISTINCT_STRATEGIES,
+    choose_distinct_strategy,
+    observed_group_rows,
+)
+from workload.synthetic import SyntheticConfig, generate_events  # noqa: E402
+
+
+def test_choose_distinct_strategy():
+    # 60 even keys on 200 tasks: not hot, but too few keys to fill the tasks.
+    assert choose_distinct_strategy([50_000] * 60, 200) == "two_phase"
+    # Same keys on 8 tasks: plain groupBy is balanced.
+    assert choose_distinct_strategy([50_000] * 60, 8) == "single"
+    # One key with 95% of the rows is hot even on few tasks.
+    assert choose_distinct_strategy([9_500_000, 500_000], 8) == "salted"
+    # Small inputs never pay for extra shuffles.
+    assert choose_distinct_strategy([9_500, 500], 8) == "single"
+    assert choose_distinct_strategy([], 8) == "single"
+    assert choose_distinct_strategy([9_500, 500], 8, min_rows=0) == "salted"
+
+
+def _skewed_silver(spark):
+    config = SyntheticConfig(
+        rows=20_000,
+        users=500,
+        event_mix={"purchase": 0.95, "refund": 0.05},
+        key_skew=2.0,
+        null_rate=0.01,
+        days=3,
+    )
+    return generate_events(spark, config).selectExpr(
+        "TO_DATE(ts) AS event_date", "event_type", "amount", "user_id"
+    )
+
+
+def test_skewed_synthetic_data_is_salted(spark):
+    rows = observed_group_rows(_skewed_silver(spark))
+
+    assert sum(rows) == 20_000
+    assert choose_distinct_strategy(rows, 16, min_rows=0) == "salted"
+
+
+def _collect(gold):
+    return {
+        (r["event_date"], r["event_type"]): (
+            r["event_count"],
+            round(r["total_amount"], 6),
+            r["unique_users"],
+        )
+        for r in gold.collect()
+    }
+
+
+def test_strategies_produce_identical_gold(spark):
+    silver = _skewed_silver(spark)
+    expected = _collect(build_gold_df(silver, "r", distinct_strategy="single"))
+
+    for strategy in DISTINCT_STRATEGIES[1:]:
+        assert _collect(build_gold_df(silver, "r", distinct_strategy=strategy)) == expected
+
+
+def test_salted_sketch_estimates_stay_within_error(spark):
+    silver = _skewed_silver(spark)
+    exact = _collect(build_gold_df(silver, "r"))
+    # Merged partial sketches may round differently from one sketch per key.
+    salted = _collect(build_gold_df(silver, "r", 0.02, "salted"))
+
+    assert salted.keys() == exact.keys()
+    for key, (count, amount, users) in exact.items():
+        assert salted[key][:2] == (count, amount)
+        assert abs(salted[key][2] - users) <= 3 * 0.02 * users
+
+
+def test_unknown_strategy_is_rejected(spark):
+    with pytest.raises(ValueError, match="Unknown distinct strategy"):
+        build_gold_df(_skewed_silver(spark), "r", distinct_strategy="random")
@@ -0,0 +1,104 @@
+"""Local-mode tests for the streaming bronze -> silver path."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.pipeline import ingest_bronze  # noqa: E402
+from workload.streaming import (  # noqa: E402
+    RAW_EVENT_SCHEMA,
+    deduplicate_stream,
+    run_streaming,
+)
+
+
+def _land(directory: Path, name: str, events) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    event = {"event_type": "purchase", "amount": 1.0, "ts": "2024-10-01T12:00:00Z"}
+    lines = [json.dumps({"id": i, "user_id": f"u{i}", **event}) for i in events]
+    (directory / name).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _drain(stream_df, checkpoint: Path, table: str) -> None:
+    query = (
+        stream_df.writeStream.format("memory")
+        .queryName(table)
+        .option("checkpointLocation", str(checkpoint))
+        .trigger(availableNow=True)
+        .start()
+    )
+    query.awaitTermination()
+
+
+def test_deduplicate_stream_drops_ids_across_micro_batches(spark, tmp_path):
+    from pyspark.sql import functions as F  # noqa: N812
+
+    landing = tmp_path / "landing"
+    _land(landing, "a.json", [1, 2, 2, 3])
+    _land(landing, "b.json", [3, 4])
+    stream = (
+        spark.readStream.format("json")
+        .schema(RAW_EVENT_SCHEMA)
+        .option("maxFilesPerTrigger", 1)
+        .load(str(landing))
+        .withColumn("ingested_at", F.current_timestamp())
+    )
+
+    _drain(deduplicate_stream(stream), tmp_path / "_checkpoint", "dedup_events")
+
+    ids = sorted(row["id"] for row in spark.table("dedup_events").collect())
+    assert ids == [1, 2, 3, 4]
+
+
+def test_run_streaming_processes_only_new_files(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    landing = tmp_path / "landing"
+    _land(landing, "a.json", [1, 2, 2])
+
+    first = run_streaming(delta_spark, base_path, "run1")
+    _land(landing, "b.json", [2, 3])
+    second = run_streaming(delta_spark, base_path, "run2")
+    third = run_streaming(delta_spark, base_path, "run3")
+
+    assert (first["bronze_rows"], second["bronze_rows"], third["bronze_rows"]) == (3, 2, 0)
+    silver = delta_spark.read.format("delta").load(first["silver_path"])
+    assert sorted(row["id"] for row in silver.collect()) == [1, 2, 3]
+    assert silver.filter("id = 3").first()["run_id"] == "run2"
+
+
+def test_run_streaming_quarantines_unparseable_timestamps(delta_spark, tmp_path):
+    landing = tmp_path / "landing"
+    landing.mkdir()
+    bad = {"id": 9, "user_id": "u9", "event_type": "purchase", "amount": 1.0, "ts": "soon"}
+    (landing / "bad.json").write_text(json.dumps(bad) + "\n", encoding="utf-8")
+    _land(landing, "good.json", [1, 2])
+
+    result = run_streaming(delta_spark, str(tmp_path), "run1")
+
+    bronze = delta_spark.read.format("delta").load(result["bronze_path"])
+    quarantine = delta_spark.read.format("delta").load(str(tmp_path / "bronze_quarantine"))
+    assert sorted(row["id"] for row in bronze.collect()) == [1, 2]
+    # The quarantined row is not counted as written to bronze.
+    assert result["bronze_rows"] == 2
+    assert [(row["id"], row["quarantine_reason"]) for row in quarantine.collect()] == [
+        (9, "unparseable_ts")
+    ]
+
+
+def test_bronze_stream_skips_batch_overwrites(delta_spark, tmp_path):
+    base_path = str(tmp_path)
+    _land(tmp_path / "landing", "a.json", [1, 2])
+    run_streaming(delta_spark, base_path, "run1")
+
+    ingest_bronze(delta_spark, base_path, "batch")
+    _land(tmp_path / "landing", "b.json", [3])
+    result = run_streaming(delta_spark, base_path, "run2")
+
+    assert (result["bronze_rows"], result["silver_input_rows"]) == (1, 1)
+    silver = delta_spark.read.format("delta").load(result["silver_path"])
+    assert sorted(row["id"] for row in silver.collect()) == [1, 2, 3]
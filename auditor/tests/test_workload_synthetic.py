@@ -0,0 +1,97 @@
+"""Tests for the synthetic event generator."""
+
+from __future__ import annotations
+
+import datetime as _dt
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from workload.synthetic import (  # noqa: E402
+    SyntheticConfig,
+    _utc_timestamp_string,
+    generate_events,
+    parse_event_mix,
+)
+
+
+def test_parse_event_mix():
+    assert parse_event_mix("purchase:0.8, refund:0.2") == {"purchase": 0.8, "refund": 0.2}
+    assert parse_event_mix("view,") == {"view": 1.0}
+
+
+def test_synthetic_config_validates_rates():
+    with pytest.raises(ValueError):
+        SyntheticConfig(rows=10, null_rate=1.5)
+    with pytest.raises(ValueError):
+        SyntheticConfig(rows=0)
+    with pytest.raises(ValueError):
+        SyntheticConfig(rows=10, event_mix={"purchase": 0.0})
+
+
+def test_generate_events_matches_requested_shape(spark):
+    config = SyntheticConfig(
+        rows=20_000,
+        users=500,
+        event_mix={"purchase": 0.9, "refund": 0.1},
+        key_skew=2.0,
+        duplicate_rate=0.1,
+        null_rate=0.05,
+        days=10,
+    )
+    events = generate_events(spark, config)
+
+    assert events.columns == ["id", "user_id", "event_type", "amount", "ts"]
+    stats = events.selectExpr(
+        "count(*) AS rows",
+        "count(DISTINCT id) AS ids",
+        "count_if(amount IS NULL) AS nulls",
+        "count_if(event_type = 'purchase') AS purchases",
+        "count_if(event_type = 'refund' AND amount > 0) AS positive_refunds",
+        "count(DISTINCT substr(ts, 1, 10)) AS days",
+    ).first()
+
+    assert stats["rows"] == 20_000
+    assert 0.85 < stats["ids"] / 20_000 < 0.95
+    assert 0.03 < stats["nulls"] / 20_000 < 0.07
+    assert 0.87 < stats["purchases"] / 20_000 < 0.93
+    assert stats["positive_refunds"] == 0
+    assert stats["days"] == 10
+
+    top_user_share = events.groupBy("user_id").count().agg({"count": "max"}).first()[0] / 20_000
+    assert top_user_share > 10 / config.users
+
+
+def test_generate_events_is_deterministic_across_partitioning(spark):
+    small = generate_events(spark, SyntheticConfig(rows=1000, partitions=1))
+    wide = generate_events(spark, SyntheticConfig(rows=1000, partitions=7))
+
+    assert small.exceptAll(wide).count() == 0
+
+
+def test_timestamps_are_utc_in_any_session_time_zone(spark):
+    from pyspark.sql import functions as F  # noqa: N812
+
+    # 02:30 UTC on 2024-03-10 falls in New York's DST gap.
+    epochs = [0, 1710037800, 1730597400, 1727784000]
+    expected = [
+        _dt.datetime.fromtimestamp(epoch, _dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for epoch in epochs
+    ]
+    previous = spark.conf.get("spark.sql.session.timeZone")
+    spark.conf.set("spark.sql.session.timeZone", "America/New_York")
+    try:
+        rendered = [
+            row["ts"]
+            for row in spark.createDataFrame([(e,) for e in epochs], "epoch long")
+            .select(_utc_timestamp_string(F.col("epoch")).alias("ts"))
+            .collect()
+        ]
+    finally:
+        spark.conf.set("spark.sql.session.timeZone", previous)
+
+    assert rendered == expected
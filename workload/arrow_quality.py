@@ -0,0 +1,264 @@
+"""Spark-free quality checks for exported Parquet files.
+
+Streams Parquet files (or directories of them, with ``key=value`` partition
+folders) in record batches with pyarrow and computes the ``NonNull`` and
+``Unique`` profiles with vectorized column operations. The profile goes through
+``records_from_profile``, so the records are the same ``build_metric_record``
+rows ``evaluate_rules`` produces on Spark. Check an export locally or in CI with::
+
+    python -m workload.arrow_quality exports/bronze --layer bronze --unique id
+
+Memory stays bounded: null counts come from each batch, and uniqueness buffers
+the distinct values of a column until ``max_values_in_memory`` is reached, then
+spills them as a sorted run to an Arrow file. At the end the runs are merged one
+chunk per run at a time: every value up to the smallest chunk maximum is taken
+from all runs with Arrow compute kernels and counted with ``unique``. Uniqueness
+is always exact here; ``Unique`` rules with ``relative_error`` are evaluated
+as exact rules.
+
+Point it at exported files, not at a Delta table directory: its data files
+include ones already removed from the table, which only the Delta log knows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from dataclasses import replace
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
+
+from workload.rules import NonNull, Rule, Unique, check_rule_names, records_from_profile
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+DEFAULT_BATCH_SIZE = 64 * 1024
+
+# Distinct values buffered per ``Unique`` column before spilling a sorted run.
+DEFAULT_MAX_VALUES_IN_MEMORY = 1_000_000
+
+SUPPORTED_RULES = (NonNull, Unique)
+
+
+class _DistinctCounter:
+    """Exact distinct count of one column over batches, spilling sorted runs to disk.
+
+    NaN does not order against other floats, so it is kept out of the runs and
+    counted as one value when seen, as Spark's ``countDistinct`` does.
+    """
+
+    def __init__(self, spill_dir: str, name: str, max_values: int, chunk_size: int) -> None:
+        self._spill_dir = spill_dir
+        self._name = name
+        self._max_values = max_values
+        self._chunk_size = chunk_size
+        self._buffer: List["pa.Array"] = []
+        self._buffered = 0
+        self._runs: List[str] = []
+        self._saw_nan = False
+
+    def add(self, values: "pa.Array") -> None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        values = values.drop_null()
+        if pa.types.is_floating(values.type):
+            nan = pc.is_nan(values)
+            if pc.any(nan).as_py():
+                self._saw_nan = True
+                values = values.filter(pc.invert(nan))
+        values = pc.unique(values)
+        self._buffer.append(values)
+        self._buffered += len(values)
+        if self._buffered > self._max_values:
+            self._spill()
+
+    def _distinct_buffer(self) -> "pa.Array":
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if not self._buffer:
+            return pa.array([])
+        values = pc.unique(pa.concat_arrays(self._buffer))
+        self._buffer = []
+        self._buffered = 0
+        return values
+
+    def _spill(self) -> None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        values = self._distinct_buffer()
+        values = values.take(pc.sort_indices(values))
+        path = os.path.join(self._spill_dir, f"{self._name}_{len(self._runs):05d}.arrow")
+        table = pa.table({"value": values})
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=self._chunk_size)
+        self._runs.append(path)
+
+    def _read_run(self, path: str) -> Iterator["pa.Array"]:
+        import pyarrow as pa
+
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                chunk = reader.get_batch(index).column(0)
+                if len(chunk):
+                    yield chunk
+
+    def count(self) -> int:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        nan = int(self._saw_nan)
+        if not self._runs:
+            return len(self._distinct_buffer()) + nan
+        if self._buffer:
+            self._spill()
+        runs = [self._read_run(path) for path in self._runs]
+        heads = {index: next(run, None) for index, run in enumerate(runs)}
+        heads = {index: head for index, head in heads.items() if head is not None}
+        distinct = 0
+        while heads:
+            # Every value up to the smallest chunk maximum is in the current chunks,
+            # since each run is sorted and holds a value at most once.
+            bound = min(head[len(head) - 1].as_py() for head in heads.values())
+            taken = []
+            for index, head in list(heads.items()):
+                upto = pc.sum(pc.less_equal(head, bound)).as_py() or 0
+                if upto:
+                    taken.append(head.slice(0, upto))
+                if upto < len(head):
+                    heads[index] = head.slice(upto)
+                else:
+                    following = next(runs[index], None)
+                    if following is None:
+                        del heads[index]
+                    else:
+                        heads[index] = following
+            # The run holding the bound always gives up its chunk; anything else
+            # means the values do not order and the loop would never end.
+            if not taken:
+                raise RuntimeError(f"Spilled runs of {self._name} stopped merging at {bound!r}")
+            distinct += len(pc.unique(pa.concat_arrays(taken)))
+        return distinct + nan
+
+
+def _columns(rules: Sequence[Rule]) -> List[str]:
+    return list(dict.fromkeys(rule.column for rule in rules))
+
+
+def check_parquet(
+    paths: Sequence[str],
+    rules: Sequence[Rule],
+    run_id: str,
+    layer: str,
+    include_row_count: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_values_in_memory: int = DEFAULT_MAX_VALUES_IN_MEMORY,
+    spill_dir: Optional[str] = None,
+) -> List[Dict[str, object]]:
+    """Evaluate ``rules`` on the Parquet files under ``paths`` and return metric records.
+
+    Only ``NonNull`` and ``Unique`` rules are supported. Only the columns the
+    rules name are read. Distinct counts are exact, so ``relative_error`` on a
+    ``Unique`` rule is ignored. Sorted runs are spilled to a temporary directory
+    under ``spill_dir`` (default: the system temp dir) and removed afterwards.
+    """
+    import pyarrow.dataset as ds
+
+    check_rule_names(rules)
+    unsupported = sorted(
+        {type(rule).__name__ for rule in rules if not isinstance(rule, SUPPORTED_RULES)}
+    )
+    if unsupported:
+        raise ValueError(f"Rules not supported without Spark: {unsupported}")
+    rules = tuple(
+        replace(rule, relative_error=None) if isinstance(rule, Unique) else rule
+        for rule in rules
+    )
+
+    dataset = ds.dataset(
+        [ds.dataset(path, format="parquet", partitioning="hive") for path in paths]
+    )
+    columns = _columns(rules)
+    missing = sorted(set(columns) - set(dataset.schema.names))
+    if missing:
+        raise ValueError(f"Columns not found in {list(paths)}: {missing}")
+
+    total_rows = 0
+    nulls = {column: 0 for column in columns}
+    with tempfile.TemporaryDirectory(prefix="arrow_quality_", dir=spill_dir) as tmp:
+        unique_columns = [rule.column for rule in rules if isinstance(rule, Unique)]
+        counters = {
+            column: _DistinctCounter(tmp, f"c{index}", max_values_in_memory, batch_size)
+            for index, column in enumerate(unique_columns)
+        }
+        for batch in dataset.to_batches(columns=columns, batch_size=batch_size):
+            total_rows += batch.num_rows
+            for column in columns:
+                values = batch.column(column)
+                nulls[column] += values.null_count
+                if column in counters:
+                    counters[column].add(values)
+        distinct = {column: counter.count() for column, counter in counters.items()}
+
+    profile: Dict[str, object] = {}
+    for rule in rules:
+        if isinstance(rule, NonNull):
+            profile[rule._key("nulls")] = nulls[rule.column]
+        else:
+            profile[rule._key("distinct")] = distinct[rule.column]
+            profile[rule._key("non_null")] = total_rows - nulls[rule.column]
+    return records_from_profile(rules, profile, total_rows, run_id, layer, include_row_count)
+
+
+def main(argv: List[str]) -> int:
+    """Print the metric records for the given files; exit 1 when a check fails."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="Parquet files or directories")
+    parser.add_argument("--layer", required=True, help="Layer name recorded on the metrics")
+    parser.add_argument("--run-id", default="local", help="Run id recorded on the metrics")
+    parser.add_argument(
+        "--non-null", action="append", default=[], help="Column that must not be null"
+    )
+    parser.add_argument("--unique", action="append", default=[], help="Column that must be unique")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--max-values-in-memory",
+        type=int,
+        default=DEFAULT_MAX_VALUES_IN_MEMORY,
+        help="Distinct values buffered per unique column before spilling to disk",
+    )
+    parser.add_argument("--spill-dir", default=None, help="Directory for spilled runs")
+    args = parser.parse_args(argv)
+
+    rules: Sequence[Rule] = tuple(NonNull(column) for column in args.non_null) + tuple(
+        Unique(column) for column in args.unique
+    )
+    if not rules:
+        from workload.pipeline import DEFAULT_RULES
+
+        rules = tuple(
+            rule for rule in DEFAULT_RULES.get(args.layer, ()) if isinstance(rule, SUPPORTED_RULES)
+        )
+
+    records = check_parquet(
+        args.paths,
+        rules,
+        args.run_id,
+        args.layer,
+        batch_size=args.batch_size,
+        max_values_in_memory=args.max_values_in_memory,
+        spill_dir=args.spill_dir,
+    )
+    print(json.dumps(records, indent=2, default=str))
+    return 1 if any(record["status"] == "FAIL" for record in records) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI behavior
+    sys.exit(main(sys.argv[1:]))
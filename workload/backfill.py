@@ -0,0 +1,244 @@
+"""Concurrent date-range backfill of silver and gold from bronze.
+
+The date range is cut into slices of ``slice_days``; each slice rebuilds its
+``event_date`` partitions of silver and gold with ``replaceWhere`` overwrites.
+Slices run concurrently on a thread pool inside one SparkSession, each thread
+in its own FAIR scheduler pool so a large slice cannot starve the others
+(the session needs ``spark.scheduler.mode=FAIR``, the default on Databricks).
+
+Bronze is deduplicated once per backfill and kept persisted while the slices
+run; each slice filters its dates from it instead of shuffling all of bronze.
+
+Every slice attempt is recorded in ``{base_path}/_state/backfill_progress``.
+Failed slices are retried up to ``max_attempts`` times, and re-running the same
+backfill skips slices that already succeeded.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from workload.execution_metrics import track_stage
+from workload.metrics import MetricsSink
+from workload.pipeline import (
+    DEFAULT_LAYOUTS,
+    DEFAULT_RULES,
+    TableLayout,
+    _clean_bronze,
+    _table_version,
+    aggregate_gold,
+    maintain_layout,
+    transform_silver,
+)
+from workload.rules import Rule
+from workload.state import completed_backfill_slices, record_backfill_slice
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame, SparkSession
+
+
+DateSlice = Tuple[_dt.date, _dt.date]
+
+
+def date_slices(start: _dt.date, end: _dt.date, slice_days: int = 1) -> List[DateSlice]:
+    """Split ``start``..``end`` (inclusive) into consecutive slices of ``slice_days``."""
+    if end < start:
+        raise ValueError(f"Backfill end {end} is before start {start}")
+    if slice_days < 1:
+        raise ValueError("slice_days must be at least 1")
+
+    slices = []
+    slice_start = start
+    while slice_start <= end:
+        slice_end = min(slice_start + _dt.timedelta(days=slice_days - 1), end)
+        slices.append((slice_start, slice_end))
+        slice_start = slice_end + _dt.timedelta(days=1)
+    return slices
+
+
+def _dates(date_slice: DateSlice) -> List[_dt.date]:
+    start, end = date_slice
+    return [start + _dt.timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+def _deduplicated_bronze(spark: "SparkSession", bronze_path: str) -> "DataFrame":
+    """Deduplicate the current bronze version once and persist it for all slices."""
+    bronze_df = (
+        spark.read.format("delta")
+        .option("versionAsOf", _table_version(spark, bronze_path))
+        .load(bronze_path)
+    )
+    clean_df = _clean_bronze(bronze_df).persist()
+    # Materialize before the slices start so they do not each run the shuffle.
+    clean_df.count()
+    return clean_df
+
+
+def _run_slice(
+    spark: "SparkSession",
+    base_path: str,
+    run_id: str,
+    date_slice: DateSlice,
+    layouts: Dict[str, TableLayout],
+    rules: Dict[str, Sequence[Rule]],
+    gold_lock: threading.Lock,
+    clean_bronze_df: "DataFrame",
+) -> None:
+    event_dates = _dates(date_slice)
+    sink = MetricsSink(spark, base_path)
+    try:
+        with track_stage(spark, run_id, "silver", sink):
+            silver_path = transform_silver(
+                spark,
+                f"{base_path}/bronze",
+                base_path,
+                run_id,
+                layout=layouts["silver"],
+                rules=rules["silver"],
+                event_dates=event_dates,
+                sink=sink,
+                clean_bronze_df=clean_bronze_df,
+            )
+        # Gold is not partitioned, so concurrent replaceWhere overwrites of it
+        # would conflict; its (small) slices are written one at a time.
+        with gold_lock, track_stage(spark, run_id, "gold", sink):
+            aggregate_gold(
+                spark,
+                silver_path,
+                base_path,
+                run_id,
+                event_dates=event_dates,
+                layout=layouts["gold"],
+                rules=rules["gold"],
+                sink=sink,
+            )
+    finally:
+        sink.flush()
+
+
+def run_backfill(
+    spark: "SparkSession",
+    base_path: str,
+    start: _dt.date,
+    end: _dt.date,
+    parallelism: int = 4,
+    slice_days: int = 1,
+    max_attempts: int = 3,
+    backfill_id: Optional[str] = None,
+    layouts: Dict[str, TableLayout] | None = None,
+    rules: Dict[str, Sequence[Rule]] | None = None,
+) -> Dict[str, object]:
+    """Rebuild silver and gold for ``start``..``end`` from the existing bronze table.
+
+    ``backfill_id`` (default: derived from the range and slice size) identifies
+    the backfill in the progress table; re-running with the same id resumes it.
+    Raises ``RuntimeError`` listing the slices that still failed after
+    ``max_attempts``, once every other slice has finished.
+    """
+    slices = date_slices(start, end, slice_days)
+    backfill_id = backfill_id or f"backfill_{start:%Y%m%d}_{end:%Y%m%d}_{slice_days}d"
+    layouts = {**DEFAULT_LAYOUTS, **(layouts or {})}
+    rules = {**DEFAULT_RULES, **(rules or {})}
+    # Compaction and table properties are applied once at the end: concurrent
+    # OPTIMIZE/ALTER commits would conflict with the other slices' writes.
+    slice_layouts = {
+        layer: replace(layout, optimize_after_write=False, target_file_size=None)
+        for layer, layout in layouts.items()
+    }
+
+    done = completed_backfill_slices(spark, base_path, backfill_id)
+    pending = [date_slice for date_slice in slices if date_slice not in done]
+    print(
+        f"[{backfill_id}] {len(slices)} slices, {len(slices) - len(pending)} already done, "
+        f"running {len(pending)} with parallelism {parallelism}"
+    )
+
+    pools = threading.local()
+    pool_ids = iter(range(parallelism))
+    pool_lock = threading.Lock()
+    gold_lock = threading.Lock()
+
+    def run_with_retries(date_slice: DateSlice) -> Optional[str]:
+        if not hasattr(pools, "name"):
+            with pool_lock:
+                pools.name = f"backfill-{next(pool_ids)}"
+            spark.sparkContext.setLocalProperty("spark.scheduler.pool", pools.name)
+        run_id = f"{backfill_id}_{date_slice[0]:%Y%m%d}"
+        error = None
+        for attempt in range(1, max_attempts + 1):
+            try:
+                _run_slice(
+                    spark,
+                    base_path,
+                    run_id,
+                    date_slice,
+                    slice_layouts,
+                    rules,
+                    gold_lock,
+                    clean_bronze_df,
+                )
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+                record_backfill_slice(
+                    spark,
+                    base_path,
+                    backfill_id,
+                    *date_slice,
+                    status="FAILED",
+                    attempt=attempt,
+                    run_id=run_id,
+                    error=error[:1000],
+                )
+                if attempt < max_attempts:
+                    time.sleep(min(2**attempt, 30))
+                continue
+            record_backfill_slice(
+                spark,
+                base_path,
+                backfill_id,
+                *date_slice,
+                status="SUCCEEDED",
+                attempt=attempt,
+                run_id=run_id,
+            )
+            return None
+        return error
+
+    failed: Dict[str, str] = {}
+    clean_bronze_df = _deduplicated_bronze(spark, f"{base_path}/bronze") if pending else None
+    try:
+        with ThreadPoolExecutor(max_workers=parallelism) as executor:
+            futures = {executor.submit(run_with_retries, s): s for s in pending}
+            for finished, future in enumerate(as_completed(futures), start=1):
+                date_slice = futures[future]
+                error = future.result()
+                label = f"{date_slice[0]}..{date_slice[1]}"
+                if error:
+                    failed[label] = error
+                print(
+                    f"[{backfill_id}] {finished}/{len(pending)} {label} "
+                    f"{'FAILED: ' + error if error else 'done'}"
+                )
+    finally:
+        if clean_bronze_df is not None:
+            clean_bronze_df.unpersist()
+
+    if len(failed) < len(pending):
+        where = f"event_date BETWEEN DATE'{start.isoformat()}' AND DATE'{end.isoformat()}'"
+        for layer in ("silver", "gold"):
+            maintain_layout(spark, f"{base_path}/{layer}", layouts[layer], where=where)
+
+    if failed:
+        raise RuntimeError(f"Backfill {backfill_id} failed for slices: {sorted(failed)}")
+
+    return {
+        "backfill_id": backfill_id,
+        "slices": len(slices),
+        "skipped": len(slices) - len(pending),
+        "completed": len(pending),
+    }
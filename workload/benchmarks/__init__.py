@@ -0,0 +1 @@
+"""Local-mode Spark benchmarks for the workload pipeline."""
@@ -0,0 +1,79 @@
+"""Shared helpers for the local-mode Spark benchmarks."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame, SparkSession
+
+
+def local_spark(app_name: str, cores: str = "*") -> "SparkSession":
+    """Create a ``local[cores]`` SparkSession with Delta Lake enabled."""
+    from delta import configure_spark_with_delta_pip
+    from pyspark.sql import SparkSession
+
+    builder = (
+        SparkSession.builder.master(f"local[{cores}]")
+        .appName(app_name)
+        .config("spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension")
+        .config(
+            "spark.sql.catalog.spark_catalog",
+            "org.apache.spark.sql.delta.catalog.DeltaCatalog",
+        )
+        .config("spark.ui.showConsoleProgress", "false")
+    )
+    return configure_spark_with_delta_pip(builder).getOrCreate()
+
+
+def _collect_scan_nodes(plan, nodes: list) -> None:
+    """Walk a physical plan (including adaptive query stages) collecting file scans."""
+    name = plan.nodeName()
+    if name == "AdaptiveSparkPlan":
+        _collect_scan_nodes(plan.executedPlan(), nodes)
+        return
+    if name.endswith("QueryStage"):
+        _collect_scan_nodes(plan.plan(), nodes)
+        return
+    if name.startswith("Scan "):
+        nodes.append(plan)
+    children = plan.children()
+    for index in range(children.size()):
+        _collect_scan_nodes(children.apply(index), nodes)
+
+
+def scan_stats(df: "DataFrame") -> Dict[str, int]:
+    """Execute ``df`` and return the number of files and bytes its scans read.
+
+    Reads the SQL metrics of the executed plan's file scan nodes, i.e. what is
+    left after partition pruning and data skipping.
+    """
+    df.collect()
+    nodes: list = []
+    _collect_scan_nodes(df._jdf.queryExecution().executedPlan(), nodes)
+
+    stats = {"files_read": 0, "bytes_read": 0}
+    for node in nodes:
+        metrics = node.metrics()
+        for metric, key in (("numFiles", "files_read"), ("filesSize", "bytes_read")):
+            value = metrics.get(metric)
+            if value.isDefined():
+                stats[key] += int(value.get().value())
+    return stats
+
+
+def table_stats(spark: "SparkSession", path: str) -> Dict[str, int]:
+    """Return the total number of files and bytes of a Delta table."""
+    detail = spark.sql(f"DESCRIBE DETAIL delta.`{path}`").collect()[0]
+    return {"files_total": int(detail["numFiles"]), "bytes_total": int(detail["sizeInBytes"])}
+
+
+def write_results(results: object, out: str | None) -> None:
+    """Print results as JSON and optionally write them to ``out``."""
+    text = json.dumps(results, indent=2, default=str)
+    print(text)
+    if out:
+        Path(out).parent.mkdir(parents=True, exist_ok=True)
+        Path(out).write_text(text + "\n", encoding="utf-8")
@@ -0,0 +1,153 @@
+"""Measure how much data the analytics queries skip under each table layout.
+
+Builds a synthetic silver table spanning ``--days`` event dates, writes it (and
+the gold table aggregated from it) once without layout settings and once with
+``DEFAULT_LAYOUTS``, then runs date-filtered versions of the queries in
+``workload/sql/analytics_queries.sql`` and reports files/bytes read versus the
+table totals.
+
+    python -m workload.benchmarks.layout_skipping --rows 2000000 --days 90 --out layout.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+from workload.benchmarks.common import local_spark, scan_stats, table_stats, write_results
+from workload.pipeline import (
+    DEFAULT_LAYOUTS,
+    TableLayout,
+    aggregate_gold,
+    maintain_layout,
+    write_layer,
+)
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame, SparkSession
+
+LAYOUT_VARIANTS: Dict[str, Dict[str, TableLayout]] = {
+    "no_layout": {"silver": TableLayout(), "gold": TableLayout()},
+    "default_layout": {"silver": DEFAULT_LAYOUTS["silver"], "gold": DEFAULT_LAYOUTS["gold"]},
+}
+
+
+def _synthetic_silver(spark: "SparkSession", rows: int, days: int, end: _dt.date) -> "DataFrame":
+    from pyspark.sql import functions as F
+
+    return (
+        spark.range(rows)
+        .withColumn("user_id", F.concat(F.lit("u"), (F.col("id") % 10_000).cast("string")))
+        .withColumn(
+            "event_type",
+            F.when(F.col("id") % 3 == 2, F.lit("refund")).otherwise(F.lit("purchase")),
+        )
+        .withColumn("amount", (F.col("id") % 1000) / 10.0)
+        .withColumn("event_date", F.date_sub(F.lit(end), (F.col("id") % days).cast("int")))
+        .withColumn("event_ts", F.col("event_date").cast("timestamp"))
+        .withColumn("run_id", F.lit("layout-benchmark"))
+    )
+
+
+def _queries(
+    end: _dt.date, window_days: int
+) -> List[Tuple[str, str, Callable[["DataFrame"], "DataFrame"]]]:
+    """Return ``(table, query name, query)`` triples restricted to the date window."""
+    from pyspark.sql import functions as F
+
+    start = end - _dt.timedelta(days=window_days - 1)
+    in_window = F.col("event_date").between(F.lit(start), F.lit(end))
+    refunds = F.when(F.col("event_type") == "refund", F.col("total_amount")).otherwise(0)
+    return [
+        (
+            "gold",
+            "daily_revenue_by_event_type",
+            lambda gold: gold.filter(in_window)
+            .groupBy("event_date", "event_type")
+            .agg(F.sum("event_count"), F.sum("total_amount")),
+        ),
+        (
+            "gold",
+            "refund_ratio",
+            lambda gold: gold.filter(in_window)
+            .groupBy("event_date")
+            .agg(F.sum(refunds), F.sum("total_amount")),
+        ),
+        (
+            "silver",
+            "daily_rollup",
+            lambda silver: silver.filter(in_window)
+            .groupBy("event_date", "event_type")
+            .agg(F.count("*"), F.sum("amount")),
+        ),
+    ]
+
+
+def run_benchmark(
+    spark: "SparkSession", work_dir: str, rows: int, days: int, window_days: int
+) -> List[Dict[str, object]]:
+    """Write each layout variant and measure scan volume of the analytics queries."""
+    end = _dt.date(2024, 12, 31)
+    silver_df = _synthetic_silver(spark, rows, days, end)
+    results: List[Dict[str, object]] = []
+
+    for variant, layouts in LAYOUT_VARIANTS.items():
+        base_path = f"{work_dir}/{variant}"
+        silver_path = f"{base_path}/silver"
+        write_layer(silver_df, silver_path, layouts["silver"])
+        maintain_layout(spark, silver_path, layouts["silver"])
+        gold_path = aggregate_gold(
+            spark, silver_path, base_path, "layout-benchmark", layout=layouts["gold"]
+        )
+        tables = {"silver": silver_path, "gold": gold_path}
+
+        for table, query_name, query in _queries(end, window_days):
+            df = query(spark.read.format("delta").load(tables[table]))
+            started = time.perf_counter()
+            scanned = scan_stats(df)
+            elapsed = time.perf_counter() - started
+            totals = table_stats(spark, tables[table])
+            results.append(
+                {
+                    "layout": variant,
+                    "table": table,
+                    "query": query_name,
+                    "seconds": round(elapsed, 3),
+                    **scanned,
+                    **totals,
+                    "bytes_skipped_pct": round(
+                        100.0 * (1 - scanned["bytes_read"] / max(totals["bytes_total"], 1)), 1
+                    ),
+                }
+            )
+    return results
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic silver rows")
+    parser.add_argument("--days", type=int, default=90, help="Distinct event dates")
+    parser.add_argument("--window-days", type=int, default=7, help="Query date window")
+    parser.add_argument("--work-dir", default=None, help="Table directory (default: temp dir)")
+    parser.add_argument("--out", default=None, help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    spark = local_spark("layout-skipping-benchmark")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = run_benchmark(
+                spark, args.work_dir or tmp, args.rows, args.days, args.window_days
+            )
+    finally:
+        spark.stop()
+
+    write_results(results, args.out)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI behavior
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,143 @@
+"""Measure metrics-table lookup latency as the table grows, before and after compaction.
+
+Grows a metrics table to each ``--runs`` size with one small file per pipeline
+run (what ``MetricsSink.flush`` produces), then times ``metrics_for_run`` for
+random run ids and counts the files each lookup reads. The same lookups are
+repeated after ``compact_metrics`` has Z-ordered the table by ``run_id, layer``.
+
+    python -m workload.benchmarks.metrics_lookup --runs 200,1000,5000 --out metrics_lookup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as _dt
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import TYPE_CHECKING, Dict, List, Sequence
+
+from workload.benchmarks.common import local_spark, scan_stats, write_results
+from workload.metrics import METRICS_SCHEMA, metrics_table_path, to_metrics_row
+from workload.metrics_reader import compact_metrics, metrics_for_run, run_metrics_df
+from workload.quality import build_metric_record
+
+if TYPE_CHECKING:
+    from pyspark.sql import SparkSession
+
+# Records per run: row_count, a quality rule and stage_execution for each layer.
+_RECORDS = [
+    (layer, metric)
+    for layer in ("bronze", "silver", "gold")
+    for metric in ("row_count", "quality", "stage_execution")
+]
+
+
+def _run_id(index: int) -> str:
+    return f"run{index:07d}"
+
+
+def grow_metrics_table(spark: "SparkSession", base_path: str, start: int, end: int) -> None:
+    """Append runs ``start`` to ``end - 1`` to the metrics table, one file per run."""
+    recorded_at = _dt.datetime(2024, 1, 1)
+    rows = [
+        to_metrics_row(
+            build_metric_record(_run_id(index), layer, metric, "OK", index, {"run": index}),
+            recorded_at + _dt.timedelta(minutes=index),
+        )
+        for index in range(start, end)
+        for layer, metric in _RECORDS
+    ]
+    # One commit with a file per run keeps setup fast while matching the file
+    # layout of one flush per run.
+    (
+        spark.createDataFrame(rows, schema=METRICS_SCHEMA)
+        .repartitionByRange(end - start, "run_id")
+        .write.format("delta")
+        .mode("append")
+        .save(metrics_table_path(base_path))
+    )
+
+
+def _measure(
+    spark: "SparkSession", base_path: str, run_ids: Sequence[str]
+) -> Dict[str, float]:
+    latencies = []
+    files_read = []
+    for run_id in run_ids:
+        started = time.perf_counter()
+        metrics_for_run(spark, base_path, run_id)
+        latencies.append(time.perf_counter() - started)
+        files_read.append(scan_stats(run_metrics_df(spark, base_path, run_id))["files_read"])
+    return {
+        "lookup_ms_median": round(statistics.median(latencies) * 1000, 1),
+        "files_read_median": statistics.median(files_read),
+    }
+
+
+def run_benchmark(
+    spark: "SparkSession",
+    work_dir: str,
+    runs: Sequence[int],
+    lookups: int = 5,
+    seed: int = 7,
+) -> List[Dict[str, object]]:
+    """Return before/after-compaction lookup stats for every table size in ``runs``."""
+    rng = random.Random(seed)
+    results: List[Dict[str, object]] = []
+    for size in runs:
+        base_path = f"{work_dir}/runs_{size}"
+        grow_metrics_table(spark, base_path, 0, size)
+        run_ids = [_run_id(rng.randrange(size)) for _ in range(lookups)]
+        # Load the Delta log snapshot once so the first timed lookup is comparable.
+        metrics_for_run(spark, base_path, run_ids[0])
+        before = _measure(spark, base_path, run_ids)
+
+        compaction = compact_metrics(spark, base_path, min_files=0)
+        metrics_for_run(spark, base_path, run_ids[0])
+        after = _measure(spark, base_path, run_ids)
+
+        results.append(
+            {
+                "runs": size,
+                "files": compaction["files_before"],
+                "lookup_ms_median": before["lookup_ms_median"],
+                "files_read_median": before["files_read_median"],
+                "compacted_files": compaction["files_after"],
+                "compacted_lookup_ms_median": after["lookup_ms_median"],
+                "compacted_files_read_median": after["files_read_median"],
+            }
+        )
+    return results
+
+
+def _parse_sizes(value: str) -> List[int]:
+    return [int(size) for size in value.split(",") if size.strip()]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--runs", type=_parse_sizes, default=[200, 1000, 5000], help="Comma-separated run counts"
+    )
+    parser.add_argument("--lookups", type=int, default=5, help="Timed lookups per size")
+    parser.add_argument("--cores", default="*", help="local[N] cores")
+    parser.add_argument("--work-dir", default=None, help="Table directory (default: temp dir)")
+    parser.add_argument("--out", default=None, help="Write JSON results to this file")
+    args = parser.parse_args(argv)
+
+    spark = local_spark("metrics-lookup-benchmark", args.cores)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = run_benchmark(spark, args.work_dir or tmp, args.runs, args.lookups)
+    finally:
+        spark.stop()
+
+    write_results(results, args.out)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI behavior
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,189 @@
+"""Measure medallion pipeline throughput under local-mode Spark.
+
+Runs ``ingest_bronze`` -> ``transform_silver`` -> ``aggregate_gold`` on synthetic
+events at each ``--sizes`` row count in a temporary directory and reports time
+and rows/sec per stage. With ``--baseline`` the results are compared against a
+stored results file and the exit code is 1 when any stage got slower than the
+tolerance allows; ``--update-baseline`` writes the new results there instead.
+
+    python -m workload.benchmarks.pipeline_throughput --sizes 100000,1000000 \\
+        --out throughput.json --baseline workload/benchmarks/baseline_throughput.json
+
+Baselines are machine specific: record them on the machine that runs the
+comparison.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+from workload.benchmarks.common import local_spark, write_results
+from workload.metrics import MetricsSink
+from workload.pipeline import (
+    PIPELINE_LAYERS,
+    aggregate_gold,
+    ingest_bronze,
+    transform_silver,
+)
+from workload.synthetic import SyntheticConfig
+
+if TYPE_CHECKING:
+    from pyspark.sql import SparkSession
+
+DEFAULT_TOLERANCE = 0.2
+
+
+def _timed(action: Callable[[], str]) -> Tuple[str, float]:
+    started = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - started
+
+
+def run_size(spark: "SparkSession", work_dir: str, rows: int) -> List[Dict[str, object]]:
+    """Run the three stages once on ``rows`` synthetic events; return one result per stage."""
+    base_path = f"{work_dir}/rows_{rows}"
+    run_id = f"bench_{rows}"
+    sink = MetricsSink(spark, base_path)
+
+    bronze_path, bronze_s = _timed(
+        lambda: ingest_bronze(
+            spark, base_path, run_id, synthetic=SyntheticConfig(rows=rows), sink=sink
+        )
+    )
+    silver_path, silver_s = _timed(
+        lambda: transform_silver(spark, bronze_path, base_path, run_id, sink=sink)
+    )
+    _, gold_s = _timed(
+        lambda: aggregate_gold(spark, silver_path, base_path, run_id, sink=sink)
+    )
+    # Row counts come from the stages' own row_count records.
+    row_counts = {
+        row["layer"]: int(row["value"])
+        for row in sink.to_dataframe().filter("metric = 'row_count'").collect()
+    }
+    bronze_rows, silver_rows, gold_rows = (row_counts[layer] for layer in PIPELINE_LAYERS)
+    sink.flush()
+
+    # Throughput is measured on each stage's input rows.
+    stages = [
+        ("bronze", bronze_s, rows, bronze_rows),
+        ("silver", silver_s, bronze_rows, silver_rows),
+        ("gold", gold_s, silver_rows, gold_rows),
+    ]
+    return [
+        {
+            "rows": rows,
+            "stage": stage,
+            "seconds": round(seconds, 3),
+            "input_rows": input_rows,
+            "output_rows": output_rows,
+            "rows_per_sec": round(input_rows / seconds, 1) if seconds > 0 else None,
+        }
+        for stage, seconds, input_rows, output_rows in stages
+    ]
+
+
+def run_benchmark(
+    spark: "SparkSession",
+    work_dir: str,
+    sizes: Sequence[int],
+    warmup_rows: int = 1000,
+) -> List[Dict[str, object]]:
+    """Benchmark every size after one untimed warm-up run (JVM, Delta log setup)."""
+    if warmup_rows:
+        run_size(spark, f"{work_dir}/warmup", warmup_rows)
+    results: List[Dict[str, object]] = []
+    for rows in sizes:
+        results += run_size(spark, work_dir, rows)
+    return results
+
+
+def compare_to_baseline(
+    results: Sequence[Dict[str, object]],
+    baseline: Sequence[Dict[str, object]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Dict[str, object]]:
+    """Return the stages whose rows/sec fell more than ``tolerance`` below the baseline.
+
+    Results are matched on ``(rows, stage)``; sizes missing from either side are
+    ignored.
+    """
+    expected = {(item["rows"], item["stage"]): item["rows_per_sec"] for item in baseline}
+    regressions = []
+    for item in results:
+        baseline_rate = expected.get((item["rows"], item["stage"]))
+        if not baseline_rate or item["rows_per_sec"] is None:
+            continue
+        change = item["rows_per_sec"] / baseline_rate - 1
+        if change < -tolerance:
+            regressions.append(
+                {
+                    "rows": item["rows"],
+                    "stage": item["stage"],
+                    "rows_per_sec": item["rows_per_sec"],
+                    "baseline_rows_per_sec": baseline_rate,
+                    "change": round(change, 3),
+                }
+            )
+    return regressions
+
+
+def _parse_sizes(value: str) -> List[int]:
+    return [int(size) for size in value.split(",") if size.strip()]
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=_parse_sizes, default=[100_000, 1_000_000], help="Comma-separated rows"
+    )
+    parser.add_argument("--warmup-rows", type=int, default=1000, help="Untimed warm-up size")
+    parser.add_argument("--cores", default="*", help="local[N] cores")
+    parser.add_argument("--work-dir", default=None, help="Table directory (default: temp dir)")
+    parser.add_argument("--out", default=None, help="Write JSON results to this file")
+    parser.add_argument("--baseline", default=None, help="Results file to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed rows/sec drop before a stage counts as regressed",
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="Write results to --baseline"
+    )
+    args = parser.parse_args(argv)
+
+    spark = local_spark("pipeline-throughput-benchmark", args.cores)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results = run_benchmark(spark, args.work_dir or tmp, args.sizes, args.warmup_rows)
+    finally:
+        spark.stop()
+
+    write_results(results, args.out)
+    if not args.baseline:
+        return 0
+    if args.update_baseline:
+        Path(args.baseline).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['stage']} @ {regression['rows']} rows: "
+            f"{regression['rows_per_sec']} rows/s vs baseline "
+            f"{regression['baseline_rows_per_sec']} ({regression['change']:+.0%})",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI behavior
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,225 @@
+"""Per-stage Spark execution metrics for pipeline runs.
+
+``track_stage`` tags every Spark job a pipeline stage runs with a job group,
+then sums the stage-level metrics of those jobs (wall time, tasks, input/output,
+shuffle and spill bytes) into one ``stage_execution`` record per layer. The
+numbers come from the Spark UI REST API when the UI is enabled and fall back to
+the status tracker (task counts only) otherwise.
+
+Compare recent runs with::
+
+    python -m workload.execution_metrics --base-path dbfs:/tmp/guardrails_demo --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+import time
+import urllib.request
+import uuid
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence
+
+from workload.quality import build_metric_record
+
+if TYPE_CHECKING:
+    from pyspark import SparkContext
+    from pyspark.sql import SparkSession
+
+    from workload.metrics import MetricsSink
+
+
+EXECUTION_METRIC = "stage_execution"
+
+# Spark UI REST field -> key in the metric record's details.
+_REST_FIELDS = {
+    "numCompleteTasks": "tasks",
+    "numFailedTasks": "failed_tasks",
+    "executorRunTime": "executor_run_time_ms",
+    "inputBytes": "input_bytes",
+    "outputBytes": "output_bytes",
+    "shuffleReadBytes": "shuffle_read_bytes",
+    "shuffleWriteBytes": "shuffle_write_bytes",
+    "memoryBytesSpilled": "memory_spilled_bytes",
+    "diskBytesSpilled": "disk_spilled_bytes",
+}
+
+_REST_TIMEOUT_SECONDS = 5
+
+
+def summarize_stage_attempts(attempts: Sequence[Dict[str, object]]) -> Dict[str, int]:
+    """Sum Spark REST ``StageData`` attempts into execution totals (skipped stages excluded)."""
+    totals = {key: 0 for key in _REST_FIELDS.values()}
+    stages = set()
+    for attempt in attempts:
+        if attempt.get("status") == "SKIPPED":
+            continue
+        stages.add(attempt.get("stageId"))
+        for field, key in _REST_FIELDS.items():
+            totals[key] += int(attempt.get(field) or 0)
+    totals["stages"] = len(stages)
+    return totals
+
+
+def _stage_ids(sc: "SparkContext", job_ids: Sequence[int]) -> List[int]:
+    tracker = sc.statusTracker()
+    stage_ids: List[int] = []
+    for job_id in job_ids:
+        info = tracker.getJobInfo(job_id)
+        if info is not None:
+            stage_ids.extend(info.stageIds)
+    return sorted(set(stage_ids))
+
+
+def _rest_stage_attempts(sc: "SparkContext", stage_ids: Sequence[int]) -> List[Dict[str, object]]:
+    base = f"{sc.uiWebUrl}/api/v1/applications/{sc.applicationId}/stages"
+    attempts: List[Dict[str, object]] = []
+    for stage_id in stage_ids:
+        # details=false returns the stage totals without every task of the stage.
+        with urllib.request.urlopen(
+            f"{base}/{stage_id}?details=false", timeout=_REST_TIMEOUT_SECONDS
+        ) as response:
+            attempts.extend(json.load(response))
+    return attempts
+
+
+def _tracker_totals(sc: "SparkContext", stage_ids: Sequence[int]) -> Dict[str, int]:
+    tracker = sc.statusTracker()
+    infos = [info for info in map(tracker.getStageInfo, stage_ids) if info is not None]
+    return {
+        "stages": len(infos),
+        "tasks": sum(info.numCompletedTasks for info in infos),
+        "failed_tasks": sum(info.numFailedTasks for info in infos),
+    }
+
+
+def collect_job_group_metrics(sc: "SparkContext", job_group: str) -> Dict[str, object]:
+    """Return execution totals for all jobs run under ``job_group``."""
+    job_ids = sc.statusTracker().getJobIdsForGroup(job_group)
+    stage_ids = _stage_ids(sc, job_ids)
+    details: Dict[str, object] = {"jobs": len(job_ids)}
+    if sc.uiWebUrl:
+        try:
+            details.update(summarize_stage_attempts(_rest_stage_attempts(sc, stage_ids)))
+            details["source"] = "rest"
+            return details
+        except (OSError, ValueError):
+            pass
+    details.update(_tracker_totals(sc, stage_ids))
+    details["source"] = "status_tracker"
+    return details
+
+
+@contextlib.contextmanager
+def track_stage(
+    spark: "SparkSession", run_id: str, layer: str, sink: "MetricsSink"
+) -> Iterator[None]:
+    """Run the enclosed pipeline stage under its own job group and record its metrics.
+
+    The record's value is the stage's wall time in seconds; its status is FAIL
+    when the stage raised. The job group gets a per-attempt suffix, so a retry of
+    the same run does not count the jobs of the failed attempt.
+    """
+    sc = spark.sparkContext
+    job_group = f"{run_id}:{layer}:{uuid.uuid4().hex[:8]}"
+    previous_group = sc.getLocalProperty("spark.jobGroup.id")
+    sc.setJobGroup(job_group, f"pipeline {layer} stage for run {run_id}")
+    started = time.monotonic()
+    status = "FAIL"
+    try:
+        yield
+        status = "OK"
+    finally:
+        wall_seconds = round(time.monotonic() - started, 3)
+        sc.setLocalProperty("spark.jobGroup.id", previous_group)
+        details = {**collect_job_group_metrics(sc, job_group), "job_group": job_group}
+        sink.add(
+            [build_metric_record(run_id, layer, EXECUTION_METRIC, status, wall_seconds, details)]
+        )
+
+
+def compare_runs(records: Sequence[Dict[str, object]], runs: int = 5) -> str:
+    """Format a per-layer table of wall time and shuffle bytes for the latest ``runs``.
+
+    ``records`` are ``stage_execution`` rows with ``run_id``, ``layer``, ``value``,
+    ``details`` (dict) and ``recorded_at``. Each line shows the change in wall
+    time against the previous run of the same layer.
+    """
+    latest_run_at: Dict[str, object] = {}
+    for record in records:
+        run_id = record["run_id"]
+        if run_id not in latest_run_at or record["recorded_at"] > latest_run_at[run_id]:
+            latest_run_at[run_id] = record["recorded_at"]
+    recent = sorted(latest_run_at, key=latest_run_at.__getitem__)[-runs:]
+
+    lines = [
+        f"{'layer':<8} {'run_id':<20} {'wall_s':>9} {'change':>8} "
+        f"{'tasks':>7} {'shuffle_mb':>11} {'spill_mb':>9}"
+    ]
+    for layer in sorted({record["layer"] for record in records}):
+        by_run = {
+            record["run_id"]: record
+            for record in records
+            if record["layer"] == layer and record["run_id"] in recent
+        }
+        previous: Optional[float] = None
+        for run_id in recent:
+            record = by_run.get(run_id)
+            if record is None:
+                continue
+            details = record["details"]
+            wall = float(record["value"] or 0)
+            change = f"{(wall - previous) / previous:+.0%}" if previous else "-"
+            shuffle_mb = (
+                int(details.get("shuffle_read_bytes", 0))
+                + int(details.get("shuffle_write_bytes", 0))
+            ) / 1e6
+            spill_mb = (
+                int(details.get("memory_spilled_bytes", 0))
+                + int(details.get("disk_spilled_bytes", 0))
+            ) / 1e6
+            lines.append(
+                f"{layer:<8} {run_id:<20} {wall:>9.1f} {change:>8} "
+                f"{int(details.get('tasks', 0)):>7} {shuffle_mb:>11.1f} {spill_mb:>9.1f}"
+            )
+            previous = wall
+    return "\n".join(lines)
+
+
+def load_execution_records(spark: "SparkSession", base_path: str) -> List[Dict[str, object]]:
+    """Read ``stage_execution`` records from the metrics table with parsed details."""
+    from pyspark.sql import functions as F
+
+    from workload.metrics import metrics_table_path
+
+    rows = (
+        spark.read.format("delta")
+        .load(metrics_table_path(base_path))
+        .filter(F.col("metric") == EXECUTION_METRIC)
+        .select("run_id", "layer", "value", "details", "recorded_at")
+        .collect()
+    )
+    return [{**row.asDict(), "details": json.loads(row["details"] or "{}")} for row in rows]
+
+
+def main(argv: List[str]) -> int:
+    """Print the recent-runs comparison for a pipeline base path."""
+    from pyspark.sql import SparkSession
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-path", required=True, help="Pipeline output base path")
+    parser.add_argument("--runs", type=int, default=5, help="Number of recent runs to compare")
+    args = parser.parse_args(argv)
+
+    spark = SparkSession.builder.appName("guardrails-execution-metrics").getOrCreate()
+    try:
+        print(compare_runs(load_execution_records(spark, args.base_path), args.runs))
+    finally:
+        spark.stop()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI behavior
+    sys.exit(main(sys.argv[1:]))
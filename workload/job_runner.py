@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import argparse
+import datetime as _dt
 import os
 import sys
 from typing import Optional
 
-from workload.pipeline import DEFAULT_BASE_PATH, run_pipeline
+from workload.backfill import run_backfill
+from workload.metrics_reader import DEFAULT_COMPACT_MIN_FILES, compact_metrics
+from workload.pipeline import DEFAULT_BASE_PATH, PIPELINE_LAYERS, aggregate_gold, run_pipeline
+from workload.streaming import run_streaming
+from workload.synthetic import SyntheticConfig, parse_event_mix
 
 
 def _get_widget_value(name: str) -> Optional[str]:
@@ -31,6 +37,44 @@ def _get_param(name: str, env_var: str, default: str) -> str:
     return default
 
 
+def _synthetic_config() -> Optional[SyntheticConfig]:
+    """Build the generator config from ``synthetic_*`` params (None = sample rows)."""
+    rows = int(_get_param("synthetic_rows", "SYNTHETIC_ROWS", "0"))
+    if rows <= 0:
+        return None
+
+    return SyntheticConfig(
+        rows=rows,
+        users=int(_get_param("synthetic_users", "SYNTHETIC_USERS", "10000")),
+        event_mix=parse_event_mix(
+            _get_param("synthetic_event_mix", "SYNTHETIC_EVENT_MIX", "purchase:0.8,refund:0.2")
+        ),
+        key_skew=float(_get_param("synthetic_key_skew", "SYNTHETIC_KEY_SKEW", "0")),
+        duplicate_rate=float(
+            _get_param("synthetic_duplicate_rate", "SYNTHETIC_DUPLICATE_RATE", "0")
+        ),
+        null_rate=float(_get_param("synthetic_null_rate", "SYNTHETIC_NULL_RATE", "0")),
+        days=int(_get_param("synthetic_days", "SYNTHETIC_DAYS", "30")),
+        seed=int(_get_param("synthetic_seed", "SYNTHETIC_SEED", "42")),
+    )
+
+
+def _force_stages(argv: list[str]) -> list[str]:
+    """Collect stages to rerun from ``--force-stage`` args and the ``force_stages`` param."""
+    parser = argparse.ArgumentParser(description="Run the bronze -> silver -> gold pipeline.")
+    parser.add_argument(
+        "--force-stage",
+        action="append",
+        default=[],
+        choices=PIPELINE_LAYERS,
+        help="Rerun this stage (and later ones) even if it completed for the run_id",
+    )
+    # Databricks may pass unrelated task parameters; only --force-stage is ours.
+    args, _ = parser.parse_known_args(argv)
+    param = _get_param("force_stages", "FORCE_STAGES", "")
+    return args.force_stage + [stage.strip() for stage in param.split(",") if stage.strip()]
+
+
 def main(argv: list[str]) -> int:
     """Run bronze -> silver -> gold with simple parameter handling."""
     try:
@@ -41,15 +85,71 @@ def main(argv: list[str]) -> int:
 
     base_path = _get_param("output_base_path", "OUTPUT_BASE_PATH", DEFAULT_BASE_PATH)
     run_id = _get_param("run_id", "RUN_ID", "")
+    silver_mode = _get_param("silver_mode", "SILVER_MODE", "full")
+    gold_mode = _get_param("gold_mode", "GOLD_MODE", "full")
+    distinct_error = _get_param("distinct_error", "DISTINCT_ERROR", "")
+    distinct_strategy = _get_param("distinct_strategy", "DISTINCT_STRATEGY", "single")
+    async_metrics = _get_param("async_metrics", "ASYNC_METRICS", "false").lower() == "true"
+    synthetic = _synthetic_config()
+    backfill_start = _get_param("backfill_start", "BACKFILL_START", "")
+    backfill_end = _get_param("backfill_end", "BACKFILL_END", "")
+    force_stages = _force_stages(argv)
+    ingest_mode = _get_param("ingest_mode", "INGEST_MODE", "batch")
+    compact_min_files = int(
+        _get_param(
+            "metrics_compact_min_files", "METRICS_COMPACT_MIN_FILES", str(DEFAULT_COMPACT_MIN_FILES)
+        )
+    )
+    if ingest_mode not in ("batch", "streaming"):
+        print(f"Unknown ingest_mode: {ingest_mode}", file=sys.stderr)
+        return 1
 
     spark = (
         SparkSession.builder.appName("guardrails-demo-pipeline")
+        # FAIR pools let concurrent backfill slices share the cluster.
+        .config("spark.scheduler.mode", "FAIR")
         .getOrCreate()
     )
 
     try:
-        results = run_pipeline(spark, base_path=base_path, run_id=run_id or None)
-        print(f"Run complete. Paths: {results}")
+        if backfill_start:
+            start = _dt.date.fromisoformat(backfill_start)
+            results = run_backfill(
+                spark,
+                base_path,
+                start,
+                _dt.date.fromisoformat(backfill_end) if backfill_end else start,
+                parallelism=int(_get_param("backfill_parallelism", "BACKFILL_PARALLELISM", "4")),
+                slice_days=int(_get_param("backfill_slice_days", "BACKFILL_SLICE_DAYS", "1")),
+                max_attempts=int(
+                    _get_param("backfill_max_attempts", "BACKFILL_MAX_ATTEMPTS", "3")
+                ),
+            )
+            print(f"Backfill complete: {results}")
+        elif ingest_mode == "streaming":
+            results = run_streaming(spark, base_path, run_id or None)
+            # Refresh only the gold dates touched by the rows this run streamed in.
+            aggregate_gold(
+                spark, results["silver_path"], base_path, results["run_id"], mode="incremental"
+            )
+            print(f"Streaming run complete: {results}")
+        else:
+            results = run_pipeline(
+                spark,
+                base_path=base_path,
+                run_id=run_id or None,
+                silver_mode=silver_mode,
+                gold_mode=gold_mode,
+                synthetic=synthetic,
+                distinct_error=float(distinct_error) if distinct_error else None,
+                force_stages=force_stages,
+                distinct_strategy=distinct_strategy,
+                async_metrics=async_metrics,
+            )
+            print(f"Run complete. Paths: {results}")
+        # Runs append one small metrics file each; fold them together once enough pile up.
+        compaction = compact_metrics(spark, base_path, compact_min_files)
+        print(f"Metrics compaction: {compaction}")
     except Exception as exc:  # pragma: no cover - requires Spark runtime
         print(f"Pipeline failed: {exc}", file=sys.stderr)
         return 1
@@ -0,0 +1,173 @@
+"""Buffered persistence of pipeline metric records to the Delta metrics table."""
+
+from __future__ import annotations
+
+import datetime as _dt
+import json
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    from pyspark.sql import DataFrame, SparkSession
+
+
+# ``details`` is stored as a JSON string: its values mix ints, floats and strings,
+# which neither schema inference nor a typed map column can hold without loss.
+METRICS_SCHEMA = (
+    "run_id STRING, layer STRING, metric STRING, status STRING, value DOUBLE, "
+    "details STRING, recorded_at TIMESTAMP"
+)
+
+
+def metrics_table_path(base_path: str) -> str:
+    """Return the location of the metrics Delta table under ``base_path``."""
+    return f"{base_path}/metrics"
+
+
+def migrate_metrics_table(spark: "SparkSession", path: str) -> bool:
+    """Rewrite a metrics table created before ``METRICS_SCHEMA`` into it; return True if rewritten.
+
+    Older versions appended records with an inferred schema (``details`` a map,
+    ``value`` a long or double, no ``recorded_at``), which rejects appends of the
+    current schema. The rows are kept: ``details`` becomes its JSON string,
+    ``value`` a double and ``recorded_at`` null, and the table is overwritten once.
+    """
+    from pyspark.sql import functions as F
+    from pyspark.sql import types as T
+
+    from workload.state import is_delta_table
+
+    if not is_delta_table(spark, path):
+        return False
+    table_df = spark.read.format("delta").load(path)
+    target = spark.createDataFrame([], schema=METRICS_SCHEMA).schema
+    current = {field.name: field.dataType for field in table_df.schema}
+    if all(current.get(field.name) == field.dataType for field in target):
+        return False
+
+    columns = []
+    for field in target:
+        if field.name not in current:
+            column = F.lit(None)
+        elif field.name == "details" and not isinstance(current["details"], T.StringType):
+            column = F.to_json(F.col("details"))
+        else:
+            column = F.col(field.name)
+        columns.append(column.cast(field.dataType).alias(field.name))
+    (
+        table_df.select(*columns)
+        .write.format("delta")
+        .mode("overwrite")
+        .option("overwriteSchema", "true")
+        .save(path)
+    )
+    return True
+
+
+def to_metrics_row(record: Dict[str, object], recorded_at: _dt.datetime) -> Tuple[object, ...]:
+    """Convert a ``build_metric_record`` dict to a row matching ``METRICS_SCHEMA``."""
+    value = record.get("value")
+    return (
+        record["run_id"],
+        record["layer"],
+        record["metric"],
+        record["status"],
+        float(value) if value is not None else None,
+        json.dumps(record.get("details") or {}, sort_keys=True, default=str),
+        recorded_at,
+    )
+
+
+class MetricsSink:
+    """Collect metric records from all stages and write them in one Delta append.
+
+    Each ``flush`` is a single commit, so a pipeline run adds one small file to
+    the metrics table instead of one per layer. The first flush migrates a
+    table left by older versions (see ``migrate_metrics_table``).
+
+    With an ``executor``, metric computations passed to ``submit`` run as
+    background Spark jobs alongside the next stage; ``join`` collects them.
+    ``after_pending`` holds back work (such as a stage marker) until the
+    computations submitted before it have succeeded.
+    """
+
+    def __init__(
+        self,
+        spark: "SparkSession",
+        base_path: str,
+        executor: Optional["Executor"] = None,
+    ) -> None:
+        self.spark = spark
+        self.path = metrics_table_path(base_path)
+        self._rows: List[Tuple[object, ...]] = []
+        self._executor = executor
+        self._futures: List["Future"] = []
+        self._schema_checked = False
+        self._callbacks: List[Tuple[List["Future"], Callable[[], None]]] = []
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered records not yet written."""
+        return len(self._rows)
+
+    def add(self, records: Iterable[Dict[str, object]]) -> None:
+        """Buffer metric records, stamping them with the current UTC time."""
+        recorded_at = _dt.datetime.utcnow()
+        self._rows.extend(to_metrics_row(record, recorded_at) for record in records)
+
+    def submit(self, compute: Callable[[], Iterable[Dict[str, object]]]) -> None:
+        """Compute metric records now, or in the background when the sink has an executor."""
+        if self._executor is None:
+            self.add(compute())
+            return
+        self._futures.append(self._executor.submit(compute))
+
+    def after_pending(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once every computation submitted so far has succeeded.
+
+        Runs it right away when nothing is pending. Otherwise ``join`` runs it,
+        or drops it when one of those computations raised.
+        """
+        if not self._futures:
+            callback()
+            return
+        self._callbacks.append((list(self._futures), callback))
+
+    def join(self) -> List[BaseException]:
+        """Wait for submitted computations and buffer their records; return their errors.
+
+        Every computation is waited for, so the records of those that succeeded
+        are kept even when others failed. Callbacks registered with
+        ``after_pending`` run afterwards, unless a computation they wait for failed.
+        """
+        futures, self._futures = self._futures, []
+        errors: List[BaseException] = []
+        failed = set()
+        for future in futures:
+            try:
+                self.add(future.result())
+            except Exception as exc:
+                errors.append(exc)
+                failed.add(future)
+        callbacks, self._callbacks = self._callbacks, []
+        for waited_for, callback in callbacks:
+            if failed.isdisjoint(waited_for):
+                callback()
+        return errors
+
+    def to_dataframe(self) -> "DataFrame":
+        """Return the buffered records as a DataFrame with ``METRICS_SCHEMA``."""
+        return self.spark.createDataFrame(self._rows, schema=METRICS_SCHEMA)
+
+    def flush(self) -> int:
+        """Append buffered records to the metrics table; return how many were written."""
+        if not self._rows:
+            return 0
+        if not self._schema_checked:
+            migrate_metrics_table(self.spark, self.path)
+            self._schema_checked = True
+        self.to_dataframe().write.format("delta").mode("append").save(self.path)
+        written = len(self._rows)
+        self._rows = []
+        return written
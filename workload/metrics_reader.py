@@ -0,0 +1,148 @@
+"""Read and maintain the pipeline metrics table.
+
+Every run appends one small file to ``{base_path}/metrics`` (see
+``workload.metrics``). ``compact_metrics`` periodically rewrites them into a few
+files Z-ordered by ``run_id, layer``, so the per-file min/max stats let
+``metrics_for_run`` and ``latest_metrics`` skip every file that cannot hold the
+requested run. Inspect a run or compact the table with::
+
+    python -m workload.metrics_reader --base-path dbfs:/tmp/guardrails_demo --run-id 20241001120000
+    python -m workload.metrics_reader --base-path dbfs:/tmp/guardrails_demo --compact
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from workload.metrics import metrics_table_path
+from workload.pipeline import TableLayout, maintain_layout
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame, Row, SparkSession
+
+
+METRICS_LAYOUT = TableLayout(
+    zorder_by=("run_id", "layer"),
+    target_file_size=64 * 1024 * 1024,
+    optimize_after_write=True,
+)
+
+# Compaction is skipped until the table has at least this many files.
+DEFAULT_COMPACT_MIN_FILES = 50
+
+
+def _to_record(row: "Row") -> Dict[str, object]:
+    return {**row.asDict(), "details": json.loads(row["details"] or "{}")}
+
+
+def run_metrics_df(
+    spark: "SparkSession", base_path: str, run_id: str, layer: Optional[str] = None
+) -> "DataFrame":
+    """Return the metric rows of ``run_id`` (optionally one ``layer``) as a DataFrame."""
+    from pyspark.sql import functions as F
+
+    df = spark.read.format("delta").load(metrics_table_path(base_path))
+    df = df.filter(F.col("run_id") == run_id)
+    if layer is not None:
+        df = df.filter(F.col("layer") == layer)
+    return df
+
+
+def metrics_for_run(
+    spark: "SparkSession", base_path: str, run_id: str, layer: Optional[str] = None
+) -> List[Dict[str, object]]:
+    """Return the records of ``run_id`` with parsed ``details``, ordered by layer and metric."""
+    rows = run_metrics_df(spark, base_path, run_id, layer).orderBy("layer", "metric").collect()
+    return [_to_record(row) for row in rows]
+
+
+def latest_metrics(
+    spark: "SparkSession", base_path: str, layer: str, metric: Optional[str] = None
+) -> List[Dict[str, object]]:
+    """Return the ``layer`` records of the most recently recorded run.
+
+    ``metric`` narrows the result to one metric name. Returns an empty list when
+    the layer has no records.
+    """
+    from pyspark.sql import functions as F
+
+    df = spark.read.format("delta").load(metrics_table_path(base_path))
+    df = df.filter(F.col("layer") == layer)
+    if metric is not None:
+        df = df.filter(F.col("metric") == metric)
+    latest = df.orderBy(F.col("recorded_at").desc()).select("run_id").limit(1).collect()
+    if not latest:
+        return []
+    rows = df.filter(F.col("run_id") == latest[0]["run_id"]).orderBy("metric").collect()
+    return [_to_record(row) for row in rows]
+
+
+def _num_files(spark: "SparkSession", path: str) -> int:
+    return int(spark.sql(f"DESCRIBE DETAIL delta.`{path}`").collect()[0]["numFiles"])
+
+
+def compact_metrics(
+    spark: "SparkSession",
+    base_path: str,
+    min_files: int = DEFAULT_COMPACT_MIN_FILES,
+    layout: TableLayout = METRICS_LAYOUT,
+) -> Dict[str, object]:
+    """Compact the metrics table and cluster it by ``run_id, layer``.
+
+    Does nothing while the table has fewer than ``min_files`` files. Returns the
+    file counts before and after and whether ``OPTIMIZE`` ran. Appends running
+    at the same time do not conflict with the compaction.
+    """
+    from workload.state import is_delta_table
+
+    path = metrics_table_path(base_path)
+    if not is_delta_table(spark, path):
+        return {"files_before": 0, "files_after": 0, "optimized": False}
+
+    files_before = _num_files(spark, path)
+    if files_before < min_files:
+        return {"files_before": files_before, "files_after": files_before, "optimized": False}
+    maintain_layout(spark, path, layout)
+    return {
+        "files_before": files_before,
+        "files_after": _num_files(spark, path),
+        "optimized": True,
+    }
+
+
+def main(argv: List[str]) -> int:
+    """Print a run's metrics or compact the metrics table."""
+    from pyspark.sql import SparkSession
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-path", required=True, help="Pipeline output base path")
+    parser.add_argument("--run-id", default=None, help="Print the metrics of this run")
+    parser.add_argument("--layer", default=None, help="Restrict output to one layer")
+    parser.add_argument("--compact", action="store_true", help="Compact the metrics table")
+    parser.add_argument(
+        "--min-files",
+        type=int,
+        default=DEFAULT_COMPACT_MIN_FILES,
+        help="Compact only when the table has at least this many files",
+    )
+    args = parser.parse_args(argv)
+    if not args.run_id and not args.compact:
+        parser.error("pass --run-id and/or --compact")
+
+    spark = SparkSession.builder.appName("guardrails-metrics-reader").getOrCreate()
+    try:
+        if args.compact:
+            print(json.dumps(compact_metrics(spark, args.base_path, args.min_files)))
+        if args.run_id:
+            records = metrics_for_run(spark, args.base_path, args.run_id, args.layer)
+            print(json.dumps(records, indent=2, default=str))
+    finally:
+        spark.stop()
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI behavior
+    sys.exit(main(sys.argv[1:]))
@@ -8,17 +8,20 @@ try:
     dbutils.widgets.text("output_base_path", "dbfs:/tmp/guardrails_demo", "Output base path")
     dbutils.widgets.text("bronze_path", "", "Bronze path (optional)")
     dbutils.widgets.text("run_id", "", "Run ID (optional)")
+    dbutils.widgets.dropdown("silver_mode", "full", ["full", "incremental"], "Silver mode")
 except NameError:
     pass
 
 base_path = "dbfs:/tmp/guardrails_demo"
 bronze_path = ""
 run_id = ""
+silver_mode = "full"
 
 try:
     base_path = dbutils.widgets.get("output_base_path")  # type: ignore[name-defined]
     bronze_path = dbutils.widgets.get("bronze_path")  # type: ignore[name-defined]
     run_id = dbutils.widgets.get("run_id")  # type: ignore[name-defined]
+    silver_mode = dbutils.widgets.get("silver_mode")  # type: ignore[name-defined]
 except Exception:
     pass
 
@@ -52,6 +55,7 @@ silver_path = transform_silver(
     bronze_path=bronze_path,
     base_path=base_path,
     run_id=run_id,
+    mode=silver_mode or "full",
 )
 
 try:
@@ -8,17 +8,20 @@ try:
     dbutils.widgets.text("output_base_path", "dbfs:/tmp/guardrails_demo", "Output base path")
     dbutils.widgets.text("silver_path", "", "Silver path (optional)")
     dbutils.widgets.text("run_id", "", "Run ID (optional)")
+    dbutils.widgets.dropdown("gold_mode", "full", ["full", "incremental"], "Gold mode")
 except NameError:
     pass
 
 base_path = "dbfs:/tmp/guardrails_demo"
 silver_path = ""
 run_id = ""
+gold_mode = "full"
 
 try:
     base_path = dbutils.widgets.get("output_base_path")  # type: ignore[name-defined]
     silver_path = dbutils.widgets.get("silver_path")  # type: ignore[name-defined]
     run_id = dbutils.widgets.get("run_id")  # type: ignore[name-defined]
+    gold_mode = dbutils.widgets.get("gold_mode")  # type: ignore[name-defined]
 except Exception:
     pass
 
@@ -52,6 +55,7 @@ gold_path = aggregate_gold(
     silver_path=silver_path,
     base_path=base_path,
     run_id=run_id,
+    mode=gold_mode or "full",
 )
 
 try:
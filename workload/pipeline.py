@@ -3,43 +3,292 @@
 from __future__ import annotations
 
 import datetime as _dt
-from typing import TYPE_CHECKING, Dict, List
+import os
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
 
-from workload.quality import (
-    build_metric_record,
-    evaluate_non_null,
-    evaluate_uniqueness,
+from workload.execution_metrics import track_stage
+from workload.metrics import MetricsSink, metrics_table_path
+from workload.quality import build_metric_record
+from workload.rules import NonNull, Rule, Unique, evaluate_rules, with_relative_error
+from workload.sketches import DEFAULT_SKETCH_ERROR, hll_lg_k
+from workload.skew import (
+    DISTINCT_STRATEGIES,
+    aggregate_events,
+    choose_distinct_strategy,
+    observed_group_rows,
 )
+from workload.synthetic import SyntheticConfig, generate_events
 
 if TYPE_CHECKING:
-    from pyspark.sql import SparkSession
+    from pyspark.sql import DataFrame, SparkSession
 
 
 DEFAULT_BASE_PATH = "dbfs:/tmp/guardrails_demo"
 
+PIPELINE_LAYERS = ("bronze", "silver", "gold")
 
-def _persist_metrics(
+
+@dataclass(frozen=True)
+class TableLayout:
+    """Physical layout settings for one layer's Delta table.
+
+    ``partition_by`` is applied when the table is (re)written in full; changing it
+    on an existing table therefore needs a full rebuild. ``zorder_by`` only takes
+    effect through the compaction step (``optimize_after_write``), which runs
+    ``OPTIMIZE ... ZORDER BY`` on the partitions just written.
+    ``target_file_size`` (bytes) caps compacted file size and, on Databricks, is
+    stored as the ``delta.targetFileSize`` table property for optimized writes.
+    ``sort_within_partitions`` sorts rows inside each written file (no shuffle);
+    a global ``orderBy`` is never needed since Delta does not keep row order.
+    """
+
+    partition_by: Tuple[str, ...] = ()
+    zorder_by: Tuple[str, ...] = ()
+    target_file_size: Optional[int] = None
+    optimize_after_write: bool = False
+    sort_within_partitions: Tuple[str, ...] = ()
+
+
+# Silver and gold are read by event_date ranges (see sql/analytics_queries.sql):
+# silver is large enough to partition by day; gold is a few rows per day, so it
+# is clustered by Z-order stats instead of producing one tiny file per date.
+DEFAULT_LAYOUTS: Dict[str, TableLayout] = {
+    "bronze": TableLayout(),
+    "silver": TableLayout(
+        partition_by=("event_date",),
+        zorder_by=("event_type",),
+        target_file_size=128 * 1024 * 1024,
+    ),
+    "gold": TableLayout(
+        zorder_by=("event_date", "event_type"),
+        target_file_size=32 * 1024 * 1024,
+        optimize_after_write=True,
+    ),
+}
+
+
+def write_layer(
+    df: "DataFrame",
+    path: str,
+    layout: TableLayout,
+    replace_where: Optional[str] = None,
+    commit_tag: Optional[str] = None,
+) -> None:
+    """Overwrite a layer table (or the ``replace_where`` slice of it) with ``df``.
+
+    Full overwrites may change schema and partitioning, since they rebuild the
+    whole table anyway. ``commit_tag`` is stored as the commit's ``userMetadata``
+    so ``read_commit_metrics`` can find this commit among concurrent ones.
+    """
+    if layout.sort_within_partitions:
+        df = df.sortWithinPartitions(*layout.sort_within_partitions)
+    writer = df.write.format("delta").mode("overwrite")
+    if layout.partition_by:
+        writer = writer.partitionBy(*layout.partition_by)
+    if replace_where is not None:
+        writer = writer.option("replaceWhere", replace_where)
+    else:
+        writer = writer.option("overwriteSchema", "true")
+    if commit_tag is not None:
+        writer = writer.option("userMetadata", commit_tag)
+    writer.save(path)
+
+
+def maintain_layout(
+    spark: "SparkSession",
+    path: str,
+    layout: TableLayout,
+    where: Optional[str] = None,
+) -> None:
+    """Apply post-write layout settings: file-size target and optional compaction.
+
+    ``where`` restricts compaction to the partitions just written; it is only
+    used when it references partition columns, as ``OPTIMIZE`` requires.
+    """
+    if layout.target_file_size and "DATABRICKS_RUNTIME_VERSION" in os.environ:
+        spark.sql(
+            f"ALTER TABLE delta.`{path}` SET TBLPROPERTIES "
+            f"('delta.targetFileSize' = '{layout.target_file_size}')"
+        )
+
+    if not layout.optimize_after_write:
+        return
+
+    statement = f"OPTIMIZE delta.`{path}`"
+    if where and layout.partition_by:
+        statement += f" WHERE {where}"
+    zorder = [c for c in layout.zorder_by if c not in layout.partition_by]
+    if zorder:
+        statement += f" ZORDER BY ({', '.join(zorder)})"
+
+    max_file_size_conf = "spark.databricks.delta.optimize.maxFileSize"
+    previous = spark.conf.get(max_file_size_conf, None)
+    if layout.target_file_size:
+        spark.conf.set(max_file_size_conf, str(layout.target_file_size))
+    try:
+        spark.sql(statement)
+    finally:
+        if layout.target_file_size:
+            if previous is None:
+                spark.conf.unset(max_file_size_conf)
+            else:
+                spark.conf.set(max_file_size_conf, previous)
+
+
+def _record_metrics(
     spark: "SparkSession",
     base_path: str,
-    layer: str,
-    run_id: str,
     metric_rows: List[Dict[str, object]],
+    sink: MetricsSink | None = None,
+    deferred: Callable[[], List[Dict[str, object]]] | None = None,
 ) -> None:
-    """Write metric rows to a Delta metrics table."""
-    metrics_df = spark.createDataFrame(metric_rows)
-    metrics_path = f"{base_path}/metrics"
-    metrics_df.write.format("delta").mode("append").save(metrics_path)
+    """Buffer metric rows in ``sink``, or write them right away when run standalone.
 
+    ``deferred`` computes the stage's quality records; a sink with an executor
+    runs it in the background while the next stage starts.
+    """
+    if sink is not None:
+        sink.add(metric_rows)
+        if deferred is not None:
+            sink.submit(deferred)
+        return
+    standalone = MetricsSink(spark, base_path)
+    standalone.add(metric_rows)
+    if deferred is not None:
+        standalone.add(deferred())
+    standalone.flush()
 
-def ingest_bronze(
-    spark: "SparkSession", base_path: str = DEFAULT_BASE_PATH, run_id: str | None = None
-) -> str:
-    """Generate synthetic bronze data and write to Delta."""
+
+def read_commit_metrics(
+    spark: "SparkSession", table_path: str, commit_tag: Optional[str] = None
+) -> Dict[str, object]:
+    """Return row, file and byte stats recorded in the latest Delta commit.
+
+    Reads ``operationMetrics`` from the table history, which is a Delta log lookup
+    rather than a scan or recomputation of the written data. Call it right after
+    the write; a concurrent writer committing in between would be picked up instead,
+    unless the write was tagged (``write_layer(..., commit_tag=...)``) and the same
+    ``commit_tag`` is passed here to select its commit.
+    """
     from pyspark.sql import functions as F
-    from pyspark.sql import types as T
 
-    actual_run_id = run_id or _dt.datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    bronze_path = f"{base_path}/bronze"
+    if commit_tag is None:
+        history = spark.sql(f"DESCRIBE HISTORY delta.`{table_path}` LIMIT 1").collect()[0]
+    else:
+        tagged = (
+            spark.sql(f"DESCRIBE HISTORY delta.`{table_path}`")
+            .filter(F.col("userMetadata") == commit_tag)
+            .orderBy(F.col("version").desc())
+            .limit(1)
+            .collect()
+        )
+        if not tagged:
+            raise ValueError(f"No commit tagged {commit_tag!r} in {table_path}")
+        history = tagged[0]
+    op_metrics = history["operationMetrics"] or {}
+
+    def _metric(*keys: str) -> int:
+        return sum(int(op_metrics.get(key) or 0) for key in keys)
+
+    if history["operation"] == "MERGE":
+        num_output_rows = _metric("numTargetRowsInserted", "numTargetRowsUpdated")
+        num_files = _metric("numTargetFilesAdded")
+        num_output_bytes = _metric("numTargetBytesAdded")
+    else:
+        num_output_rows = _metric("numOutputRows")
+        num_files = _metric("numFiles", "numAddedFiles")
+        num_output_bytes = _metric("numOutputBytes", "numAddedBytes")
+
+    return {
+        "table_version": history["version"],
+        "operation": history["operation"],
+        "num_output_rows": num_output_rows,
+        "num_files": num_files,
+        "num_output_bytes": num_output_bytes,
+    }
+
+
+def commit_row_count_metrics(
+    spark: "SparkSession",
+    table_path: str,
+    run_id: str,
+    layer: str,
+    commit_tag: Optional[str] = None,
+) -> List[Dict[str, object]]:
+    """Build a layer's ``row_count`` and ``rows_written`` metrics from its latest commit.
+
+    ``row_count`` is the table's row count at the committed version; Delta answers
+    the count from the file statistics in the log instead of scanning the data.
+    ``rows_written`` is what the commit itself wrote, from ``operationMetrics``:
+    rows inserted or updated for MERGE, rows written for ``replaceWhere``.
+    ``commit_tag`` selects a tagged commit instead of the latest one.
+    """
+    commit = read_commit_metrics(spark, table_path, commit_tag)
+    table_rows = (
+        spark.read.format("delta")
+        .option("versionAsOf", commit["table_version"])
+        .load(table_path)
+        .count()
+    )
+    return [
+        build_metric_record(
+            run_id, layer, "row_count", "OK", table_rows, {"table_version": commit["table_version"]}
+        ),
+        build_metric_record(
+            run_id,
+            layer,
+            "rows_written",
+            "OK",
+            commit["num_output_rows"],
+            {
+                key: commit[key]
+                for key in ("table_version", "operation", "num_files", "num_output_bytes")
+            },
+        ),
+    ]
+
+
+# Quality rules per layer, evaluated in one aggregation per layer (see
+# ``workload.rules``). Override per run with ``run_pipeline(..., rules={...})``.
+DEFAULT_RULES: Dict[str, Tuple[Rule, ...]] = {
+    "bronze": (NonNull("id"), Unique("id")),
+    "silver": (NonNull("amount"),),
+    "gold": (),
+}
+
+
+def compute_quality_metrics(
+    df: "DataFrame",
+    run_id: str,
+    layer: str,
+    non_null_columns: Sequence[str] = (),
+    unique_columns: Sequence[str] = (),
+    include_row_count: bool = True,
+) -> List[Dict[str, object]]:
+    """Compute row count, null and distinct counts in one aggregation pass.
+
+    Shorthand for ``evaluate_rules`` with ``NonNull`` and ``Unique`` rules.
+    """
+    rules = [NonNull(column) for column in non_null_columns]
+    rules += [Unique(column) for column in unique_columns]
+    return evaluate_rules(df, rules, run_id, layer, include_row_count=include_row_count)
+
+
+def build_bronze_df(
+    spark: "SparkSession",
+    run_id: str,
+    synthetic: SyntheticConfig | None = None,
+) -> "DataFrame":
+    """Return the bronze DataFrame (sample rows or synthetic events) without writing it.
+
+    Event time is parsed here, once (see ``parse_event_time``); rows whose
+    ``ts`` did not parse keep a null ``event_ts`` until ``split_malformed``
+    separates them.
+    """
+    from pyspark.sql import functions as F
+    from pyspark.sql import types as T
 
     sample_data = [
         {"id": 1, "user_id": "u1", "event_type": "purchase", "amount": 42.5, "ts": "2024-10-01T12:00:00Z"},
@@ -59,129 +308,854 @@ def ingest_bronze(
         ]
     )
 
-    bronze_df = spark.createDataFrame(sample_data, schema=schema).withColumn(
-        "ingested_at", F.current_timestamp()
+    if synthetic is not None:
+        source_df = generate_events(spark, synthetic)
+    else:
+        source_df = spark.createDataFrame(sample_data, schema=schema)
+
+    return (
+        parse_event_time(source_df)
+        .withColumn("ingested_at", F.current_timestamp())
+        .withColumn("run_id", F.lit(run_id))
     )
-    bronze_df = bronze_df.withColumn("run_id", F.lit(actual_run_id))
-    bronze_df.write.format("delta").mode("overwrite").save(bronze_path)
 
-    total_rows = bronze_df.count()
-    non_null = evaluate_non_null("id", total_rows, 0)
-    uniqueness = evaluate_uniqueness("id", total_rows, bronze_df.select("id").distinct().count())
 
-    metrics = [
-        build_metric_record(actual_run_id, "bronze", "row_count", "OK", total_rows),
-        build_metric_record(
-            actual_run_id,
-            "bronze",
-            non_null["metric_name"],
-            non_null["status"],
-            non_null["value"],
-            non_null["details"],
-        ),
-        build_metric_record(
+def quarantine_path(base_path: str) -> str:
+    """Return the table holding raw rows that could not be typed at ingest."""
+    return f"{base_path}/bronze_quarantine"
+
+
+def parse_event_time(raw_df: "DataFrame") -> "DataFrame":
+    """Add ``event_ts`` and ``event_date`` parsed from the raw ``ts`` string.
+
+    ``try_to_timestamp`` turns unparseable values into nulls instead of failing
+    the job under ANSI mode.
+    """
+    from pyspark.sql import functions as F
+
+    return raw_df.withColumn("event_ts", F.try_to_timestamp(F.col("ts"))).withColumn(
+        "event_date", F.to_date("event_ts")
+    )
+
+
+def split_malformed(parsed_df: "DataFrame") -> Tuple["DataFrame", "DataFrame"]:
+    """Split parsed bronze rows into typed rows and rows to quarantine.
+
+    Quarantined rows keep every raw column plus a ``quarantine_reason``.
+    """
+    from pyspark.sql import functions as F
+
+    malformed = F.col("event_ts").isNull()
+    reason = F.when(F.col("ts").isNull(), F.lit("missing_ts")).otherwise(
+        F.lit("unparseable_ts")
+    )
+    return (
+        parsed_df.filter(~malformed),
+        parsed_df.filter(malformed).withColumn("quarantine_reason", reason),
+    )
+
+
+def _append_rows(
+    spark: "SparkSession",
+    df: "DataFrame",
+    path: str,
+    txn: Optional[Tuple[str, int]] = None,
+) -> int:
+    """Append ``df`` to the Delta table at ``path``; return the rows this call committed.
+
+    With ``txn`` (application id, version) Delta skips a version it already
+    committed; the table version then stays put and 0 rows are returned instead
+    of the stats of an earlier commit.
+    """
+    from workload.state import is_delta_table
+
+    before = _table_version(spark, path) if is_delta_table(spark, path) else None
+    writer = df.write.format("delta").mode("append")
+    if txn is not None:
+        writer = writer.option("txnAppId", txn[0]).option("txnVersion", txn[1])
+    writer.save(path)
+    if _table_version(spark, path) == before:
+        return 0
+    return int(read_commit_metrics(spark, path)["num_output_rows"])
+
+
+def write_quarantine(
+    spark: "SparkSession",
+    malformed_df: "DataFrame",
+    base_path: str,
+    run_id: str,
+    txn: Optional[Tuple[str, int]] = None,
+) -> Dict[str, object]:
+    """Append ``malformed_df`` to the quarantine table; return its metric record.
+
+    ``txn`` (application id, version) makes the append idempotent for streaming
+    micro-batches; a replayed batch that Delta skips reports 0 rows. The metric
+    fails when any row was quarantined. Nothing is committed when there are no
+    malformed rows; pass a persisted DataFrame so that check does not recompute
+    its lineage.
+    """
+    path = quarantine_path(base_path)
+    quarantined = 0 if malformed_df.isEmpty() else _append_rows(spark, malformed_df, path, txn)
+    return build_metric_record(
+        run_id,
+        "bronze",
+        "quarantined_rows",
+        "OK" if quarantined == 0 else "FAIL",
+        quarantined,
+        {"table_path": path},
+    )
+
+
+def ingest_bronze(
+    spark: "SparkSession",
+    base_path: str = DEFAULT_BASE_PATH,
+    run_id: str | None = None,
+    layout: TableLayout | None = None,
+    synthetic: SyntheticConfig | None = None,
+    rules: Sequence[Rule] | None = None,
+    sink: MetricsSink | None = None,
+) -> str:
+    """Generate synthetic bronze data and write to Delta.
+
+    Without ``synthetic`` a handful of fixed sample rows are written; with it,
+    ``generate_events`` builds the data on the executors for load testing.
+    Rows whose ``ts`` does not parse are appended to ``quarantine_path`` instead
+    of bronze and counted in a ``quarantined_rows`` metric.
+    """
+    from pyspark import StorageLevel
+
+    actual_run_id = run_id or _dt.datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    bronze_path = f"{base_path}/bronze"
+    layout = layout or DEFAULT_LAYOUTS["bronze"]
+
+    # Both sides of the split read the persisted rows instead of generating and
+    # parsing the source twice.
+    parsed_df = build_bronze_df(spark, actual_run_id, synthetic).persist(
+        StorageLevel.MEMORY_AND_DISK
+    )
+    try:
+        bronze_df, malformed_df = split_malformed(parsed_df)
+        write_layer(bronze_df, bronze_path, layout)
+        # Row count comes from the write's commit (read before any layout maintenance
+        # commits); the remaining checks profile the committed table instead of
+        # re-running the bronze lineage.
+        metrics = commit_row_count_metrics(spark, bronze_path, actual_run_id, "bronze")
+        metrics.append(write_quarantine(spark, malformed_df, base_path, actual_run_id))
+    finally:
+        parsed_df.unpersist()
+    maintain_layout(spark, bronze_path, layout)
+    # Pinned to the version this stage committed, so deferred checks see what it
+    # wrote even if the table changes before they run.
+    bronze_df = (
+        spark.read.format("delta")
+        .option("versionAsOf", metrics[0]["details"]["table_version"])
+        .load(bronze_path)
+    )
+    _record_metrics(
+        spark,
+        base_path,
+        metrics,
+        sink,
+        deferred=lambda: evaluate_rules(
+            bronze_df,
+            DEFAULT_RULES["bronze"] if rules is None else rules,
             actual_run_id,
             "bronze",
-            uniqueness["metric_name"],
-            uniqueness["status"],
-            uniqueness["value"],
-            uniqueness["details"],
+            include_row_count=False,
         ),
-    ]
-    _persist_metrics(spark, base_path, "bronze", actual_run_id, metrics)
+    )
 
     return bronze_path
 
 
+def _table_version(spark: "SparkSession", table_path: str) -> int:
+    """Return the latest committed version of a Delta table."""
+    return spark.sql(f"DESCRIBE HISTORY delta.`{table_path}` LIMIT 1").collect()[0]["version"]
+
+
+def _change_data_feed_enabled(spark: "SparkSession", table_path: str) -> bool:
+    """Return True if the Delta table records a change data feed."""
+    properties = spark.sql(f"DESCRIBE DETAIL delta.`{table_path}`").collect()[0]["properties"]
+    return (properties or {}).get("delta.enableChangeDataFeed", "false").lower() == "true"
+
+
+def _clean_bronze(bronze_df: "DataFrame") -> "DataFrame":
+    """Deduplicate on ``id`` and drop rows without amount.
+
+    The earliest ingested row of each ``id`` wins, ties broken on the remaining
+    columns, so every rebuild and backfill slice keeps the same row.
+    Event time columns come typed from bronze; tables ingested before bronze
+    was typed are parsed here instead.
+    """
+    from pyspark.sql import Window
+    from pyspark.sql import functions as F
+
+    if "event_ts" not in bronze_df.columns:
+        bronze_df = parse_event_time(bronze_df)
+    tie_breakers = sorted(c for c in bronze_df.columns if c not in ("id", "ingested_at"))
+    first_seen = Window.partitionBy("id").orderBy(
+        *(F.col(c).asc_nulls_last() for c in ["ingested_at", *tie_breakers])
+    )
+    return (
+        bronze_df.withColumn("_row_number", F.row_number().over(first_seen))
+        .filter((F.col("_row_number") == 1) & F.col("amount").isNotNull())
+        .drop("_row_number")
+    )
+
+
+def _read_bronze_increment(
+    spark: "SparkSession",
+    bronze_path: str,
+    bronze_version: int,
+    watermark: Dict[str, object],
+) -> "DataFrame":
+    """Return bronze rows added after ``watermark`` up to ``bronze_version``.
+
+    Uses the change data feed when the table has it enabled and the watermark
+    carries a source version; otherwise filters on ``ingested_at``.
+    """
+    from pyspark.sql import functions as F
+
+    last_version = watermark.get("source_version")
+    if last_version is not None and _change_data_feed_enabled(spark, bronze_path):
+        if last_version >= bronze_version:
+            return spark.read.format("delta").load(bronze_path).limit(0)
+        return (
+            spark.read.format("delta")
+            .option("readChangeFeed", "true")
+            .option("startingVersion", last_version + 1)
+            .option("endingVersion", bronze_version)
+            .load(bronze_path)
+            .filter(F.col("_change_type").isin("insert", "update_postimage"))
+            .drop("_change_type", "_commit_version", "_commit_timestamp")
+        )
+
+    bronze_df = (
+        spark.read.format("delta").option("versionAsOf", bronze_version).load(bronze_path)
+    )
+    if watermark.get("ingested_at") is None:
+        return bronze_df
+    return bronze_df.filter(F.col("ingested_at") > F.lit(watermark["ingested_at"]))
+
+
+def merge_into_silver(
+    spark: "SparkSession",
+    batch_df: "DataFrame",
+    silver_path: str,
+    layout: TableLayout | None = None,
+) -> None:
+    """Insert rows whose ``id`` is not yet in silver (first-seen row wins).
+
+    Creates the table on first use. Insert-only matching keeps retries of the
+    same batch idempotent.
+    """
+    from delta.tables import DeltaTable
+
+    from workload.state import is_delta_table
+
+    if not is_delta_table(spark, silver_path):
+        write_layer(batch_df, silver_path, layout or DEFAULT_LAYOUTS["silver"])
+        return
+
+    (
+        DeltaTable.forPath(spark, silver_path)
+        .alias("t")
+        .merge(batch_df.alias("s"), "t.id = s.id")
+        .whenNotMatchedInsertAll()
+        .execute()
+    )
+
+
 def transform_silver(
     spark: "SparkSession",
     bronze_path: str,
     base_path: str = DEFAULT_BASE_PATH,
     run_id: str | None = None,
+    mode: str = "full",
+    layout: TableLayout | None = None,
+    rules: Sequence[Rule] | None = None,
+    event_dates: Sequence[_dt.date] | None = None,
+    sink: MetricsSink | None = None,
+    clean_bronze_df: Optional["DataFrame"] = None,
 ) -> str:
-    """Cleanse bronze data and write to silver Delta table."""
+    """Cleanse bronze data and write to silver Delta table.
+
+    ``mode="full"`` rebuilds silver from all of bronze (use for backfills).
+    ``mode="incremental"`` processes only bronze rows past the stored watermark
+    (change data feed when enabled, else ``ingested_at``), deduplicates that batch
+    and MERGEs it into silver on ``id``. Without a watermark or an existing silver
+    table, incremental mode falls back to a full rebuild.
+
+    With ``event_dates`` (full mode only) just those ``event_date`` partitions are
+    rebuilt with a ``replaceWhere`` overwrite and the watermark is left alone;
+    ``workload.backfill`` uses this to rebuild history slice by slice, passing
+    bronze it already deduplicated once as ``clean_bronze_df``. The write is
+    tagged so its metrics come from its own commit while other slices commit.
+    """
     from pyspark.sql import functions as F
 
+    from workload.state import is_delta_table, read_watermark, write_watermark
+
+    if mode not in ("full", "incremental"):
+        raise ValueError(f"Unknown silver mode: {mode}")
+    if event_dates is not None and (mode != "full" or not event_dates):
+        raise ValueError("event_dates needs mode='full' and at least one date")
+    if clean_bronze_df is not None and event_dates is None:
+        raise ValueError("clean_bronze_df needs event_dates")
+
     actual_run_id = run_id or _dt.datetime.utcnow().strftime("%Y%m%d%H%M%S")
     silver_path = f"{base_path}/silver"
+    layout = layout or DEFAULT_LAYOUTS["silver"]
+
+    bronze_version = _table_version(spark, bronze_path)
+    watermark = read_watermark(spark, base_path, "silver") if mode == "incremental" else None
+
+    replace_where = None
+    commit_tag = None
+    merged = watermark is not None and is_delta_table(spark, silver_path)
+    if merged:
+        batch_df = _read_bronze_increment(spark, bronze_path, bronze_version, watermark)
+        clean_df = _clean_bronze(batch_df)
+        merge_into_silver(spark, clean_df, silver_path, layout)
+        # Profile only the merged batch; the rest of silver was checked on earlier runs.
+        profiled_df = clean_df
+    else:
+        if clean_bronze_df is not None:
+            clean_df = clean_bronze_df
+        else:
+            batch_df = (
+                spark.read.format("delta").option("versionAsOf", bronze_version).load(bronze_path)
+            )
+            clean_df = _clean_bronze(batch_df)
+        if event_dates is not None:
+            # Deduplicate across all of bronze first so ids repeated on other
+            # dates resolve the same way as in a full rebuild.
+            replace_where = _date_predicate(event_dates)
+            commit_tag = f"{actual_run_id}:silver:{uuid.uuid4().hex[:8]}"
+            clean_df = clean_df.filter(F.col("event_date").isin(sorted(set(event_dates))))
+        write_layer(
+            clean_df, silver_path, layout, replace_where=replace_where, commit_tag=commit_tag
+        )
 
-    bronze_df = spark.read.format("delta").load(bronze_path)
-    clean_df = (
-        bronze_df.dropDuplicates(["id"])
-        .filter(F.col("amount").isNotNull())
-        .withColumn("event_ts", F.to_timestamp("ts"))
-        .withColumn("event_date", F.to_date("ts"))
+    # Row count comes from the write's commit, read before layout maintenance
+    # adds commits of its own.
+    metrics = commit_row_count_metrics(
+        spark, silver_path, actual_run_id, "silver", commit_tag=commit_tag
     )
-    clean_df.write.format("delta").mode("overwrite").save(silver_path)
+    if not merged:
+        # Pinned to the committed version, so deferred checks see this write.
+        profiled_df = (
+            spark.read.format("delta")
+            .option("versionAsOf", metrics[0]["details"]["table_version"])
+            .load(silver_path)
+        )
+        if replace_where is not None:
+            profiled_df = profiled_df.filter(replace_where)
+    maintain_layout(spark, silver_path, layout, where=replace_where)
 
-    total_rows = clean_df.count()
-    null_amount_rows = clean_df.filter(F.col("amount").isNull()).count()
-    non_null = evaluate_non_null("amount", total_rows, null_amount_rows)
-    metrics = [
-        build_metric_record(actual_run_id, "silver", "row_count", "OK", total_rows),
-        build_metric_record(
+    if replace_where is None:
+        max_ingested_at = batch_df.agg(F.max("ingested_at")).collect()[0][0]
+        if max_ingested_at is None and watermark is not None:
+            max_ingested_at = watermark.get("ingested_at")
+        write_watermark(
+            spark, base_path, "silver", bronze_version, max_ingested_at, actual_run_id
+        )
+
+    # The null check profiles the committed table (or merged batch) instead of
+    # re-running the dedup shuffle.
+    _record_metrics(
+        spark,
+        base_path,
+        metrics,
+        sink,
+        deferred=lambda: evaluate_rules(
+            profiled_df,
+            DEFAULT_RULES["silver"] if rules is None else rules,
             actual_run_id,
             "silver",
-            non_null["metric_name"],
-            non_null["status"],
-            non_null["value"],
-            non_null["details"],
+            include_row_count=False,
         ),
-    ]
-    _persist_metrics(spark, base_path, "silver", actual_run_id, metrics)
+    )
 
     return silver_path
 
 
+def _date_predicate(event_dates: Sequence[_dt.date]) -> str:
+    """Build a ``replaceWhere`` predicate selecting exactly ``event_dates``."""
+    values = ", ".join(f"DATE'{d.isoformat()}'" for d in sorted(set(event_dates)))
+    return f"event_date IN ({values})"
+
+
+def touched_event_dates(silver_df: "DataFrame", run_id: str) -> List[_dt.date]:
+    """Return the ``event_date`` values of silver rows written by ``run_id``."""
+    from pyspark.sql import functions as F
+
+    rows = (
+        silver_df.filter(F.col("run_id") == run_id)
+        .select("event_date")
+        .where(F.col("event_date").isNotNull())
+        .distinct()
+        .collect()
+    )
+    return sorted(row["event_date"] for row in rows)
+
+
+def build_gold_df(
+    silver_df: "DataFrame",
+    run_id: str,
+    distinct_error: float | None = None,
+    distinct_strategy: str = "single",
+) -> "DataFrame":
+    """Return the daily per-event-type gold aggregate of ``silver_df``.
+
+    Each row carries a ``user_sketch`` (HLL) so unique users can be merged
+    across rows later (see ``workload.sketches``). ``unique_users`` is an exact
+    ``countDistinct`` unless ``distinct_error`` is set, in which case it is the
+    sketch estimate and the sketch is sized for that error bound.
+    ``distinct_strategy`` selects how skewed keys are aggregated (see
+    ``workload.skew``).
+    """
+    from pyspark.sql import functions as F
+
+    lg_k = hll_lg_k(distinct_error or DEFAULT_SKETCH_ERROR)
+    gold_df = aggregate_events(
+        silver_df, lg_k, distinct_strategy, exact_users=distinct_error is None
+    )
+    if distinct_error is not None:
+        gold_df = gold_df.withColumn("unique_users", F.hll_sketch_estimate("user_sketch"))
+
+    return gold_df.select(
+        "event_date",
+        "event_type",
+        "event_count",
+        "total_amount",
+        "unique_users",
+        "user_sketch",
+        F.lit(run_id).alias("run_id"),
+    )
+
+
+def _resolve_distinct_strategy(
+    spark: "SparkSession", silver_df: "DataFrame", distinct_strategy: str
+) -> str:
+    """Return ``distinct_strategy``, choosing one from the rows per gold key for ``"auto"``."""
+    if distinct_strategy != "auto":
+        return distinct_strategy
+    parallelism = int(spark.conf.get("spark.sql.shuffle.partitions"))
+    return choose_distinct_strategy(observed_group_rows(silver_df), parallelism)
+
+
 def aggregate_gold(
     spark: "SparkSession",
     silver_path: str,
     base_path: str = DEFAULT_BASE_PATH,
     run_id: str | None = None,
+    mode: str = "full",
+    event_dates: Sequence[_dt.date] | None = None,
+    layout: TableLayout | None = None,
+    rules: Sequence[Rule] | None = None,
+    distinct_error: float | None = None,
+    sink: MetricsSink | None = None,
+    rollups: Sequence[str] | None = None,
+    distinct_strategy: str = "single",
 ) -> str:
-    """Aggregate silver data to gold Delta table."""
+    """Aggregate silver data to gold Delta table.
+
+    ``mode="full"`` regroups all of silver and overwrites gold.
+    ``mode="incremental"`` recomputes only the ``event_date`` partitions touched by
+    this run (silver rows carrying ``run_id``), or the explicit ``event_dates``, and
+    writes them with a ``replaceWhere`` overwrite so other dates stay untouched.
+    ``distinct_error`` switches ``unique_users`` to the HLL estimate (see
+    ``build_gold_df``); adding or dropping columns needs one ``full`` run.
+    The ``rollups`` tables (default: all of ``ROLLUP_GRAINS``) are refreshed for
+    the periods that contain the rewritten dates; pass ``()`` to skip them.
+    ``distinct_strategy`` is passed to ``build_gold_df``; ``"auto"`` picks one
+    from the rows per key of the silver data being aggregated, at the cost of
+    an extra scan of that data.
+    """
     from pyspark.sql import functions as F
 
+    from workload.rollups import ROLLUP_GRAINS, refresh_rollups
+    from workload.state import is_delta_table
+
+    if mode not in ("full", "incremental"):
+        raise ValueError(f"Unknown gold mode: {mode}")
+
     actual_run_id = run_id or _dt.datetime.utcnow().strftime("%Y%m%d%H%M%S")
     gold_path = f"{base_path}/gold"
+    layout = layout or DEFAULT_LAYOUTS["gold"]
 
     silver_df = spark.read.format("delta").load(silver_path)
-    gold_df = (
-        silver_df.groupBy("event_date", "event_type")
-        .agg(
-            F.count("*").alias("event_count"),
-            F.sum("amount").alias("total_amount"),
-            F.countDistinct("user_id").alias("unique_users"),
+
+    replace_where = None
+    dates = None
+    if event_dates is not None or (mode == "incremental" and is_delta_table(spark, gold_path)):
+        dates = list(event_dates) if event_dates is not None else touched_event_dates(
+            silver_df, actual_run_id
         )
-        .orderBy("event_date", "event_type")
-        .withColumn("run_id", F.lit(actual_run_id))
-    )
+        if not dates:
+            metrics = [
+                build_metric_record(
+                    actual_run_id, "gold", "rows_written", "OK", 0, {"touched_dates": 0}
+                )
+            ]
+            _record_metrics(spark, base_path, metrics, sink)
+            return gold_path
+        replace_where = _date_predicate(dates)
+        silver_df = silver_df.filter(F.col("event_date").isin(sorted(set(dates))))
 
-    gold_df.write.format("delta").mode("overwrite").save(gold_path)
+    strategy = _resolve_distinct_strategy(spark, silver_df, distinct_strategy)
+    gold_df = build_gold_df(silver_df, actual_run_id, distinct_error, strategy)
 
-    metrics = [
-        build_metric_record(actual_run_id, "gold", "row_count", "OK", gold_df.count()),
-    ]
-    _persist_metrics(spark, base_path, "gold", actual_run_id, metrics)
+    write_layer(gold_df, gold_path, layout, replace_where=replace_where)
+    # Read the write's commit stats before compaction adds an OPTIMIZE commit;
+    # recounting gold_df would re-run the aggregation.
+    metrics = commit_row_count_metrics(spark, gold_path, actual_run_id, "gold")
+    metrics[0]["details"]["distinct_strategy"] = strategy
+    maintain_layout(spark, gold_path, layout, where=replace_where)
+    # Pinned to the committed version, so deferred checks see this write.
+    written_df = (
+        spark.read.format("delta")
+        .option("versionAsOf", metrics[0]["details"]["table_version"])
+        .load(gold_path)
+    )
+    if replace_where is not None:
+        written_df = written_df.filter(replace_where)
+    metrics += refresh_rollups(
+        spark,
+        gold_path,
+        base_path,
+        actual_run_id,
+        event_dates=dates,
+        rollups=tuple(ROLLUP_GRAINS) if rollups is None else rollups,
+    )
+    _record_metrics(
+        spark,
+        base_path,
+        metrics,
+        sink,
+        deferred=lambda: evaluate_rules(
+            written_df,
+            DEFAULT_RULES["gold"] if rules is None else rules,
+            actual_run_id,
+            "gold",
+            include_row_count=False,
+        ),
+    )
 
     return gold_path
 
 
+def _run_fused(
+    spark: "SparkSession",
+    base_path: str,
+    run_id: str,
+    layouts: Dict[str, TableLayout],
+    synthetic: SyntheticConfig | None,
+    cache_boundaries: bool,
+    persist_layers: Sequence[str],
+    rules: Dict[str, Sequence[Rule]],
+    distinct_error: float | None,
+    distinct_strategy: str,
+    sink: MetricsSink,
+) -> Dict[str, str]:
+    """Run all layers as one DataFrame lineage, writing only ``persist_layers``.
+
+    With ``cache_boundaries`` the bronze and silver DataFrames are persisted in
+    memory so the writes and quality checks downstream reuse them instead of
+    re-running the lineage; without it each action recomputes from the source,
+    so ``ingested_at`` can differ slightly between the written layers.
+    Malformed rows are quarantined only when bronze is persisted.
+    """
+    from pyspark import StorageLevel
+
+    from workload.rollups import refresh_rollups
+
+    cached: List["DataFrame"] = []
+
+    def boundary(df: "DataFrame") -> "DataFrame":
+        if cache_boundaries:
+            df = df.persist(StorageLevel.MEMORY_AND_DISK)
+            cached.append(df)
+        return df
+
+    paths: Dict[str, str] = {}
+    try:
+        bronze_df, malformed_df = split_malformed(
+            boundary(build_bronze_df(spark, run_id, synthetic))
+        )
+        silver_df = boundary(_clean_bronze(bronze_df))
+        stages: Tuple[Tuple[str, Callable[[], "DataFrame"]], ...] = (
+            ("bronze", lambda: bronze_df),
+            ("silver", lambda: silver_df),
+            # Built inside the gold stage: "auto" scans silver's keys.
+            (
+                "gold",
+                lambda: build_gold_df(
+                    silver_df,
+                    run_id,
+                    distinct_error,
+                    _resolve_distinct_strategy(spark, silver_df, distinct_strategy),
+                ),
+            ),
+        )
+
+        for layer, build in stages:
+            with track_stage(spark, run_id, layer, sink):
+                df = build()
+                metrics: List[Dict[str, object]] = []
+                persisted = layer in persist_layers
+                if persisted:
+                    path = f"{base_path}/{layer}"
+                    write_layer(df, path, layouts[layer])
+                    metrics += commit_row_count_metrics(spark, path, run_id, layer)
+                    if layer == "bronze":
+                        metrics.append(
+                            write_quarantine(spark, malformed_df, base_path, run_id)
+                        )
+                    maintain_layout(spark, path, layouts[layer])
+                    paths[f"{layer}_path"] = path
+                    if layer == "gold":
+                        metrics += refresh_rollups(spark, path, base_path, run_id)
+                metrics += evaluate_rules(
+                    df, rules[layer], run_id, layer, include_row_count=not persisted
+                )
+                _record_metrics(spark, base_path, metrics, sink)
+    finally:
+        for df in cached:
+            df.unpersist()
+
+    return paths
+
+
+def _run_or_skip_stage(
+    spark: "SparkSession",
+    base_path: str,
+    run_id: str,
+    layer: str,
+    marker: Dict[str, object] | None,
+    force: bool,
+    sink: MetricsSink,
+    stage: Callable[[], str],
+) -> Tuple[str, bool]:
+    """Run ``stage`` unless ``marker`` shows it already completed for ``run_id``.
+
+    Returns the stage's table path and whether it ran. A completed stage is
+    recorded as a ``stage_skipped`` metric; a stage that ran leaves a completion
+    marker with the table version it committed. With background quality checks
+    the marker is written only once this stage's and the earlier stages' checks
+    have succeeded, so a retry reruns a stage whose checks raised.
+    """
+    from workload.state import (
+        is_delta_table,
+        operations_since,
+        stage_is_complete,
+        write_stage_marker,
+    )
+
+    if not force and marker is not None:
+        table_path = str(marker["table_path"])
+        current_version = (
+            _table_version(spark, table_path) if is_delta_table(spark, table_path) else None
+        )
+        later_operations = (
+            operations_since(spark, table_path, int(marker["table_version"]))
+            if current_version is not None and current_version > marker["table_version"]
+            else []
+        )
+        if stage_is_complete(marker, current_version, later_operations):
+            details = {"table_path": table_path, "completed_at": marker["completed_at"]}
+            sink.add(
+                [
+                    build_metric_record(
+                        run_id, layer, "stage_skipped", "OK", marker["table_version"], details
+                    )
+                ]
+            )
+            return table_path, False
+
+    with track_stage(spark, run_id, layer, sink):
+        table_path = stage()
+    # A stage may legitimately write nothing (e.g. gold with no touched dates).
+    if is_delta_table(spark, table_path):
+        version = _table_version(spark, table_path)
+        sink.after_pending(
+            lambda: write_stage_marker(spark, base_path, layer, run_id, table_path, version)
+        )
+    return table_path, True
+
+
 def run_pipeline(
     spark: "SparkSession",
     base_path: str = DEFAULT_BASE_PATH,
     run_id: str | None = None,
+    silver_mode: str = "full",
+    gold_mode: str = "full",
+    layouts: Dict[str, TableLayout] | None = None,
+    synthetic: SyntheticConfig | None = None,
+    rules: Dict[str, Sequence[Rule]] | None = None,
+    distinct_error: float | None = None,
+    fused: bool = False,
+    cache_boundaries: bool = True,
+    persist_layers: Sequence[str] = PIPELINE_LAYERS,
+    force_stages: Sequence[str] = (),
+    distinct_strategy: str = "single",
+    async_metrics: bool = False,
 ) -> Dict[str, str]:
-    """Execute the full bronze → silver → gold pipeline."""
+    """Execute the full bronze → silver → gold pipeline.
+
+    ``silver_mode`` and ``gold_mode`` are passed to ``transform_silver`` and
+    ``aggregate_gold`` (``"full"`` or ``"incremental"``). ``layouts`` overrides
+    ``DEFAULT_LAYOUTS`` and ``rules`` overrides ``DEFAULT_RULES`` per layer.
+    ``synthetic`` switches bronze ingestion to the scalable generator.
+    ``distinct_error`` turns on approximate distinct counts with that relative
+    error: ``Unique`` rules use HyperLogLog++ and gold ``unique_users`` comes
+    from the stored sketches. ``distinct_strategy`` (``"single"``, ``"two_phase"``,
+    ``"salted"`` or ``"auto"``) controls how gold handles skewed keys.
+
+    ``fused=True`` passes DataFrames between stages instead of writing and
+    re-reading each layer, and writes only ``persist_layers`` (metrics are
+    always recorded). It supports full modes only and does not advance the
+    silver watermark; it is meant for local and test runs. The returned dict
+    has a ``<layer>_path`` entry only for layers that were written.
+
+    Each completed stage leaves a marker (``run_id``, stage, Delta table version)
+    in ``{base_path}/_state/stage_markers``. Re-running with the same ``run_id``
+    skips stages whose marker is still valid, so a retry after a failure only
+    runs the failed stage and the ones after it. ``force_stages`` reruns the
+    named stages (and every later stage) regardless.
+
+    Metric records from all stages are buffered in a ``MetricsSink`` and written
+    in a single append once the run finishes, or once a stage fails. Each stage
+    runs under its own Spark job group and adds a ``stage_execution`` record
+    (wall time, tasks, I/O, shuffle and spill; see ``workload.execution_metrics``).
+
+    ``async_metrics=True`` (staged runs only) runs each stage's quality checks
+    as background Spark jobs while the next stage runs, and waits for all of
+    them before the metrics are written. A check that raises fails the run once
+    every check has finished, and its stage (like every later stage) gets no
+    completion marker. The background jobs run outside the stages' job groups,
+    so ``stage_execution`` records no longer include them.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from workload.state import read_stage_markers
+
     actual_run_id = run_id or _dt.datetime.utcnow().strftime("%Y%m%d%H%M%S")
-    bronze_path = ingest_bronze(spark, base_path, actual_run_id)
-    silver_path = transform_silver(spark, bronze_path, base_path, actual_run_id)
-    gold_path = aggregate_gold(spark, silver_path, base_path, actual_run_id)
+    layouts = {**DEFAULT_LAYOUTS, **(layouts or {})}
+    rules = {**DEFAULT_RULES, **(rules or {})}
+    if distinct_error is not None:
+        rules = {layer: with_relative_error(r, distinct_error) for layer, r in rules.items()}
 
-    return {
-        "run_id": actual_run_id,
-        "bronze_path": bronze_path,
-        "silver_path": silver_path,
-        "gold_path": gold_path,
-        "metrics_path": f"{base_path}/metrics",
-    }
+    if distinct_strategy != "auto" and distinct_strategy not in DISTINCT_STRATEGIES:
+        raise ValueError(f"Unknown distinct strategy: {distinct_strategy}")
+    unknown_stages = set(force_stages) - set(PIPELINE_LAYERS)
+    if unknown_stages:
+        raise ValueError(f"Unknown stages to force: {sorted(unknown_stages)}")
+    if fused:
+        unknown = set(persist_layers) - set(PIPELINE_LAYERS)
+        if unknown:
+            raise ValueError(f"Unknown layers to persist: {sorted(unknown)}")
+        if silver_mode != "full" or gold_mode != "full":
+            raise ValueError("Fused execution supports only full silver and gold modes")
+        if async_metrics:
+            raise ValueError("async_metrics is not supported with fused execution")
+
+    executor = ThreadPoolExecutor(max_workers=len(PIPELINE_LAYERS)) if async_metrics else None
+    sink = MetricsSink(spark, base_path, executor)
+    try:
+        if fused:
+            paths = _run_fused(
+                spark,
+                base_path,
+                actual_run_id,
+                layouts,
+                synthetic,
+                cache_boundaries,
+                persist_layers,
+                rules,
+                distinct_error,
+                distinct_strategy,
+                sink,
+            )
+        else:
+            markers = read_stage_markers(spark, base_path, actual_run_id)
+            # Once a stage runs, every later stage runs too: its input changed.
+            rerun = False
+            bronze_path, rerun = _run_or_skip_stage(
+                spark,
+                base_path,
+                actual_run_id,
+                "bronze",
+                markers.get("bronze"),
+                rerun or "bronze" in force_stages,
+                sink,
+                lambda: ingest_bronze(
+                    spark,
+                    base_path,
+                    actual_run_id,
+                    layout=layouts["bronze"],
+                    rules=rules["bronze"],
+                    synthetic=synthetic,
+                    sink=sink,
+                ),
+            )
+            silver_path, rerun = _run_or_skip_stage(
+                spark,
+                base_path,
+                actual_run_id,
+                "silver",
+                markers.get("silver"),
+                rerun or "silver" in force_stages,
+                sink,
+                lambda: transform_silver(
+                    spark,
+                    bronze_path,
+                    base_path,
+                    actual_run_id,
+                    mode=silver_mode,
+                    layout=layouts["silver"],
+                    rules=rules["silver"],
+                    sink=sink,
+                ),
+            )
+            gold_path, _ = _run_or_skip_stage(
+                spark,
+                base_path,
+                actual_run_id,
+                "gold",
+                markers.get("gold"),
+                rerun or "gold" in force_stages,
+                sink,
+                lambda: aggregate_gold(
+                    spark,
+                    silver_path,
+                    base_path,
+                    actual_run_id,
+                    mode=gold_mode,
+                    layout=layouts["gold"],
+                    rules=rules["gold"],
+                    distinct_error=distinct_error,
+                    sink=sink,
+                    distinct_strategy=distinct_strategy,
+                ),
+            )
+            paths = {
+                "bronze_path": bronze_path,
+                "silver_path": silver_path,
+                "gold_path": gold_path,
+            }
+        errors = sink.join()
+        if errors:
+            raise RuntimeError(f"{len(errors)} quality metric computation(s) failed") from errors[0]
+    except Exception:
+        # Keep the metrics of the stages that completed; the stage error still propagates.
+        sink.join()
+        sink.flush()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    sink.flush()
+
+    return {"run_id": actual_run_id, **paths, "metrics_path": metrics_table_path(base_path)}
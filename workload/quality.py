@@ -32,18 +32,73 @@ def evaluate_non_null(column: str, total_rows: int, null_rows: int) -> Dict[str,
 
 
 def evaluate_uniqueness(
-    column: str, total_rows: int, distinct_rows: int
+    column: str,
+    total_rows: int,
+    distinct_rows: int,
+    relative_error: Optional[float] = None,
 ) -> Dict[str, object]:
-    """Return a metric record for uniqueness enforcement on a column."""
-    status = "OK" if total_rows == distinct_rows else "FAIL"
+    """Return a metric record for uniqueness enforcement on a column.
+
+    With ``relative_error`` the distinct count is an estimate; the check passes
+    while it stays within two standard errors of ``total_rows``, so duplicate
+    rates below that tolerance go undetected.
+    """
+    if relative_error is None:
+        status = "OK" if total_rows == distinct_rows else "FAIL"
+    else:
+        status = "OK" if distinct_rows >= total_rows * (1 - 2 * relative_error) else "FAIL"
+    details: Dict[str, object] = {
+        "distinct_rows": distinct_rows,
+        "total_rows": total_rows,
+        "distinct_rate": rate(distinct_rows, total_rows),
+    }
+    if relative_error is not None:
+        details["relative_error"] = relative_error
     return {
         "metric_name": f"{column}_unique",
         "status": status,
         "value": distinct_rows,
+        "details": details,
+    }
+
+
+def evaluate_violations(
+    metric_name: str,
+    total_rows: int,
+    violating_rows: int,
+    params: Optional[Dict[str, object]] = None,
+) -> Dict[str, object]:
+    """Return a metric record for a row-level rule (range, allowed values, pattern)."""
+    status = "OK" if violating_rows == 0 else "FAIL"
+    return {
+        "metric_name": metric_name,
+        "status": status,
+        "value": violating_rows,
         "details": {
-            "distinct_rows": distinct_rows,
+            **(params or {}),
+            "violating_rows": violating_rows,
             "total_rows": total_rows,
-            "distinct_rate": rate(distinct_rows, total_rows),
+            "violation_rate": rate(violating_rows, total_rows),
+        },
+    }
+
+
+def evaluate_freshness(
+    column: str, age_seconds: Optional[int], max_age_seconds: int
+) -> Dict[str, object]:
+    """Return a metric record comparing the newest value's age to ``max_age_seconds``.
+
+    ``age_seconds`` is None when the table is empty or the column is all null,
+    which counts as stale.
+    """
+    status = "OK" if age_seconds is not None and age_seconds <= max_age_seconds else "FAIL"
+    return {
+        "metric_name": f"{column}_freshness",
+        "status": status,
+        "value": age_seconds,
+        "details": {
+            "age_seconds": age_seconds,
+            "max_age_seconds": max_age_seconds,
         },
     }
 
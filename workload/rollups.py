@@ -0,0 +1,130 @@
+"""Materialized weekly and monthly rollups of the gold table.
+
+Dashboards read ``{base_path}/gold_weekly`` and ``{base_path}/gold_monthly``
+(see sql/analytics_queries.sql) instead of re-aggregating gold on every refresh.
+Each rollup row sums gold's counts for one ``period_start``/``event_type`` and
+merges the per-day ``user_sketch`` values, so ``unique_users`` counts a user
+once per period (an HLL estimate even when gold's daily counts are exact).
+
+Incremental refreshes recompute only the periods that contain the gold dates
+just written and replace them with a ``replaceWhere`` overwrite.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+from workload.pipeline import TableLayout, commit_row_count_metrics, write_layer
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame, SparkSession
+
+
+# Rollup name -> Spark ``date_trunc`` unit. Weeks start on Monday.
+ROLLUP_GRAINS: Dict[str, str] = {"weekly": "week", "monthly": "month"}
+
+# A few rows per period: one small file, sorted for readable scans, no shuffle.
+DEFAULT_ROLLUP_LAYOUT = TableLayout(sort_within_partitions=("period_start", "event_type"))
+
+
+def rollup_path(base_path: str, rollup: str) -> str:
+    """Return the table path of a rollup (``gold_weekly``, ``gold_monthly``)."""
+    return f"{base_path}/gold_{rollup}"
+
+
+def period_start(day: _dt.date, rollup: str) -> _dt.date:
+    """Return the first day of the ``rollup`` period containing ``day``."""
+    if rollup == "weekly":
+        return day - _dt.timedelta(days=day.weekday())
+    if rollup == "monthly":
+        return day.replace(day=1)
+    raise ValueError(f"Unknown rollup: {rollup}")
+
+
+def period_end(start: _dt.date, rollup: str) -> _dt.date:
+    """Return the first day after the ``rollup`` period starting at ``start``."""
+    if rollup == "weekly":
+        return start + _dt.timedelta(days=7)
+    return (start.replace(day=28) + _dt.timedelta(days=4)).replace(day=1)
+
+
+def affected_periods(event_dates: Iterable[_dt.date], rollup: str) -> List[_dt.date]:
+    """Return the sorted, distinct period starts covering ``event_dates``."""
+    return sorted({period_start(day, rollup) for day in event_dates})
+
+
+def _period_predicate(periods: Sequence[_dt.date]) -> str:
+    literals = ", ".join(f"DATE'{period.isoformat()}'" for period in periods)
+    return f"period_start IN ({literals})"
+
+
+def build_rollup_df(gold_df: "DataFrame", rollup: str, run_id: str) -> "DataFrame":
+    """Roll gold rows up to ``rollup`` periods per ``event_type``."""
+    from pyspark.sql import functions as F
+
+    if rollup not in ROLLUP_GRAINS:
+        raise ValueError(f"Unknown rollup: {rollup}")
+
+    return (
+        gold_df.withColumn(
+            "period_start", F.to_date(F.date_trunc(ROLLUP_GRAINS[rollup], "event_date"))
+        )
+        .groupBy("period_start", "event_type")
+        .agg(
+            F.sum("event_count").alias("event_count"),
+            F.sum("total_amount").alias("total_amount"),
+            # Gold sketches written with different error bounds still merge.
+            F.hll_union_agg("user_sketch", True).alias("user_sketch"),
+        )
+        .select(
+            "period_start",
+            "event_type",
+            "event_count",
+            "total_amount",
+            F.hll_sketch_estimate("user_sketch").alias("unique_users"),
+            "user_sketch",
+            F.lit(run_id).alias("run_id"),
+        )
+    )
+
+
+def refresh_rollups(
+    spark: "SparkSession",
+    gold_path: str,
+    base_path: str,
+    run_id: str,
+    event_dates: Optional[Sequence[_dt.date]] = None,
+    rollups: Sequence[str] = tuple(ROLLUP_GRAINS),
+    layout: TableLayout = DEFAULT_ROLLUP_LAYOUT,
+) -> List[Dict[str, object]]:
+    """Rebuild the rollup tables from gold and return their row count metrics.
+
+    Without ``event_dates`` each rollup is rebuilt from all of gold; with them
+    only the periods containing those dates are recomputed and replaced.
+    """
+    from pyspark.sql import functions as F
+
+    gold_df = spark.read.format("delta").load(gold_path)
+    metrics = []
+    for rollup in rollups:
+        source_df = gold_df
+        replace_where = None
+        if event_dates is not None:
+            periods = affected_periods(event_dates, rollup)
+            if not periods:
+                continue
+            # Whole periods are re-read so their sums and sketches stay complete.
+            source_df = gold_df.filter(
+                (F.col("event_date") >= F.lit(periods[0]))
+                & (F.col("event_date") < F.lit(period_end(periods[-1], rollup)))
+            )
+            replace_where = _period_predicate(periods)
+
+        rollup_df = build_rollup_df(source_df, rollup, run_id)
+        if replace_where is not None:
+            rollup_df = rollup_df.filter(replace_where)
+        path = rollup_path(base_path, rollup)
+        write_layer(rollup_df, path, layout, replace_where=replace_where)
+        metrics += commit_row_count_metrics(spark, path, run_id, f"gold_{rollup}")
+    return metrics
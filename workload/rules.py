@@ -0,0 +1,307 @@
+"""Declarative data quality rules compiled into a single Spark aggregation.
+
+Each rule contributes one or more aggregate expressions; ``evaluate_rules`` runs
+all of them (plus the row count) in one ``agg`` and turns the resulting profile
+into ``build_metric_record`` rows with the pure-Python evaluators from
+``workload.quality``. Null values only count against ``NonNull``; the other rules
+ignore them.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from workload.quality import (
+    build_metric_record,
+    evaluate_freshness,
+    evaluate_non_null,
+    evaluate_uniqueness,
+    evaluate_violations,
+)
+
+if TYPE_CHECKING:
+    from pyspark.sql import Column, DataFrame
+
+
+_ROW_COUNT = "__row_count"
+
+
+@dataclass(frozen=True)
+class Rule(ABC):
+    """Base class: a check on one column producing one metric."""
+
+    column: str
+
+    @property
+    @abstractmethod
+    def metric_name(self) -> str:
+        """Name of the metric record the rule produces."""
+
+    def _key(self, suffix: str) -> str:
+        return f"{self.metric_name}__{suffix}"
+
+    @abstractmethod
+    def expressions(self) -> Dict[str, "Column"]:
+        """Return aggregate expressions keyed by their alias in the profile row."""
+
+    @abstractmethod
+    def evaluate(self, profile: Dict[str, object], total_rows: int) -> Dict[str, object]:
+        """Turn the aggregated profile into a check result."""
+
+
+@dataclass(frozen=True)
+class NonNull(Rule):
+    """No null values in ``column``."""
+
+    @property
+    def metric_name(self) -> str:
+        return f"{self.column}_non_null"
+
+    def expressions(self) -> Dict[str, "Column"]:
+        from pyspark.sql import functions as F
+
+        return {self._key("nulls"): F.count(F.when(F.col(self.column).isNull(), 1))}
+
+    def evaluate(self, profile: Dict[str, object], total_rows: int) -> Dict[str, object]:
+        return evaluate_non_null(self.column, total_rows, profile[self._key("nulls")])
+
+
+@dataclass(frozen=True)
+class Unique(Rule):
+    """Every non-null value in ``column`` is distinct.
+
+    The distinct count is compared with the non-null rows, since both
+    ``countDistinct`` and ``approx_count_distinct`` skip nulls. With
+    ``relative_error`` the distinct count uses ``approx_count_distinct``
+    (HyperLogLog++) instead of an exact ``countDistinct``.
+    """
+
+    relative_error: Optional[float] = None
+
+    @property
+    def metric_name(self) -> str:
+        return f"{self.column}_unique"
+
+    def expressions(self) -> Dict[str, "Column"]:
+        from pyspark.sql import functions as F
+
+        if self.relative_error is not None:
+            distinct = F.approx_count_distinct(F.col(self.column), self.relative_error)
+        else:
+            distinct = F.countDistinct(F.col(self.column))
+        return {
+            self._key("distinct"): distinct,
+            self._key("non_null"): F.count(F.col(self.column)),
+        }
+
+    def evaluate(self, profile: Dict[str, object], total_rows: int) -> Dict[str, object]:
+        non_null_rows = profile[self._key("non_null")]
+        check = evaluate_uniqueness(
+            self.column, non_null_rows, profile[self._key("distinct")], self.relative_error
+        )
+        check["details"]["null_rows"] = total_rows - non_null_rows
+        return check
+
+
+@dataclass(frozen=True)
+class Range(Rule):
+    """Values lie within ``[min_value, max_value]`` (either bound may be omitted)."""
+
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.min_value is None and self.max_value is None:
+            raise ValueError(f"Range rule on {self.column} needs min_value or max_value")
+
+    @property
+    def metric_name(self) -> str:
+        return f"{self.column}_range"
+
+    def expressions(self) -> Dict[str, "Column"]:
+        from pyspark.sql import functions as F
+
+        column = F.col(self.column)
+        outside = F.lit(False)
+        if self.min_value is not None:
+            outside = outside | (column < F.lit(self.min_value))
+        if self.max_value is not None:
+            outside = outside | (column > F.lit(self.max_value))
+        return {self._key("violations"): F.count(F.when(outside, 1))}
+
+    def evaluate(self, profile: Dict[str, object], total_rows: int) -> Dict[str, object]:
+        return evaluate_violations(
+            self.metric_name,
+            total_rows,
+            profile[self._key("violations")],
+            {"min_value": self.min_value, "max_value": self.max_value},
+        )
+
+
+@dataclass(frozen=True)
+class AllowedValues(Rule):
+    """Values are one of ``values``."""
+
+    values: Tuple[object, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not self.values:
+            raise ValueError(f"AllowedValues rule on {self.column} needs at least one value")
+
+    @property
+    def metric_name(self) -> str:
+        return f"{self.column}_allowed_values"
+
+    def expressions(self) -> Dict[str, "Column"]:
+        from pyspark.sql import functions as F
+
+        outside = ~F.col(self.column).isin(list(self.values))
+        return {self._key("violations"): F.count(F.when(outside, 1))}
+
+    def evaluate(self, profile: Dict[str, object], total_rows: int) -> Dict[str, object]:
+        return evaluate_violations(
+            self.metric_name,
+            total_rows,
+            profile[self._key("violations")],
+            {"allowed_values": ",".join(str(value) for value in self.values)},
+        )
+
+
+@dataclass(frozen=True)
+class Regex(Rule):
+    """String values fully match ``pattern``.
+
+    The pattern is evaluated by Spark's ``rlike``, so it uses the Java regex
+    dialect (``java.util.regex``), not Python's ``re``; an invalid pattern fails
+    when the rules are evaluated.
+    """
+
+    pattern: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.pattern:
+            raise ValueError(f"Regex rule on {self.column} needs a pattern")
+
+    @property
+    def metric_name(self) -> str:
+        return f"{self.column}_pattern"
+
+    def expressions(self) -> Dict[str, "Column"]:
+        from pyspark.sql import functions as F
+
+        anchored = f"^(?:{self.pattern})$"
+        mismatch = ~F.col(self.column).cast("string").rlike(anchored)
+        return {self._key("violations"): F.count(F.when(mismatch, 1))}
+
+    def evaluate(self, profile: Dict[str, object], total_rows: int) -> Dict[str, object]:
+        return evaluate_violations(
+            self.metric_name,
+            total_rows,
+            profile[self._key("violations")],
+            {"pattern": self.pattern},
+        )
+
+
+@dataclass(frozen=True)
+class Freshness(Rule):
+    """The newest timestamp in ``column`` is at most ``max_age_seconds`` old."""
+
+    max_age_seconds: int = 24 * 3600
+
+    @property
+    def metric_name(self) -> str:
+        return f"{self.column}_freshness"
+
+    def expressions(self) -> Dict[str, "Column"]:
+        from pyspark.sql import functions as F
+
+        # Age is computed on the cluster so session time zones do not matter.
+        age = F.unix_timestamp(F.current_timestamp()) - F.unix_timestamp(
+            F.max(F.col(self.column))
+        )
+        return {self._key("age_seconds"): age}
+
+    def evaluate(self, profile: Dict[str, object], total_rows: int) -> Dict[str, object]:
+        return evaluate_freshness(
+            self.column, profile[self._key("age_seconds")], self.max_age_seconds
+        )
+
+
+def with_relative_error(rules: Sequence[Rule], relative_error: float) -> Tuple[Rule, ...]:
+    """Return ``rules`` with every exact ``Unique`` rule switched to approximate counting."""
+    return tuple(
+        replace(rule, relative_error=relative_error)
+        if isinstance(rule, Unique) and rule.relative_error is None
+        else rule
+        for rule in rules
+    )
+
+
+def check_rule_names(rules: Sequence[Rule]) -> None:
+    """Raise ``ValueError`` when two rules would produce the same metric."""
+    names = [rule.metric_name for rule in rules]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate quality rules: {duplicates}")
+
+
+def evaluate_rules(
+    df: "DataFrame",
+    rules: Sequence[Rule],
+    run_id: str,
+    layer: str,
+    include_row_count: bool = True,
+) -> List[Dict[str, object]]:
+    """Evaluate ``rules`` on ``df`` in one aggregation and return metric records.
+
+    Set ``include_row_count=False`` when the row count is already recorded from
+    the Delta commit (see ``commit_row_count_metrics``).
+    """
+    check_rule_names(rules)
+    if not rules and not include_row_count:
+        return []
+
+    from pyspark.sql import functions as F
+
+    exprs = [F.count(F.lit(1)).alias(_ROW_COUNT)]
+    for rule in rules:
+        exprs += [expr.alias(alias) for alias, expr in rule.expressions().items()]
+    profile = df.agg(*exprs).collect()[0].asDict()
+
+    return records_from_profile(
+        rules, profile, profile[_ROW_COUNT], run_id, layer, include_row_count
+    )
+
+
+def records_from_profile(
+    rules: Sequence[Rule],
+    profile: Dict[str, object],
+    total_rows: int,
+    run_id: str,
+    layer: str,
+    include_row_count: bool = True,
+) -> List[Dict[str, object]]:
+    """Turn an aggregated ``profile`` (keyed like ``Rule.expressions``) into metric records.
+
+    Shared by every engine that computes rule profiles, so their records match.
+    """
+    records = (
+        [build_metric_record(run_id, layer, "row_count", "OK", total_rows)]
+        if include_row_count
+        else []
+    )
+    for rule in rules:
+        check = rule.evaluate(profile, total_rows)
+        records.append(
+            build_metric_record(
+                run_id,
+                layer,
+                check["metric_name"],
+                check["status"],
+                check["value"],
+                check["details"],
+            )
+        )
+    return records
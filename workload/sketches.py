@@ -0,0 +1,65 @@
+"""HyperLogLog sketch helpers for approximate, mergeable distinct counts.
+
+Gold stores one ``user_sketch`` (Spark's ``hll_sketch_agg`` binary) per
+``event_date``/``event_type`` row. Sketches merge with ``hll_union_agg``, so unique
+users over any date range come from the gold table alone instead of a rescan of
+silver.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import math
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from pyspark.sql import SparkSession
+
+
+# Relative standard error used for gold sketches when no error bound is given.
+DEFAULT_SKETCH_ERROR = 0.02
+
+# ``lgConfigK`` range accepted by Spark's ``hll_sketch_agg``.
+MIN_LG_K = 4
+MAX_LG_K = 21
+
+
+def hll_lg_k(relative_error: float) -> int:
+    """Return the smallest ``lgConfigK`` whose standard error is within ``relative_error``.
+
+    An HLL sketch with ``2**lg_k`` buckets has a relative standard error of about
+    ``1.04 / sqrt(2**lg_k)``.
+    """
+    if not 0 < relative_error < 1:
+        raise ValueError(f"relative_error must be between 0 and 1, got {relative_error}")
+    lg_k = max(MIN_LG_K, math.ceil(2 * math.log2(1.04 / relative_error)))
+    if lg_k > MAX_LG_K:
+        raise ValueError(
+            f"relative_error {relative_error} needs lgConfigK {lg_k} (max {MAX_LG_K})"
+        )
+    return lg_k
+
+
+def unique_users_between(
+    spark: "SparkSession",
+    gold_path: str,
+    start: _dt.date,
+    end: _dt.date,
+    event_type: Optional[str] = None,
+) -> int:
+    """Estimate distinct users from ``start`` to ``end`` (inclusive) by merging gold sketches."""
+    from pyspark.sql import functions as F
+
+    gold_df = (
+        spark.read.format("delta")
+        .load(gold_path)
+        .filter(F.col("event_date").between(F.lit(start), F.lit(end)))
+    )
+    if event_type is not None:
+        gold_df = gold_df.filter(F.col("event_type") == event_type)
+
+    # Sketches written with different error bounds can still be merged.
+    merged = gold_df.agg(
+        F.hll_sketch_estimate(F.hll_union_agg("user_sketch", True)).alias("unique_users")
+    ).collect()[0]["unique_users"]
+    return int(merged or 0)
@@ -0,0 +1,122 @@
+"""Skew-aware strategies for the gold aggregate and its distinct user count.
+
+Grouping silver by ``event_date, event_type`` puts every row of a key in one
+task, so a dominant event type (e.g. ``purchase``) leaves a few tasks doing most
+of the work. The strategies trade extra shuffles for balance:
+
+- ``single``: one ``groupBy`` with ``countDistinct`` (fine for even keys)
+- ``two_phase``: pre-aggregate ``(event_date, event_type, user_id)``, then count
+  the deduplicated users per key; the second shuffle carries one row per user
+- ``salted``: like ``two_phase``, but the per-key step is split across
+  ``salt_buckets`` partial aggregates keyed by a hash of ``user_id``, so a hot
+  key is spread over several tasks. A user always lands in the same bucket, so
+  the partial distinct counts add up exactly (merged sketches can round
+  slightly differently from one sketch per key).
+
+``choose_distinct_strategy`` picks one from the observed rows per key.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Sequence
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+
+
+GOLD_KEYS = ("event_date", "event_type")
+
+DISTINCT_STRATEGIES = ("single", "two_phase", "salted")
+
+# A key holding this many tasks' worth of rows (at an even spread) is hot.
+DEFAULT_HOT_KEY_FACTOR = 4.0
+
+# Below this many rows the extra shuffles cost more than the skew.
+DEFAULT_MIN_SKEW_ROWS = 1_000_000
+
+DEFAULT_SALT_BUCKETS = 16
+
+
+def choose_distinct_strategy(
+    group_rows: Sequence[int],
+    parallelism: int,
+    hot_key_factor: float = DEFAULT_HOT_KEY_FACTOR,
+    min_rows: int = DEFAULT_MIN_SKEW_ROWS,
+) -> str:
+    """Pick ``single``, ``two_phase`` or ``salted`` from the rows per gold key.
+
+    ``parallelism`` is the number of shuffle tasks. The largest key is hot when
+    it holds at least ``hot_key_factor`` times the rows one task would get from
+    an even spread; hot keys are salted. With fewer keys than tasks the
+    aggregation cannot fill the cluster, so users are deduplicated first.
+    """
+    sizes = [rows for rows in group_rows if rows > 0]
+    total = sum(sizes)
+    if not sizes or total < min_rows:
+        return "single"
+    if max(sizes) * max(parallelism, 1) >= hot_key_factor * total:
+        return "salted"
+    if len(sizes) < parallelism:
+        return "two_phase"
+    return "single"
+
+
+def observed_group_rows(df: "DataFrame") -> List[int]:
+    """Return the row count of every gold key in ``df`` (reads only the key columns)."""
+    return [row["count"] for row in df.groupBy(*GOLD_KEYS).count().collect()]
+
+
+def aggregate_events(
+    df: "DataFrame",
+    lg_k: int,
+    strategy: str = "single",
+    exact_users: bool = True,
+    salt_buckets: int = DEFAULT_SALT_BUCKETS,
+) -> "DataFrame":
+    """Aggregate events per gold key with ``strategy``.
+
+    Returns the keys plus ``event_count``, ``total_amount`` and ``user_sketch``
+    (``hll_sketch_agg`` with ``lg_k``), and ``unique_users`` when ``exact_users``
+    is set or the strategy gets the exact count for free.
+    """
+    from pyspark.sql import functions as F
+
+    if strategy not in DISTINCT_STRATEGIES:
+        raise ValueError(f"Unknown distinct strategy: {strategy}")
+
+    if strategy == "single":
+        aggregates = [
+            F.count("*").alias("event_count"),
+            F.sum("amount").alias("total_amount"),
+            F.hll_sketch_agg("user_id", lg_k).alias("user_sketch"),
+        ]
+        if exact_users:
+            aggregates.append(F.countDistinct("user_id").alias("unique_users"))
+        return df.groupBy(*GOLD_KEYS).agg(*aggregates)
+
+    per_user = df.groupBy(*GOLD_KEYS, "user_id").agg(
+        F.count("*").alias("event_count"),
+        F.sum("amount").alias("total_amount"),
+    )
+    # count("user_id") skips the null user, as countDistinct does.
+    user_aggregates = [
+        F.sum("event_count").alias("event_count"),
+        F.sum("total_amount").alias("total_amount"),
+        F.hll_sketch_agg("user_id", lg_k).alias("user_sketch"),
+        F.count("user_id").alias("unique_users"),
+    ]
+    if strategy == "two_phase":
+        return per_user.groupBy(*GOLD_KEYS).agg(*user_aggregates)
+
+    salted = per_user.withColumn("salt", F.pmod(F.xxhash64("user_id"), F.lit(salt_buckets)))
+    return (
+        salted.groupBy(*GOLD_KEYS, "salt")
+        .agg(*user_aggregates)
+        .groupBy(*GOLD_KEYS)
+        .agg(
+            F.sum("event_count").alias("event_count"),
+            F.sum("total_amount").alias("total_amount"),
+            F.hll_union_agg("user_sketch").alias("user_sketch"),
+            F.sum("unique_users").alias("unique_users"),
+        )
+    )
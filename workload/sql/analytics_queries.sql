@@ -6,6 +6,16 @@ CREATE TABLE IF NOT EXISTS guardrails_demo_gold
 USING DELTA
 LOCATION 'dbfs:/tmp/guardrails_demo/gold';
 
+-- Weekly and monthly rollups, refreshed by every gold run (workload/rollups.py).
+-- Dashboards over weeks or months should read these instead of regrouping gold.
+CREATE TABLE IF NOT EXISTS guardrails_demo_gold_weekly
+USING DELTA
+LOCATION 'dbfs:/tmp/guardrails_demo/gold_weekly';
+
+CREATE TABLE IF NOT EXISTS guardrails_demo_gold_monthly
+USING DELTA
+LOCATION 'dbfs:/tmp/guardrails_demo/gold_monthly';
+
 -- Daily revenue by event type
 SELECT
   event_date,
@@ -31,3 +41,51 @@ FROM guardrails_demo_gold
 GROUP BY event_date
 ORDER BY event_date;
 
+
+-- Last 7 days by event type. Filtering on event_date lets Delta skip files
+-- outside the window (gold is Z-ordered by event_date, event_type).
+SELECT
+  event_type,
+  SUM(event_count) AS total_events,
+  SUM(total_amount) AS total_amount
+FROM guardrails_demo_gold
+WHERE event_date >= DATE_SUB(CURRENT_DATE(), 7)
+GROUP BY event_type
+ORDER BY event_type;
+
+-- Unique users per event type over the last 30 days. Summing unique_users
+-- across days double-counts returning users; merging the per-day HLL
+-- sketches does not.
+SELECT
+  event_type,
+  hll_sketch_estimate(hll_union_agg(user_sketch, true)) AS unique_users
+FROM guardrails_demo_gold
+WHERE event_date >= DATE_SUB(CURRENT_DATE(), 30)
+GROUP BY event_type
+ORDER BY event_type;
+
+-- Weekly revenue by event type, straight from the rollup. unique_users counts
+-- each user once per week (merged sketches), unlike a sum of daily values.
+SELECT
+  period_start AS week_start,
+  event_type,
+  event_count AS total_events,
+  total_amount,
+  unique_users
+FROM guardrails_demo_gold_weekly
+WHERE period_start >= DATE_SUB(CURRENT_DATE(), 84)
+ORDER BY week_start, event_type;
+
+-- Monthly refund ratio from the monthly rollup.
+SELECT
+  period_start AS month_start,
+  SUM(CASE WHEN event_type = 'refund' THEN total_amount ELSE 0 END) AS refund_amount,
+  SUM(total_amount) AS net_amount,
+  ROUND(
+    SUM(CASE WHEN event_type = 'refund' THEN total_amount ELSE 0 END) /
+    NULLIF(SUM(total_amount), 0),
+    4
+  ) AS refund_ratio
+FROM guardrails_demo_gold_monthly
+GROUP BY period_start
+ORDER BY month_start;
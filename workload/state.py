@@ -0,0 +1,214 @@
+"""Small Delta-backed state tables used for pipeline bookkeeping.
+
+State lives under ``{base_path}/_state`` next to the layer tables, so it is
+versioned, survives cluster restarts and can be inspected with plain SQL.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+if TYPE_CHECKING:
+    from pyspark.sql import SparkSession
+
+
+WATERMARK_SCHEMA = (
+    "target STRING, source_version BIGINT, ingested_at TIMESTAMP, "
+    "run_id STRING, updated_at TIMESTAMP"
+)
+
+
+def state_path(base_path: str, name: str) -> str:
+    """Return the location of a state table under ``base_path``."""
+    return f"{base_path}/_state/{name}"
+
+
+def is_delta_table(spark: "SparkSession", path: str) -> bool:
+    """Return True if ``path`` holds a Delta table."""
+    from delta.tables import DeltaTable
+
+    return DeltaTable.isDeltaTable(spark, path)
+
+
+def read_watermark(
+    spark: "SparkSession", base_path: str, target: str
+) -> Optional[Dict[str, object]]:
+    """Return the latest watermark recorded for ``target`` (or None)."""
+    from pyspark.sql import functions as F
+
+    path = state_path(base_path, "watermarks")
+    if not is_delta_table(spark, path):
+        return None
+
+    rows = (
+        spark.read.format("delta")
+        .load(path)
+        .filter(F.col("target") == target)
+        .orderBy(F.col("updated_at").desc())
+        .limit(1)
+        .collect()
+    )
+    return rows[0].asDict() if rows else None
+
+
+def write_watermark(
+    spark: "SparkSession",
+    base_path: str,
+    target: str,
+    source_version: Optional[int],
+    ingested_at: Optional[_dt.datetime],
+    run_id: str,
+) -> None:
+    """Append a watermark row for ``target``; the newest row wins on read."""
+    row = (target, source_version, ingested_at, run_id, _dt.datetime.utcnow())
+    (
+        spark.createDataFrame([row], schema=WATERMARK_SCHEMA)
+        .write.format("delta")
+        .mode("append")
+        .save(state_path(base_path, "watermarks"))
+    )
+
+
+BACKFILL_SCHEMA = (
+    "backfill_id STRING, slice_start DATE, slice_end DATE, status STRING, "
+    "attempt INT, run_id STRING, error STRING, updated_at TIMESTAMP"
+)
+
+
+def record_backfill_slice(
+    spark: "SparkSession",
+    base_path: str,
+    backfill_id: str,
+    slice_start: _dt.date,
+    slice_end: _dt.date,
+    status: str,
+    attempt: int,
+    run_id: str,
+    error: Optional[str] = None,
+) -> None:
+    """Append the outcome of one backfill slice attempt."""
+    row = (
+        backfill_id,
+        slice_start,
+        slice_end,
+        status,
+        attempt,
+        run_id,
+        error,
+        _dt.datetime.utcnow(),
+    )
+    (
+        spark.createDataFrame([row], schema=BACKFILL_SCHEMA)
+        .write.format("delta")
+        .mode("append")
+        .save(state_path(base_path, "backfill_progress"))
+    )
+
+
+def completed_backfill_slices(
+    spark: "SparkSession", base_path: str, backfill_id: str
+) -> Set[Tuple[_dt.date, _dt.date]]:
+    """Return ``(slice_start, slice_end)`` of every slice of ``backfill_id`` that succeeded."""
+    from pyspark.sql import functions as F
+
+    path = state_path(base_path, "backfill_progress")
+    if not is_delta_table(spark, path):
+        return set()
+
+    rows = (
+        spark.read.format("delta")
+        .load(path)
+        .filter((F.col("backfill_id") == backfill_id) & (F.col("status") == "SUCCEEDED"))
+        .select("slice_start", "slice_end")
+        .distinct()
+        .collect()
+    )
+    return {(row["slice_start"], row["slice_end"]) for row in rows}
+
+
+# Operations that rewrite or annotate a table without changing its rows.
+NON_DATA_CHANGING_OPERATIONS = frozenset(
+    {"OPTIMIZE", "VACUUM START", "VACUUM END", "SET TBLPROPERTIES", "UPGRADE PROTOCOL"}
+)
+
+STAGE_MARKER_SCHEMA = (
+    "stage STRING, run_id STRING, table_path STRING, table_version BIGINT, "
+    "completed_at TIMESTAMP"
+)
+
+
+def write_stage_marker(
+    spark: "SparkSession",
+    base_path: str,
+    stage: str,
+    run_id: str,
+    table_path: str,
+    table_version: int,
+) -> None:
+    """Record that ``stage`` committed ``table_version`` of ``table_path`` for ``run_id``."""
+    row = (stage, run_id, table_path, table_version, _dt.datetime.utcnow())
+    (
+        spark.createDataFrame([row], schema=STAGE_MARKER_SCHEMA)
+        .write.format("delta")
+        .mode("append")
+        .save(state_path(base_path, "stage_markers"))
+    )
+
+
+def read_stage_markers(
+    spark: "SparkSession", base_path: str, run_id: str
+) -> Dict[str, Dict[str, object]]:
+    """Return the latest completion marker per stage for ``run_id``."""
+    from pyspark.sql import functions as F
+
+    path = state_path(base_path, "stage_markers")
+    if not is_delta_table(spark, path):
+        return {}
+
+    rows = (
+        spark.read.format("delta")
+        .load(path)
+        .filter(F.col("run_id") == run_id)
+        .orderBy("completed_at")
+        .collect()
+    )
+    # Later rows overwrite earlier ones, leaving the newest marker per stage.
+    return {row["stage"]: row.asDict() for row in rows}
+
+
+def operations_since(spark: "SparkSession", table_path: str, version: int) -> List[str]:
+    """Return the operations of the commits after ``version``, oldest first."""
+    from pyspark.sql import functions as F
+
+    rows = (
+        spark.sql(f"DESCRIBE HISTORY delta.`{table_path}`")
+        .filter(F.col("version") > version)
+        .orderBy("version")
+        .select("operation")
+        .collect()
+    )
+    return [row["operation"] for row in rows]
+
+
+def stage_is_complete(
+    marker: Optional[Dict[str, object]],
+    current_version: Optional[int],
+    later_operations: Sequence[str] = (),
+) -> bool:
+    """Return True if the table still holds exactly the data ``marker``'s stage wrote.
+
+    That is the case when the table is at the marker's version, or when every
+    commit since then (``later_operations``, see ``operations_since``) is one of
+    ``NON_DATA_CHANGING_OPERATIONS``. A table that was recreated, restored or
+    written again since the stage ran, or whose history no longer covers the
+    later commits, needs the stage to run again.
+    """
+    if marker is None or current_version is None:
+        return False
+    marker_version = int(marker["table_version"])
+    if current_version < marker_version:
+        return False
+    return len(later_operations) == current_version - marker_version and all(
+        operation in NON_DATA_CHANGING_OPERATIONS for operation in later_operations
+    )
@@ -0,0 +1,233 @@
+"""Structured Streaming variant of landing -> bronze -> silver.
+
+Two ``availableNow`` queries process whatever arrived since the last run and
+then stop, so a scheduled job costs in proportion to new data:
+
+1. JSON files in the landing directory are typed (``event_ts`` parsed from
+   ``ts``) and appended to bronze (file source); rows whose ``ts`` does not
+   parse go to the bronze quarantine table.
+2. New bronze rows (Delta source) are deduplicated on ``id`` within a watermark
+   on ``ingested_at``, cleansed and MERGEd into silver per micro-batch.
+
+The watermark bounds the dedup state; the insert-only MERGE still rejects ids
+that reappear after the watermark has passed them. Both queries keep their
+progress in ``{base_path}/_checkpoints``. Requires Spark 3.5+ for
+``dropDuplicatesWithinWatermark``.
+
+The bronze stream only follows appends: commits that rewrite bronze, such as
+the overwrite of a batch ``ingest_bronze`` run, are skipped
+(``skipChangeCommits``) instead of failing the query, and their rows never reach
+silver through the stream. Rebuild silver with ``transform_silver`` after
+writing bronze in batch.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from workload.metrics import MetricsSink
+from workload.pipeline import (
+    DEFAULT_BASE_PATH,
+    DEFAULT_LAYOUTS,
+    DEFAULT_RULES,
+    TableLayout,
+    _append_rows,
+    _clean_bronze,
+    commit_row_count_metrics,
+    merge_into_silver,
+    parse_event_time,
+    split_malformed,
+    write_quarantine,
+)
+from workload.quality import build_metric_record
+from workload.rules import Rule, evaluate_rules
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame, SparkSession
+
+
+# Schema of the raw JSON events dropped into the landing directory.
+RAW_EVENT_SCHEMA = "id INT, user_id STRING, event_type STRING, amount DOUBLE, ts STRING"
+
+DEFAULT_WATERMARK_DELAY = "1 hour"
+
+
+def landing_path(base_path: str) -> str:
+    """Return the default landing directory for raw JSON event files."""
+    return f"{base_path}/landing"
+
+
+def checkpoint_path(base_path: str, query: str) -> str:
+    """Return the checkpoint location of a streaming query."""
+    return f"{base_path}/_checkpoints/{query}"
+
+
+def deduplicate_stream(
+    stream_df: "DataFrame", watermark_delay: str = DEFAULT_WATERMARK_DELAY
+) -> "DataFrame":
+    """Drop repeated ``id`` values seen within ``watermark_delay`` of ``ingested_at``."""
+    return (
+        stream_df.withWatermark("ingested_at", watermark_delay)
+        .dropDuplicatesWithinWatermark(["id"])
+    )
+
+
+def stream_landing_to_bronze(
+    spark: "SparkSession",
+    base_path: str,
+    run_id: str,
+    source_path: Optional[str] = None,
+    max_files_per_trigger: Optional[int] = None,
+    sink: MetricsSink | None = None,
+) -> int:
+    """Append new landing files to bronze; return the number of rows written to bronze.
+
+    Each micro-batch appends its typed rows to bronze and its malformed rows to
+    the quarantine table. Both appends carry the batch id as a Delta
+    transaction version, so a batch replayed after a failure is not written (or
+    counted) twice. Quarantined rows are not part of the returned count.
+    """
+    from pyspark.sql import functions as F
+
+    bronze_path = f"{base_path}/bronze"
+    txn_app_id = checkpoint_path(base_path, "bronze")
+    metrics: List[Dict[str, object]] = []
+    # Counted per batch from the bronze commits, like the batch path's rows_written.
+    written_rows = [0]
+
+    def append_batch(batch_df: "DataFrame", batch_id: int) -> None:
+        parsed_df = batch_df.persist()
+        try:
+            bronze_df, malformed_df = split_malformed(parsed_df)
+            written_rows[0] += _append_rows(
+                spark, bronze_df, bronze_path, txn=(txn_app_id, batch_id)
+            )
+            quarantined = write_quarantine(
+                spark, malformed_df, base_path, run_id, txn=(txn_app_id, batch_id)
+            )
+            quarantined["details"]["batch_id"] = batch_id
+            metrics.append(quarantined)
+        finally:
+            parsed_df.unpersist()
+
+    reader = spark.readStream.format("json").schema(RAW_EVENT_SCHEMA)
+    if max_files_per_trigger:
+        reader = reader.option("maxFilesPerTrigger", max_files_per_trigger)
+    query = (
+        parse_event_time(reader.load(source_path or landing_path(base_path)))
+        .withColumn("ingested_at", F.current_timestamp())
+        .withColumn("run_id", F.lit(run_id))
+        .writeStream.foreachBatch(append_batch)
+        .option("checkpointLocation", checkpoint_path(base_path, "bronze"))
+        .trigger(availableNow=True)
+        .start()
+    )
+    try:
+        query.awaitTermination()
+    finally:
+        if sink is not None:
+            sink.add(metrics)
+    return written_rows[0]
+
+
+def stream_bronze_to_silver(
+    spark: "SparkSession",
+    base_path: str,
+    run_id: str,
+    watermark_delay: str = DEFAULT_WATERMARK_DELAY,
+    layout: TableLayout | None = None,
+    rules: Sequence[Rule] | None = None,
+    sink: MetricsSink | None = None,
+) -> int:
+    """MERGE new, deduplicated bronze rows into silver; return bronze rows read.
+
+    Rows are counted after the stream's ``id`` deduplication.
+    """
+    from workload.state import is_delta_table
+
+    bronze_path = f"{base_path}/bronze"
+    if not is_delta_table(spark, bronze_path):
+        return 0
+
+    silver_path = f"{base_path}/silver"
+    layout = layout or DEFAULT_LAYOUTS["silver"]
+    rules = DEFAULT_RULES["silver"] if rules is None else rules
+    metrics: List[Dict[str, object]] = []
+    input_rows = [0]
+
+    def merge_batch(batch_df: "DataFrame", batch_id: int) -> None:
+        batch_df = batch_df.persist()
+        clean_df = _clean_bronze(batch_df).persist()
+        try:
+            input_rows[0] += batch_df.count()
+            merge_into_silver(spark, clean_df, silver_path, layout)
+            for record in commit_row_count_metrics(spark, silver_path, run_id, "silver"):
+                record["details"]["batch_id"] = batch_id
+                metrics.append(record)
+            metrics.extend(
+                evaluate_rules(clean_df, rules, run_id, "silver", include_row_count=False)
+            )
+        finally:
+            clean_df.unpersist()
+            batch_df.unpersist()
+
+    # Overwrites of bronze (batch ingest) would fail the stream; follow appends only.
+    bronze_stream = (
+        spark.readStream.format("delta").option("skipChangeCommits", "true").load(bronze_path)
+    )
+    query = (
+        deduplicate_stream(bronze_stream, watermark_delay)
+        .writeStream.foreachBatch(merge_batch)
+        .option("checkpointLocation", checkpoint_path(base_path, "silver"))
+        .trigger(availableNow=True)
+        .start()
+    )
+    try:
+        query.awaitTermination()
+    finally:
+        # Keep the records of micro-batches that committed before a failure.
+        if sink is not None:
+            sink.add(metrics)
+    return input_rows[0]
+
+
+def run_streaming(
+    spark: "SparkSession",
+    base_path: str = DEFAULT_BASE_PATH,
+    run_id: str | None = None,
+    source_path: Optional[str] = None,
+    watermark_delay: str = DEFAULT_WATERMARK_DELAY,
+    max_files_per_trigger: Optional[int] = None,
+) -> Dict[str, object]:
+    """Run landing -> bronze -> silver once over all new data and record metrics.
+
+    Bronze rows carry ``run_id``, so ``aggregate_gold(..., mode="incremental")``
+    can follow with the same id to refresh only the touched dates.
+    """
+    actual_run_id = run_id or _dt.datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    sink = MetricsSink(spark, base_path)
+    try:
+        bronze_rows = stream_landing_to_bronze(
+            spark, base_path, actual_run_id, source_path, max_files_per_trigger, sink
+        )
+        sink.add(
+            [
+                build_metric_record(
+                    actual_run_id, "bronze", "rows_written", "OK", bronze_rows, {"source": "stream"}
+                )
+            ]
+        )
+        silver_input_rows = stream_bronze_to_silver(
+            spark, base_path, actual_run_id, watermark_delay, sink=sink
+        )
+    finally:
+        sink.flush()
+
+    return {
+        "run_id": actual_run_id,
+        "bronze_rows": bronze_rows,
+        "silver_input_rows": silver_input_rows,
+        "bronze_path": f"{base_path}/bronze",
+        "silver_path": f"{base_path}/silver",
+    }
@@ -0,0 +1,149 @@
+"""Distributed synthetic event generator for load-testing the pipeline.
+
+Rows are derived from ``spark.range`` with column expressions only, so data is
+generated on the executors and scales to billions of rows. Every random draw is
+a hash of ``(id, seed, stream)``, making output independent of partitioning and
+reproducible for a given seed.
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from pyspark.sql import Column, DataFrame, SparkSession
+
+# Bronze stores ``id`` as IntegerType.
+MAX_ROWS = 2**31 - 1
+
+_UNIFORM_RESOLUTION = 1 << 30
+
+
+@dataclass
+class SyntheticConfig:
+    """Shape of the generated event data.
+
+    - ``users``: distinct ``user_id`` cardinality
+    - ``event_mix``: relative weight per ``event_type`` (normalized)
+    - ``key_skew``: 0 spreads events evenly over users; larger values concentrate
+      them on low-numbered users (user index ~ users * u ** (1 + key_skew))
+    - ``duplicate_rate``: fraction of rows reusing the ``id`` of an earlier row
+    - ``null_rate``: fraction of rows with a null ``amount``
+    - ``days``: event timestamps are spread over the ``days`` ending at ``end_date``
+    """
+
+    rows: int
+    users: int = 10_000
+    event_mix: Dict[str, float] = field(
+        default_factory=lambda: {"purchase": 0.8, "refund": 0.2}
+    )
+    key_skew: float = 0.0
+    duplicate_rate: float = 0.0
+    null_rate: float = 0.0
+    days: int = 30
+    end_date: _dt.date = _dt.date(2024, 10, 31)
+    seed: int = 42
+    partitions: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if not 0 < self.rows <= MAX_ROWS:
+            raise ValueError(f"rows must be between 1 and {MAX_ROWS}")
+        if self.users <= 0 or self.days <= 0:
+            raise ValueError("users and days must be positive")
+        if not self.event_mix or any(w <= 0 for w in self.event_mix.values()):
+            raise ValueError("event_mix needs at least one event type with positive weight")
+        if self.key_skew < 0:
+            raise ValueError("key_skew must be >= 0")
+        for name in ("duplicate_rate", "null_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+
+
+def parse_event_mix(value: str) -> Dict[str, float]:
+    """Parse ``"purchase:0.8,refund:0.2"`` into a weight mapping."""
+    mix: Dict[str, float] = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition(":")
+        mix[name.strip()] = float(weight) if weight.strip() else 1.0
+    return mix
+
+
+def _uniform(seed: int, stream: int) -> "Column":
+    """Deterministic uniform [0, 1) draw per row for an independent ``stream``."""
+    from pyspark.sql import functions as F
+
+    hashed = F.xxhash64(F.col("id"), F.lit(seed), F.lit(stream))
+    return F.pmod(hashed, F.lit(_UNIFORM_RESOLUTION)) / float(_UNIFORM_RESOLUTION)
+
+
+def _utc_timestamp_string(epoch: "Column") -> "Column":
+    """Render epoch seconds as ``yyyy-MM-ddTHH:mm:ssZ`` in UTC.
+
+    Built from integer arithmetic because ``date_format`` renders in the session
+    time zone, which would shift the wall clock behind the literal ``Z``.
+    """
+    from pyspark.sql import functions as F
+
+    day = F.date_add(F.lit(_dt.date(1970, 1, 1)), F.floor(epoch / 86_400).cast("int"))
+    seconds = F.pmod(epoch, F.lit(86_400))
+    return F.format_string(
+        "%sT%02d:%02d:%02dZ",
+        day.cast("string"),
+        F.floor(seconds / 3600).cast("int"),
+        F.floor((seconds % 3600) / 60).cast("int"),
+        (seconds % 60).cast("int"),
+    )
+
+
+def generate_events(spark: "SparkSession", config: SyntheticConfig) -> "DataFrame":
+    """Return synthetic events with the bronze input columns.
+
+    Columns: ``id`` (int), ``user_id``, ``event_type``, ``amount`` (refunds are
+    negative), ``ts`` (ISO-8601 string), matching the sample rows in
+    ``ingest_bronze``.
+    """
+    from pyspark.sql import functions as F
+
+    partitions = config.partitions or spark.sparkContext.defaultParallelism
+    seed = config.seed
+
+    total_weight = sum(config.event_mix.values())
+    event_type = None
+    cumulative = 0.0
+    names = list(config.event_mix)
+    for name in names[:-1]:
+        cumulative += config.event_mix[name] / total_weight
+        condition = _uniform(seed, 1) < cumulative
+        event_type = (
+            F.when(condition, F.lit(name))
+            if event_type is None
+            else event_type.when(condition, F.lit(name))
+        )
+    last = F.lit(names[-1])
+    event_type = last if event_type is None else event_type.otherwise(last)
+
+    user_index = F.floor(F.pow(_uniform(seed, 2), 1.0 + config.key_skew) * config.users)
+    row_id = F.when(
+        _uniform(seed, 3) < config.duplicate_rate, F.floor(_uniform(seed, 4) * F.col("id"))
+    ).otherwise(F.col("id"))
+    magnitude = F.round(_uniform(seed, 5) * 100.0 + 1.0, 2)
+    amount = F.when(_uniform(seed, 6) < config.null_rate, F.lit(None)).otherwise(
+        F.when(event_type == "refund", -magnitude).otherwise(magnitude)
+    )
+    end_epoch = int(
+        _dt.datetime.combine(config.end_date, _dt.time(), tzinfo=_dt.timezone.utc).timestamp()
+    )
+    epoch = F.lit(end_epoch) - F.floor(_uniform(seed, 7) * (config.days * 86_400))
+
+    # A single projection over spark.range: every expression reads the range id.
+    return spark.range(0, config.rows, 1, partitions).select(
+        row_id.cast("int").alias("id"),
+        F.concat(F.lit("u"), user_index.cast("long").cast("string")).alias("user_id"),
+        event_type.alias("event_type"),
+        amount.cast("double").alias("amount"),
+        _utc_timestamp_string(epoch.cast("long")).alias("ts"),
+    )